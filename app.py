@@ -4,38 +4,52 @@
 # Компилятор exe
 # pyinstaller -F -w -i "C:/Users/demge/PycharmProjects/ProductPercentageApplication/assets/icons/franz.ico" app.py
 
-import time
 import getpass
+import multiprocessing
 import os
+import sqlite3
 import sys
 import logging
 
-import pandas as pd
-
-from threading import Thread
+from typing import Optional, TYPE_CHECKING
 
 from dotenv import load_dotenv
 
 from PyQt6 import QtWidgets
-from PyQt6.QtCore import QMetaObject, Qt, Q_ARG
-from PyQt6.QtWidgets import QMessageBox
+from PyQt6.QtCore import QModelIndex, Qt, QThread, QTimer, pyqtSlot
+from PyQt6.QtGui import QKeySequence, QShortcut
+from PyQt6.QtWidgets import QInputDialog, QMessageBox
 
 from ui import ProductPercentageApplicationDesign
 
-from tools.configControl import loadParserConfig, loadAppConfig, saveParserConfig
+from tools.configControl import (loadParserConfig, loadAppConfig, saveParserConfig, saveAppConfig,
+                                 trackParserConfigChanges)
 
 from tools.constants import AppConstants
 from tools.dataConvert import tableFromDataframe
 
 from tools.appControl import changePage, updateTableLabels
 from tools.resetsTools import resetParseConfig, resetStandardSavePath
+from tools.searchControl import applyResultsFilter, resetResultsFilter, updateResultsFilters
 from tools.tableControl import addTableRow, removeTableRow
-
-from tools.exportControl import exportListExcelFile, exportErrorArticlesExcelFile, exportResultExcelFile
+from tools.listControl import addListRow, removeListRows, pasteListRows, searchList
+from tools.listModel import PairListModel
+from tools.listStorage import ListStorage
+from tools.logControl import setupLogging, rotateLogFile, stopLogging
+
+from tools.exportControl import (exportListExcelFile, exportErrorArticlesExcelFile, exportResultExcelFile,
+                                 exportRunDiffExcelFile)
+from tools.exportWorker import (cancelExportJobs, cancellableExportJobs, startExportJob, updateExportProgress,
+                                waitExportJobs)
 from tools.importControl import importListExcelFile, importSearchExcelFileToArray, loadSearchExcelFilePath
 
-from tools.APIRequst import safeAPIRequest
-from tools.resultControl import generateColumns, validateResult, createResultsRow
+from tools.parseWorker import ParseWorker, formatDuration
+from tools.priceHistory import PriceHistory
+from tools.runHistory import RunHistory, loadRun, runMeta, runReportFromMeta, runTitle, saveRun
+from tools.runReport import formatRunSummary, runReportRows
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class App(QtWidgets.QMainWindow, ProductPercentageApplicationDesign.Ui_MainWindow):
@@ -54,29 +68,51 @@ class App(QtWidgets.QMainWindow, ProductPercentageApplicationDesign.Ui_MainWindo
         self.search_file_path_Excel = ''
         self.search_file_data = []
         self.result_data = None
+        self.error_data = None
+        self.run_report = None
+        self.current_run_path = None
+        self.price_history = None
+        self.parse_thread = None
+        self.parse_worker = None
+        self.export_jobs = []
 
         self.standardSavePathInput.setPlaceholderText(self.base_save_path)
 
+        """Настройка логирования (уровень применяется из конфига приложения)"""
+        self.log_dir = f'logs/{self.username}'
+        self.log_file = os.path.join(self.log_dir, 'logs.log')
+
+        setupLogging(self.log_file)
+
+        """История запусков"""
+        self.run_history = RunHistory(self.username)
+        self.runHistoryComboBox.view().setMinimumWidth(AppConstants.RUN_HISTORY_POPUP_WIDTH)
+        self.runHistoryComboBox.setEnabled(False)
+        QTimer.singleShot(0, self.refreshRunHistory)
+
+        """Модели черного/белого списков"""
+        self.blackListModel = PairListModel(self)
+        self.whiteListModel = PairListModel(self)
+        self.blackListTable.setModel(self.blackListModel)
+        self.whiteListTable.setModel(self.whiteListModel)
+
         """Загрузка конфигов"""
+        self.list_storage = ListStorage(self.username)
+        self.loaded_list_sections = set()
+        self.parser_config_dirty = set()
+        self.parser_config_save_timer = QTimer(self)
+        self.parser_config_save_timer.setSingleShot(True)
+        self.parser_config_save_timer.setInterval(AppConstants.CONFIG_SAVE_DELAY)
+        self.parser_config_save_timer.timeout.connect(lambda: saveParserConfig(self))
+
         self.parser_config = loadParserConfig(self)
         self.app_config = loadAppConfig(self)
 
+        trackParserConfigChanges(self)
+
         updateTableLabels(self, 2)
         updateTableLabels(self, 3)
 
-        """Настройка логирования"""
-        self.log_dir = f'logs/{self.username}'
-        self.log_file = os.path.join(self.log_dir, 'logs.log')
-
-        os.makedirs(self.log_dir, exist_ok=True)
-
-        with open(self.log_file, 'w', encoding='UTF-8') as log_file:
-            log_file.write('')
-
-        logging.basicConfig(level=logging.DEBUG, filename=self.log_file,
-                            format='%(levelname)s (%(asctime)s): %(message)s (Line: %(lineno)d) [%(filename)s]',
-                            datefmt='%d/%m/%Y %I:%M:%S', encoding='UTF-8', filemode='a')
-
         """Настройка кнопок перехода на страницы в боковом меню"""
         self.parserPageButton.clicked.connect(lambda: changePage(self, 0))
         self.brandsPageButton.clicked.connect(lambda: changePage(self, 1))
@@ -95,24 +131,86 @@ class App(QtWidgets.QMainWindow, ProductPercentageApplicationDesign.Ui_MainWindo
         self.deleteTableRowButton.clicked.connect(lambda: removeTableRow(self, self.brandsTable))
 
         """Настройка кнопок на странице Черный список"""
-        self.addBlackListTableRowButton.clicked.connect(lambda: addTableRow(self.blackListTable))
-        self.deleteBlackListTableRowButton.clicked.connect(lambda: removeTableRow(self, self.blackListTable))
+        self.addBlackListTableRowButton.clicked.connect(lambda: addListRow(self.blackListTable))
+        self.deleteBlackListTableRowButton.clicked.connect(lambda: removeListRows(self, self.blackListTable))
         self.importBlackListButton.clicked.connect(lambda: importListExcelFile(self, self.blackListTable))
         self.exportBlackListButton.clicked.connect(lambda: exportListExcelFile(self, self.blackListTable, 'black'))
+        self.blackListSearchInput.textChanged.connect(lambda text: searchList(self.blackListTable, text))
+        self.blackListPasteShortcut = QShortcut(QKeySequence.StandardKey.Paste, self.blackListTable)
+        self.blackListPasteShortcut.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+        self.blackListPasteShortcut.activated.connect(lambda: pasteListRows(self, self.blackListTable))
 
         """Настройка кнопок на странице Белый список"""
-        self.addWhiteListTableRowButton.clicked.connect(lambda: addTableRow(self.whiteListTable))
-        self.deleteWhiteListTableRowButton.clicked.connect(lambda: removeTableRow(self, self.whiteListTable))
+        self.addWhiteListTableRowButton.clicked.connect(lambda: addListRow(self.whiteListTable))
+        self.deleteWhiteListTableRowButton.clicked.connect(lambda: removeListRows(self, self.whiteListTable))
         self.importWhiteListButton.clicked.connect(lambda: importListExcelFile(self, self.whiteListTable))
         self.exportWhiteListButton.clicked.connect(lambda: exportListExcelFile(self, self.whiteListTable, 'white'))
+        self.whiteListSearchInput.textChanged.connect(lambda text: searchList(self.whiteListTable, text))
+        self.whiteListPasteShortcut = QShortcut(QKeySequence.StandardKey.Paste, self.whiteListTable)
+        self.whiteListPasteShortcut.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+        self.whiteListPasteShortcut.activated.connect(lambda: pasteListRows(self, self.whiteListTable))
+
+        """Сообщения моделей списков"""
+        self.blackListModel.duplicateRejected.connect(
+            lambda brand, store: self.statusLabel.setText(f'Пара {brand} - {store} уже есть в черном списке')
+        )
+        self.whiteListModel.duplicateRejected.connect(
+            lambda brand, store: self.statusLabel.setText(f'Пара {brand} - {store} уже есть в белом списке')
+        )
 
         """Настройка кнопок на страницу Результаты"""
         self.exportResultsButton.clicked.connect(lambda: exportResultExcelFile(self, 'standard'))
         self.exportResultsAsButton.clicked.connect(lambda: exportResultExcelFile(self, 'as'))
+        self.exportErrorsButton.clicked.connect(lambda: exportErrorArticlesExcelFile(self, self.error_data))
+        self.retryErrorsButton.clicked.connect(self.retryErrors)
+        self.runHistoryComboBox.activated.connect(self.openHistoryRun)
+        self.compareRunsButton.clicked.connect(self.compareWithRun)
+        self.cancelExportButton.clicked.connect(lambda: cancelExportJobs(self))
+        updateExportProgress(self)
+        self.resultsSearchInput.textChanged.connect(lambda: applyResultsFilter(self))
+        self.brandFilterComboBox.currentIndexChanged.connect(lambda: applyResultsFilter(self))
+        self.storeFilterComboBox.currentIndexChanged.connect(lambda: applyResultsFilter(self))
+        self.priceFromSpinBox.valueChanged.connect(lambda: applyResultsFilter(self))
+        self.priceToSpinBox.valueChanged.connect(lambda: applyResultsFilter(self))
+        self.deliveryDaysFilterSpinBox.valueChanged.connect(lambda: applyResultsFilter(self))
+        self.resetResultsFilterButton.clicked.connect(lambda: resetResultsFilter(self))
 
         """Настройка кнопок на странице Настроек"""
         self.clearStandardSavePathButton.clicked.connect(lambda: resetStandardSavePath(self))
 
+    def closeEvent(self, event) -> None:
+        """
+        Сохраняет несохраненные изменения настроек перед закрытием окна.
+
+        Note:
+            - saveParserConfig/saveAppConfig записывают файл только при наличии изменений
+            - Если идет фоновый экспорт, запрашивает подтверждение; при закрытии экспорт
+              отменяется и недописанные файлы удаляются
+            - Запись истории запусков не отменяется: закрытие дожидается ее завершения
+        """
+        if cancellableExportJobs(self):
+            reply = QMessageBox.question(
+                self,
+                'Идет экспорт',
+                'Экспорт еще не завершен. Прервать экспорт и закрыть приложение?',
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No
+            )
+            if reply == QMessageBox.StandardButton.No:
+                event.ignore()
+                return
+
+        waitExportJobs(self, cancel=True)
+
+        saveParserConfig(self)
+        saveAppConfig(self)
+        self.list_storage.close()
+        if self.price_history is not None:
+            self.price_history.close()
+        stopLogging()
+
+        super().closeEvent(event)
+
     def prepare(self) -> None:
         """
         Подготавливает систему к началу парсинга: выполняет предварительные проверки,
@@ -126,15 +224,14 @@ class App(QtWidgets.QMainWindow, ProductPercentageApplicationDesign.Ui_MainWindo
         Note:
             - Сбрасывает прогресс-бар (self.progressBar)
             - Блокирует кнопки (self.resultPageButton, self.startButton)
-            - Очищает файл логов (logs.log)
+            - Начинает новый файл логов (предыдущий сохраняется как logs.log.1, см. rotateLogFile)
             - Сохраняет конфигурацию (saveParserConfig)
-            - Запускает парсинг в потоке (self.startParsing)
+            - Запускает парсинг в потоке воркера (self.startParsing)
         """
         self.progressBar.setValue(0)
         self.resultPageButton.setEnabled(False)
 
-        with open(self.log_file, 'w', encoding='UTF-8') as log_file:
-            log_file.write('')
+        rotateLogFile()
 
         if not self.api_keys:
             QMessageBox.critical(self, 'Ошибка запуска', 'Необходимо указать ключи API для работы парсера')
@@ -163,187 +260,399 @@ class App(QtWidgets.QMainWindow, ProductPercentageApplicationDesign.Ui_MainWindo
         self.startButton.setEnabled(False)
 
         try:
-            thread = Thread(target=self.run, daemon=True)
-            thread.start()
+            self.startParsing()
         except Exception as ex:
             QMessageBox.critical(self, 'Ошибка', f'Не удалось запустить поток парсинга: {str(ex)}')
             self.startButton.setEnabled(True)
 
-    def run(self) -> None:
+    def retryErrors(self) -> None:
         """
-        Основной метод парсинга, выполняемый в отдельном потоке.
-        Обрабатывает данные из self.search_file_data, выполняет API-запросы,
-        сохраняет результаты в self.result_data и обновляет интерфейс.
+        Повторяет парсинг только ошибочных артикулов последнего запуска.
 
         Note:
-            1. Создает DataFrame для результатов (df_success) и ошибок (df_errors)
-            2. Для каждого элемента в search_file_data:
-               - Нормализует артикул и бренд
-               - Обновляет статус в интерфейсе
-               - Формирует и отправляет API-запрос
-               - Обрабатывает ответ (success/error)
-               - Сохраняет результаты
-               - Выдерживает паузу между запросами
-            3. По завершении обновляет интерфейс и сохраняет результаты
+            - Количество попыток по каждому артикулу передается воркеру (см. ParseWorker),
+              в новой выгрузке ошибок оно увеличивается
+            - Результаты повторного запуска добавляются к текущим (см. onParseFinished)
         """
+        if self.error_data is None or self.error_data.empty:
+            return
+
+        if not self.api_keys:
+            QMessageBox.critical(self, 'Ошибка запуска', 'Необходимо указать ключи API для работы парсера')
+            return
+
+        brand_column, article_column, *_, attempts_column = AppConstants.COLUMNS['ERRORS']
+        search_data = self.error_data[[brand_column, article_column]].values.tolist()
+        attempts = dict(zip(
+            zip(self.error_data[brand_column], self.error_data[article_column]),
+            self.error_data[attempts_column]
+        ))
+
+        self.progressBar.setValue(0)
+        self.statusLabel.setText(f'Повтор ошибочных артикулов: {len(search_data)}')
+        self.resultPageButton.setEnabled(False)
+        self.clearParseSettingsButton.setEnabled(False)
+        self.startButton.setEnabled(False)
+
         try:
-            df_errors = pd.DataFrame(columns=AppConstants.COLUMNS['SEARCH'])
-            df_success = pd.DataFrame(columns=generateColumns(10))
-            total_items = len(self.search_file_data)
-
-            QMetaObject.invokeMethod(
-                self.progressBar,
-                'setValue',
-                Qt.ConnectionType.QueuedConnection,
-                Q_ARG(int, 1)
-            )
+            self.startParsing(search_data, attempts)
+        except Exception as ex:
+            QMessageBox.critical(self, 'Ошибка', f'Не удалось запустить поток парсинга: {str(ex)}')
+            self.startButton.setEnabled(True)
+            self.resultPageButton.setEnabled(True)
+            self.clearParseSettingsButton.setEnabled(True)
+            self.updateErrorButtons()
 
-            for i, (brand, article) in enumerate((item[0], str(item[1]).replace('#', '')) for item
-                                                 in self.search_file_data):
-                try:
-                    normalized_brand = self.parser_config['brandsList'].get(brand, brand)
-
-                    QMetaObject.invokeMethod(
-                        self.statusLabel,
-                        'setText',
-                        Qt.ConnectionType.QueuedConnection,
-                        Q_ARG(str, f'Артикул {article} обрабатывается ({i + 1} из {total_items})')
-                    )
-
-                    progress_value = min(99, round((i + 1) / total_items * 100 + 1))
-                    QMetaObject.invokeMethod(
-                        self.progressBar,
-                        'setValue',
-                        Qt.ConnectionType.QueuedConnection,
-                        Q_ARG(int, progress_value)
-                    )
-
-                    params = {
-                        'api_key': self.api_keys[i % len(self.api_keys)],
-                        'code_region': self.parser_config['regionCode'],
-                        'partnumber': article,
-                        'class_man': normalized_brand,
-                        "type_request": 5,
-                        'login': '',
-                        'password': '',
-                        'search_text': article,
-                        'row_count': 500
-                    }
-
-                    response_data = safeAPIRequest(self, params)
-
-                    if not response_data:
-                        df_errors.loc[len(df_errors)] = [normalized_brand, article]
-
-                        time.sleep(self.app_config['timeDelay'])
-                        continue
-
-                    result_row = [
-                        normalized_brand,
-                        article,
-                        response_data['price_min_instock'],
-                        response_data['price_avg_instock'],
-                        response_data['price_max_instock'],
-                        response_data['price_min_order'],
-                        response_data['price_avg_order'],
-                        response_data['price_max_order'],
-                    ]
-                    validated_data = validateResult(self, response_data.get('table', []))
-
-                    if not validated_data:
-                        result_row.extend(['Данные отсутствуют'])
-                        result_row += [''] * (len(df_success.columns) - len(result_row))
-                        df_success.loc[len(df_success)] = result_row
-
-                        time.sleep(self.app_config['timeDelay'])
-                        continue
-
-                    result_data = validated_data[:10] if len(validated_data) > 10 else validated_data
-                    result_row = createResultsRow(result_row, result_data)
-
-                    if len(validated_data) < 10:
-                        result_row.extend(['Больше данных нет'])
-                        result_row += [''] * (len(df_success.columns) - len(result_row))
-
-                    df_success.loc[len(df_success)] = result_row
-
-                    time.sleep(self.app_config['timeDelay'])
-
-                except Exception as ex:
-                    logging.error(f'Ошибка обработки артикула {article}: {str(ex)}')
-
-                    time.sleep(self.app_config['timeDelay'])
-                    continue
+    def startParsing(self, search_data: Optional[list[list[str]]] = None,
+                     attempts: Optional[dict[tuple[str, str], int]] = None) -> None:
+        """
+        Создает воркер парсинга, переносит его в отдельный QThread и подключает сигналы.
 
-            QMetaObject.invokeMethod(
-                self.statusLabel,
-                'setText',
-                Qt.ConnectionType.QueuedConnection,
-                Q_ARG(str, 'Все артикулы обработаны')
-            )
-            QMetaObject.invokeMethod(
-                self.progressBar,
-                'setValue',
-                Qt.ConnectionType.QueuedConnection,
-                Q_ARG(int, 100)
-            )
-            QMetaObject.invokeMethod(
-                self.resultPageButton,
-                'setEnabled',
-                Qt.ConnectionType.QueuedConnection,
-                Q_ARG(bool, True)
-            )
-            QMetaObject.invokeMethod(
-                self.startButton,
-                'setEnabled',
-                Qt.ConnectionType.QueuedConnection,
-                Q_ARG(bool, True)
-            )
-            QMetaObject.invokeMethod(
-                self.clearParseSettingsButton,
-                'setEnabled',
-                Qt.ConnectionType.QueuedConnection,
-                Q_ARG(bool, True)
+        Args:
+            search_data (Optional[list[list[str]]]): Пары [бренд, артикул] (по умолчанию -
+                данные выбранного файла, self.search_file_data)
+            attempts (Optional[dict[tuple[str, str], int]]): Попытки по артикулам
+                для повторного запуска ошибочных артикулов (см. retryErrors)
+
+        Note:
+            - Все сигналы воркера обрабатываются в GUI-потоке (QueuedConnection)
+            - Поток и воркер удаляются после завершения работы (deleteLater)
+        """
+        self.retryErrorsButton.setEnabled(False)
+
+        self.parse_thread = QThread(self)
+        self.parse_worker = ParseWorker(
+            self, self.search_file_data if search_data is None else search_data, attempts
+        )
+        self.parse_worker.moveToThread(self.parse_thread)
+
+        self.parse_thread.started.connect(self.parse_worker.run)
+        self.parse_worker.progressChanged.connect(self.onParseProgress)
+        self.parse_worker.finished.connect(self.onParseFinished)
+        self.parse_worker.failed.connect(self.onParseFailed)
+
+        self.parse_worker.finished.connect(self.parse_thread.quit)
+        self.parse_worker.failed.connect(self.parse_thread.quit)
+        self.parse_thread.finished.connect(self.parse_worker.deleteLater)
+        self.parse_thread.finished.connect(self.parse_thread.deleteLater)
+
+        self.parse_thread.start()
+
+    @pyqtSlot(int, int, str, float, float)
+    def onParseProgress(self, processed: int, total: int, article: str, rate: float, eta: float) -> None:
+        """
+        Обновляет строку статуса и прогресс-бар по сигналу воркера.
+
+        Args:
+            processed (int): Количество обработанных артикулов
+            total (int): Общее количество артикулов
+            article (str): Текущий артикул (пустая строка после завершения)
+            rate (float): Скорость обработки, артикулов в секунду
+            eta (float): Оценка оставшегося времени в секундах
+        """
+        if processed < total:
+            self.statusLabel.setText(
+                f'Артикул {article} обрабатывается ({processed + 1} из {total}) | '
+                f'{rate:.2f} арт/с | осталось ~{formatDuration(eta)}'
             )
+        self.progressBar.setValue(min(99, round(processed / total * 100 + 1)))
+
+    @pyqtSlot(object, object, object)
+    def onParseFinished(self, df_success: 'pd.DataFrame', df_errors: 'pd.DataFrame', report: dict) -> None:
+        """
+        Завершает парсинг в GUI-потоке: выводит результаты, отчет о запуске и запускает экспорт.
+
+        Экспорт результатов (быстрый экспорт) и ошибочных артикулов выполняются в фоновых
+        потоках одновременно (см. ExportJob), окно остается отзывчивым. Если результаты
+        уже записаны во время парсинга (потоковая запись, report['result_file']),
+        быстрый экспорт результатов не выполняется.
+
+        Ошибочные артикулы хранятся в self.error_data (экспорт и повтор - кнопками на странице
+        результатов), файл ошибок без диалогов сохраняется только при быстром экспорте.
+        Результаты повторного запуска ошибочных артикулов (report['retry']) добавляются
+        к текущим результатам. Запуск сохраняется в историю запусков (см. saveRunHistory).
+
+        Args:
+            df_success (pd.DataFrame): Результаты парсинга
+            df_errors (pd.DataFrame): Ошибочные артикулы (AppConstants.COLUMNS['ERRORS'])
+            report (dict): Отчет о запуске (см. RunStats.report)
+        """
+        self.statusLabel.setText('Все артикулы обработаны')
+        self.progressBar.setValue(100)
+        self.resultPageButton.setEnabled(True)
+        self.startButton.setEnabled(True)
+        self.clearParseSettingsButton.setEnabled(True)
+
+        if report.get('retry') and self.result_data is not None and not self.result_data.empty:
+            import pandas as pd
+
+            if not df_success.empty:
+                df_success = pd.concat([self.result_data, df_success], ignore_index=True)
+            else:
+                df_success = self.result_data
+
+            if self.run_report is not None:
+                report['input_hash'] = self.run_report.get('input_hash')
+
+        self.result_data = df_success
+        self.error_data = df_errors
+        self.run_report = report
+
+        self.showResults()
+        self.stackedWidget.setCurrentIndex(5)
+        self.saveRunHistory()
+
+        if report.get('result_file'):
+            self.statusLabel.setText(f'Результаты записаны в файл: {os.path.basename(report["result_file"])}')
+        elif self.app_config['fastExport'] == 'True':
+            export_job = exportResultExcelFile(self, 'standard', notify=False)
+            if export_job is not None:
+                export_job.finished.connect(lambda export_ms: self.addExportTime(report, export_ms))
+
+        if self.app_config['fastExport'] == 'True':
+            exportErrorArticlesExcelFile(self, df_errors, 'standard', notify=False)
+        elif not df_errors.empty:
+            self.statusLabel.setText(f'Ошибочных артикулов: {len(df_errors)} (см. «Экспорт ошибок»)')
+
+    def showResults(self) -> None:
+        """
+        Выводит текущие результаты (self.result_data), отчет о запуске и состояние кнопок ошибок.
+
+        Note:
+            - Модель таблицы заменяется и при пустых результатах (таблица без строк),
+              чтобы на странице не оставались результаты предыдущего запуска
+            - При выборе строки минимальная цена артикула из истории цен выводится
+              в строке статуса (см. showPriceHistory)
+        """
+        data = self.result_data
+        if data.empty:
+            data = data.reindex(columns=AppConstants.COLUMNS['RESULT'])
+
+        tableFromDataframe(self.resultsTable, data)
+        self.resultsTable.selectionModel().currentRowChanged.connect(self.showPriceHistory)
+        updateResultsFilters(self)
+
+        self.showRunReport()
+        self.updateErrorButtons()
 
-            self.result_data = df_success
-            tableFromDataframe(self.resultsTable, self.result_data)
+    @pyqtSlot(QModelIndex, QModelIndex)
+    def showPriceHistory(self, current: QModelIndex, _: QModelIndex) -> None:
+        """
+        Выводит в строке статуса минимальную цену выбранного артикула из истории цен
+        за AppConstants.PRICE_HISTORY_DAYS дней (все предложения и только в наличии).
+
+        Args:
+            current (QModelIndex): Текущая ячейка resultsTable
+
+        Note:
+            История цен открывается при первом выборе строки (отдельное соединение GUI-потока,
+            см. PriceHistory); запрос читает только индекс и занимает доли миллисекунды
+        """
+        if not current.isValid():
+            return
+
+        model = self.resultsTable.model()
+        brand = str(model.index(current.row(), 0).data())
+        article = str(model.index(current.row(), 1).data())
+        days = AppConstants.PRICE_HISTORY_DAYS
+
+        try:
+            if self.price_history is None:
+                self.price_history = PriceHistory(self.username)
 
-            self.stackedWidget.setCurrentIndex(5)
+            min_price = self.price_history.minPrice(brand, article, days)
+            in_stock_price = self.price_history.minPrice(brand, article, days, in_stock=True)
+        except sqlite3.Error as ex:
+            logging.error(f'Ошибка чтения истории цен: {ex}', exc_info=True)
+            return
+
+        if min_price is None:
+            self.statusLabel.setText(f'{brand} {article}: в истории цен нет предложений за {days} дн.')
+            return
 
-            if self.app_config['fastExport'] == 'True':
-                exportResultExcelFile(self, 'standard')
+        in_stock_text = f', в наличии - {in_stock_price}' if in_stock_price is not None else ''
+        self.statusLabel.setText(f'{brand} {article}: мин. цена за {days} дн. - {min_price}{in_stock_text}')
+
+    def saveRunHistory(self) -> None:
+        """
+        Сохраняет текущий запуск (результаты, ошибочные артикулы, метаданные) в историю запусков.
+
+        Note:
+            - Файл записывается в фоне (ExportJob, без сообщений о завершении), после записи
+              старые запуски удаляются (AppConstants.RUN_HISTORY_COUNT) и список истории обновляется
+              (читаются метаданные только нового файла, см. RunHistory.runs)
+            - Запись не отменяется кнопкой 'Отменить экспорт' и не показывается в прогрессе
+              экспорта (cancellable=False)
+            - Если результаты еще экспортируются, время экспорта в сохраненный отчет не попадает
+        """
+        file_path = self.run_history.newRunPath()
+        self.current_run_path = file_path
+        results, errors, meta = self.result_data, self.error_data, runMeta(self.run_report)
+
+        def onSaved(_: float) -> None:
+            self.run_history.prune()
+            self.refreshRunHistory()
+
+        job = startExportJob(
+            self,
+            'история запусков',
+            file_path,
+            lambda progress: saveRun(file_path, results, errors, meta, progress),
+            'save_run',
+            notify=False,
+            status=False,
+            cancellable=False
+        )
+        job.finished.connect(onSaved)
+
+    def refreshRunHistory(self) -> None:
+        """Заполняет список истории запусков (только метаданные файлов, данные не загружаются)."""
+        runs = self.run_history.runs()
+
+        self.runHistoryComboBox.blockSignals(True)
+        self.runHistoryComboBox.clear()
+        self.runHistoryComboBox.addItem('История запусков', None)
+        for file_path, meta in runs:
+            self.runHistoryComboBox.addItem(runTitle(meta), file_path)
+        self.runHistoryComboBox.blockSignals(False)
+
+        self.runHistoryComboBox.setEnabled(bool(runs))
+        if runs:
+            self.resultPageButton.setEnabled(self.startButton.isEnabled())
+
+    @pyqtSlot(int)
+    def openHistoryRun(self, index: int) -> None:
+        """
+        Открывает сохраненный запуск из истории на странице результатов.
 
-            exportErrorArticlesExcelFile(self, df_errors)
+        Args:
+            index (int): Индекс выбранного запуска в runHistoryComboBox
 
+        Note:
+            Во время парсинга запуск не открывается: результаты текущего парсинга
+            заменили бы открытый запуск.
+        """
+        file_path = self.runHistoryComboBox.itemData(index)
+
+        if not file_path:
+            return
+
+        if not self.startButton.isEnabled():
+            QMessageBox.warning(self, 'Идет парсинг', 'Дождитесь окончания парсинга, чтобы открыть прошлый запуск')
+            return
+
+        try:
+            results, errors, meta = loadRun(file_path)
         except Exception as ex:
-            logging.error(f'Ошибка внутри потока: {str(ex)}')
-            QMessageBox.critical(self, 'Ошибка', f'Не удалось запустить поток парсинга: {str(ex)}')
+            logging.error(f'Не удалось открыть запуск {file_path}: {ex}', exc_info=True)
+            QMessageBox.critical(self, 'Ошибка', f'Не удалось открыть запуск:\n{str(ex)}')
+            return
 
-            QMetaObject.invokeMethod(
-                self.statusLabel,
-                'setText',
-                Qt.ConnectionType.QueuedConnection,
-                Q_ARG(str, 'Не удалось запустить поток парсинга')
-            )
-            QMetaObject.invokeMethod(
-                self.progressBar,
-                'setValue',
-                Qt.ConnectionType.QueuedConnection,
-                Q_ARG(int, 0)
-            )
-            QMetaObject.invokeMethod(
-                self.startButton,
-                'setEnabled',
-                Qt.ConnectionType.QueuedConnection,
-                Q_ARG(bool, True)
-            )
-            QMetaObject.invokeMethod(
-                self.clearParseSettingsButton,
-                'setEnabled',
-                Qt.ConnectionType.QueuedConnection,
-                Q_ARG(bool, True)
-            )
+        self.result_data = results
+        self.error_data = errors
+        self.run_report = runReportFromMeta(meta)
+        self.current_run_path = file_path
+
+        self.showResults()
+        self.statusLabel.setText(f'Открыт запуск: {runTitle(meta)}')
+
+    def compareWithRun(self) -> None:
+        """
+        Сравнивает текущие результаты с выбранным запуском из истории и экспортирует изменения.
+
+        Note:
+            - Текущий запуск (self.current_run_path) в списке для сравнения не показывается
+            - Порог изменения цены - app_config['diffThreshold'] (см. compareRuns)
+            - Загрузка запуска и сравнение выполняются в потоке экспорта (см. exportRunDiffExcelFile)
+        """
+        if self.result_data is None:
+            return
+
+        try:
+            runs = {}
+            for file_path, meta in self.run_history.runs():
+                if file_path == self.current_run_path:
+                    continue
+
+                title = runTitle(meta)
+                number = 1
+                while title in runs:
+                    number += 1
+                    title = f'{runTitle(meta)} ({number})'
+                runs[title] = file_path
+        except Exception as ex:
+            logging.error(f'Не удалось прочитать историю запусков: {ex}', exc_info=True)
+            QMessageBox.critical(self, 'Ошибка', f'Не удалось прочитать историю запусков:\n{str(ex)}')
+            return
+
+        if not runs:
+            QMessageBox.information(self, 'Сравнение запусков', 'В истории нет других запусков для сравнения')
+            return
+
+        title, accepted = QInputDialog.getItem(
+            self, 'Сравнение запусков', 'Сравнить текущие результаты с запуском:', list(runs), 0, False
+        )
+        if not accepted:
+            return
+
+        threshold = int(self.app_config.get('diffThreshold', AppConstants.DIFF_PRICE_THRESHOLD))
+        exportRunDiffExcelFile(self, runs[title], self.result_data, threshold)
+
+    def updateErrorButtons(self) -> None:
+        """Включает кнопки экспорта и повтора ошибочных артикулов, если ошибки есть."""
+        has_errors = self.error_data is not None and not self.error_data.empty
+
+        self.exportErrorsButton.setEnabled(has_errors)
+        self.retryErrorsButton.setEnabled(has_errors)
+        self.retryErrorsButton.setText(
+            f'Повторить ошибочные ({len(self.error_data)})' if has_errors else 'Повторить ошибочные'
+        )
+
+    def addExportTime(self, report: dict, export_ms: float) -> None:
+        """
+        Добавляет время фонового экспорта результатов в отчет о запуске и обновляет сводку.
+
+        Args:
+            report (dict): Отчет запуска, результаты которого экспортировались
+            export_ms (float): Время экспорта в миллисекундах
+        """
+        report['time_split_ms']['export'] += export_ms
+
+        if report is self.run_report:
+            self.showRunReport()
+
+    def showRunReport(self) -> None:
+        """
+        Выводит краткую сводку отчета о запуске на странице результатов, полный отчет -
+        во всплывающей подсказке сводки и в лог.
+        """
+        if self.run_report is None:
+            self.runSummaryLabel.clear()
+            self.runSummaryLabel.setToolTip('')
+            return
+
+        report_text = '\n'.join(f'{name}: {value}' for name, value in runReportRows(self.run_report))
+
+        self.runSummaryLabel.setText(formatRunSummary(self.run_report))
+        self.runSummaryLabel.setToolTip(report_text)
+        logging.info(f'Отчет о запуске (замеры запросов: {self.run_report["metrics_file"]}):\n{report_text}')
+
+    @pyqtSlot(str)
+    def onParseFailed(self, error: str) -> None:
+        """
+        Сообщает об аварийном завершении потока парсинга и возвращает интерфейс в исходное состояние.
+
+        Args:
+            error (str): Текст ошибки
+        """
+        QMessageBox.critical(self, 'Ошибка', f'Не удалось запустить поток парсинга: {error}')
+
+        self.statusLabel.setText('Не удалось запустить поток парсинга')
+        self.progressBar.setValue(0)
+        self.startButton.setEnabled(True)
+        self.clearParseSettingsButton.setEnabled(True)
+        self.resultPageButton.setEnabled(self.result_data is not None)
+        self.updateErrorButtons()
 
 
 def main() -> None:
@@ -356,4 +665,5 @@ def main() -> None:
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,441 @@
+"""Микробенчмарки горячих функций tools/ на синтетических данных.
+
+Данные генерируются benchmarks/syntheticData.py (детерминированно): ответы API
+по 500 предложений, результаты парсинга и файлы поиска на --rows строк.
+
+Замеряемые функции:
+    - parseXMLResponseToDict: разбор одного ответа API (500 предложений) с orjson (если установлен),
+      со стандартным json и прежним способом через ElementTree (для сравнения)
+    - projectOffers: преобразование 500 предложений в OfferRecord
+    - validateResult: фильтрация 500 предложений (все фильтры, списки по 10 000 пар)
+    - createResultsRow: сборка строк результата (10 предложений на строку) для --rows строк
+    - generateColumns: колонки результата для 10 магазинов
+    - tableFromDataframe: вывод результата из --rows строк в QTableView (offscreen)
+    - importSearchExcelFileToArray: импорт файла поиска из --rows строк
+    - exportResultExcelFile: запись результата из --rows строк в Excel (writeResultWorkbook,
+      то, что exportResultExcelFile выполняет в потоке экспорта)
+
+Для каждого замера выводится лучшее и медианное время одного вызова. Результаты
+сохраняются в benchmarks/results/latest.json, --save-baseline сохраняет их как базовые
+(benchmarks/results/baseline.json), --compare сравнивает с базовыми и завершается
+с кодом 1, если медиана хуже базовой больше чем на --threshold процентов.
+
+Запуск:
+    python benchmarks/microBenchmarks.py --save-baseline
+    python benchmarks/microBenchmarks.py --compare
+    python benchmarks/microBenchmarks.py --rows 10000 100000 --cases validateResult createResultsRow
+"""
+import argparse
+import datetime
+import json
+import xml.etree.ElementTree as ET
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+from unittest import mock
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'results')
+
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd  # noqa: E402
+import requests  # noqa: E402
+
+from PyQt6 import QtWidgets  # noqa: E402
+from PyQt6.QtWidgets import QMessageBox  # noqa: E402
+
+from syntheticData import (  # noqa: E402
+    BRANDS, STORES, makeArticle, makeResponseData, makeResponseXML, makeResultRows, makeSearchRows
+)
+from tools.constants import AppConstants  # noqa: E402
+from tools.dataConvert import tableFromDataframe  # noqa: E402
+from tools.exportControl import columnWidths, writeResultWorkbook  # noqa: E402
+from tools.importControl import importSearchExcelFileToArray  # noqa: E402
+from tools.offerRecord import projectOffers  # noqa: E402
+from tools.priceHistory import PriceHistory  # noqa: E402
+from tools.resultControl import createResultsRow, generateColumns, validateResult  # noqa: E402
+from tools.runDiff import compareRuns  # noqa: E402
+from tools.runHistory import loadRun, saveRun  # noqa: E402
+from tools.XMLToDict import JSON_BACKEND, decodeXMLResponseContent, parseXMLResponseToDict  # noqa: E402
+
+
+STORES_COUNT = 10
+LIST_PAIRS_COUNT = 10000
+PRICE_HISTORY_DAYS = 10
+OPEN_PRICE_HISTORIES: list[PriceHistory] = []
+
+
+class BenchmarkWindow(QtWidgets.QWidget):
+    """Минимальное окно с атрибутами, которые используют замеряемые функции."""
+
+    def __init__(self, workdir: str):
+        super().__init__()
+
+        self.parser_config = {
+            'isDeliveryDateLimit': 'True',
+            'deliveryDateLimit': 20,
+            'onlyInStock': 'False',
+            'onlyWithGuarantee': 'False',
+            'isStoreRatingLimit': 'True',
+            'storeRatingLimit': 2,
+            'useBlackList': 'True',
+            'useWhiteList': 'True'
+        }
+        self.app_config = {'savePath': workdir}
+        self.base_save_path = workdir
+        self.log_dir = workdir
+
+
+@contextmanager
+def silentDialogs() -> Iterator[None]:
+    """Подменяет модальные QMessageBox, чтобы замеры не ждали ответа пользователя."""
+    ok = QMessageBox.StandardButton.Ok
+
+    with mock.patch.object(QMessageBox, 'information', return_value=ok), \
+            mock.patch.object(QMessageBox, 'warning', return_value=ok), \
+            mock.patch.object(QMessageBox, 'critical', return_value=ok), \
+            mock.patch.object(QMessageBox, 'question', return_value=QMessageBox.StandardButton.Yes):
+        yield
+
+
+def measure(func: Callable[[], Any], repeat: int, min_time: float = 0.2) -> dict[str, Any]:
+    """Замеряет время одного вызова func.
+
+    Количество вызовов в одном повторе подбирается так, чтобы повтор длился
+    не меньше min_time секунд (как timeit.Timer.autorange).
+
+    Returns:
+        dict[str, Any]: best_ms, median_ms (время одного вызова), loops, repeat
+    """
+    loops = 1
+    while True:
+        started_at = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - started_at
+
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    timings = [elapsed / loops]
+    for _ in range(repeat - 1):
+        started_at = time.perf_counter()
+        for _ in range(loops):
+            func()
+        timings.append((time.perf_counter() - started_at) / loops)
+
+    return {
+        'best_ms': min(timings) * 1000,
+        'median_ms': statistics.median(timings) * 1000,
+        'loops': loops,
+        'repeat': repeat
+    }
+
+
+def makeResponse(body: bytes) -> requests.Response:
+    """Создает requests.Response с телом и заголовками, как у ответа API."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers['Content-Type'] = 'text/xml; charset=utf-8'
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+
+    return response
+
+
+def legacyParseXMLResponse(response: requests.Response) -> dict[str, Any]:
+    """Прежний разбор ответа (response.text -> ElementTree -> json.loads) для сравнения."""
+    return json.loads(ET.fromstring(response.text).text.strip())
+
+
+def makeListPairs(count: int, seed: str) -> set[tuple[str, str]]:
+    """Возвращает множество пар (бренд, магазин) для черного/белого списка."""
+    pairs = {(brand, store) for brand in BRANDS for store in STORES[::2]}
+    index = 0
+
+    while len(pairs) < count:
+        pairs.add((f'{seed} {index}', STORES[index % len(STORES)]))
+        index += 1
+
+    return pairs
+
+
+def openPriceHistory(workdir: str, name: str) -> PriceHistory:
+    """Открывает историю цен в workdir/runs/{name} (PriceHistory использует относительный путь).
+
+    База закрывается после замеров (см. OPEN_PRICE_HISTORIES), до удаления временной папки.
+    """
+    cwd = os.getcwd()
+    os.chdir(workdir)
+
+    try:
+        history = PriceHistory(name)
+    finally:
+        os.chdir(cwd)
+
+    OPEN_PRICE_HISTORIES.append(history)
+
+    return history
+
+
+def makeArticleOffers(rows: int) -> list[tuple[str, str, list]]:
+    """Предложения после фильтрации для rows артикулов (по STORES_COUNT на артикул)."""
+    return [
+        (brand, article, projectOffers(makeResponseData(article, brand, STORES_COUNT)['table']))
+        for brand, article in map(makeArticle, range(rows))
+    ]
+
+
+def makeResultDataframe(rows: int) -> pd.DataFrame:
+    return pd.DataFrame(makeResultRows(rows, STORES_COUNT), columns=generateColumns(STORES_COUNT))
+
+
+def buildCases(window: BenchmarkWindow, workdir: str, rows_sizes: list[int]) -> list[tuple[str, Callable, int]]:
+    """Возвращает замеры (название, подготовка, количество повторов).
+
+    Подготовка создает входные данные и возвращает замеряемую функцию, поэтому данные
+    создаются только для выбранных замеров и не входят в замер.
+    """
+    body = makeResponseXML('12A-000001', 'BOSCH', 500)
+
+    def project() -> Callable:
+        table = makeResponseData('12A-000001', 'BOSCH', 500)['table']
+        return lambda: projectOffers(table)
+
+    def validate() -> Callable:
+        offers = projectOffers(makeResponseData('12A-000001', 'BOSCH', 500)['table'])
+        black_list = makeListPairs(LIST_PAIRS_COUNT, 'black')
+        white_list = makeListPairs(LIST_PAIRS_COUNT, 'white')
+        return lambda: validateResult(window, offers, black_list, white_list)
+
+    def assemble(rows: int) -> Callable:
+        offers = projectOffers(makeResponseData('12A-000001', 'BOSCH', STORES_COUNT)['table'])
+        bases = [[brand, article, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0] for brand, article in map(makeArticle, range(rows))]
+        return lambda: [createResultsRow(list(base), offers) for base in bases]
+
+    def showTable(rows: int) -> Callable:
+        dataframe = makeResultDataframe(rows)
+        table = QtWidgets.QTableView(window)
+        return lambda: tableFromDataframe(table, dataframe)
+
+    def importSearch(rows: int) -> Callable:
+        path = os.path.join(workdir, f'search_{rows}.xlsx')
+        pd.DataFrame(makeSearchRows(rows), columns=AppConstants.COLUMNS['SEARCH']).to_excel(path, index=False)
+        return lambda: importSearchExcelFileToArray(window, path)
+
+    def widths(rows: int) -> Callable:
+        dataframe = makeResultDataframe(rows)
+        return lambda: columnWidths(dataframe)
+
+    def export(rows: int) -> Callable:
+        dataframe = makeResultDataframe(rows)
+
+        path = os.path.join(workdir, f'export_{rows}.xlsx')
+        return lambda: writeResultWorkbook(path, dataframe)
+
+    def saveRunFile(rows: int) -> Callable:
+        dataframe = makeResultDataframe(rows)
+        errors = pd.DataFrame(columns=AppConstants.COLUMNS['ERRORS'])
+
+        path = os.path.join(workdir, f'run_{rows}.npz')
+        return lambda: saveRun(path, dataframe, errors, {})
+
+    def loadRunFile(rows: int) -> Callable:
+        path = os.path.join(workdir, f'run_load_{rows}.npz')
+        saveRun(path, makeResultDataframe(rows), pd.DataFrame(columns=AppConstants.COLUMNS['ERRORS']), {})
+        return lambda: loadRun(path)
+
+    def diffRuns(rows: int) -> Callable:
+        shift = max(1, rows // 20)
+        columns = generateColumns(STORES_COUNT)
+        result_rows = makeResultRows(rows + shift, STORES_COUNT)
+        old = pd.DataFrame(result_rows[:rows], columns=columns)
+        new = pd.DataFrame(result_rows[shift:], columns=columns)
+        new.loc[::13, 'Мин НАЛИЧИЕ'] = new.loc[::13, 'Мин НАЛИЧИЕ'] * 1.2
+        new.loc[::31, 'Название магазина 1'] = 'Новый магазин'
+        return lambda: compareRuns(old, new)
+
+    def addPrices(rows: int) -> Callable:
+        history = openPriceHistory(workdir, f'add_{rows}')
+        history.startRun(datetime.datetime.now().isoformat(timespec='seconds'))
+        article_offers = makeArticleOffers(rows)
+
+        def add() -> None:
+            for brand, article, offers in article_offers:
+                history.add(brand, article, offers)
+            history.flush()
+
+        return add
+
+    price_histories = {}
+
+    def queryPrices(rows: int, query: str) -> Callable:
+        if rows not in price_histories:
+            history = price_histories[rows] = openPriceHistory(workdir, f'query_{rows}')
+            article_offers = makeArticleOffers(rows)
+            today = datetime.date.today()
+
+            for days_ago in range(PRICE_HISTORY_DAYS):
+                history.startRun(datetime.datetime.now().isoformat(timespec='seconds'))
+                for brand, article, offers in article_offers:
+                    history.add(brand, article, offers, today - datetime.timedelta(days=days_ago))
+            history.flush()
+
+        history = price_histories[rows]
+        brand, article = makeArticle(rows // 2)
+        store = STORES[0]
+
+        return {
+            'minPrice': lambda: history.minPrice(brand, article),
+            'storeTrend': lambda: history.storeTrend(store, brand, article),
+            'storeTrendAll': lambda: history.storeTrend(store)
+        }[query]
+
+    cases = [
+        (
+            f'parseXMLResponseToDict[500 offers, {JSON_BACKEND}]',
+            lambda: lambda: parseXMLResponseToDict(makeResponse(body)),
+            5
+        ),
+        (
+            'parseXMLResponseToDict[500 offers, json]',
+            lambda: lambda: decodeXMLResponseContent(makeResponse(body).content, json.loads),
+            5
+        ),
+        ('parseXMLResponseToDict[500 offers, etree reference]', lambda: lambda: legacyParseXMLResponse(makeResponse(body)), 5),
+        ('projectOffers[500 offers]', project, 5),
+        ('validateResult[500 offers]', validate, 5),
+        (f'generateColumns[{STORES_COUNT} stores]', lambda: lambda: generateColumns(STORES_COUNT), 5)
+    ]
+
+    for rows in rows_sizes:
+        cases += [
+            (f'createResultsRow[{rows} rows]', lambda rows=rows: assemble(rows), 3),
+            (f'tableFromDataframe[{rows} rows]', lambda rows=rows: showTable(rows), 3),
+            (f'importSearchExcelFileToArray[{rows} rows]', lambda rows=rows: importSearch(rows), 3),
+            (f'columnWidths[{rows} rows]', lambda rows=rows: widths(rows), 3),
+            (f'exportResultExcelFile[{rows} rows]', lambda rows=rows: export(rows), 3),
+            (f'saveRun[{rows} rows]', lambda rows=rows: saveRunFile(rows), 3),
+            (f'loadRun[{rows} rows]', lambda rows=rows: loadRunFile(rows), 3),
+            (f'compareRuns[{rows} rows]', lambda rows=rows: diffRuns(rows), 3),
+            (f'PriceHistory.add[{rows} articles]', lambda rows=rows: addPrices(rows), 3),
+            (
+                f'PriceHistory.minPrice[{rows * STORES_COUNT * PRICE_HISTORY_DAYS} offers]',
+                lambda rows=rows: queryPrices(rows, 'minPrice'),
+                5
+            ),
+            (
+                f'PriceHistory.storeTrend[article, {rows * STORES_COUNT * PRICE_HISTORY_DAYS} offers]',
+                lambda rows=rows: queryPrices(rows, 'storeTrend'),
+                5
+            ),
+            (
+                f'PriceHistory.storeTrend[store, {rows * STORES_COUNT * PRICE_HISTORY_DAYS} offers]',
+                lambda rows=rows: queryPrices(rows, 'storeTrendAll'),
+                5
+            )
+        ]
+
+    return cases
+
+
+def compareResults(results: dict[str, dict], baseline: dict[str, dict], threshold: float) -> list[str]:
+    """Печатает сравнение с базовыми результатами и возвращает список регрессий."""
+    regressions = []
+
+    print(f'\nСравнение с базовыми результатами (порог {threshold:.0f}%):')
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f'  {name:<52} нет базового результата')
+            continue
+
+        change = (result['median_ms'] / base['median_ms'] - 1) * 100 if base['median_ms'] else 0.0
+        mark = ''
+        if change > threshold:
+            mark = '  <-- регрессия'
+            regressions.append(f'{name}: {base["median_ms"]:.3f} -> {result["median_ms"]:.3f} мс ({change:+.1f}%)')
+
+        print(f'  {name:<52} {base["median_ms"]:10.3f} -> {result["median_ms"]:10.3f} мс {change:+7.1f}%{mark}')
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Микробенчмарки функций tools/')
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000], help='Размеры входных данных (строк)')
+    parser.add_argument('--cases', nargs='+', help='Выполнить только замеры, в названии которых есть подстрока')
+    parser.add_argument('--output', default=os.path.join(RESULTS_DIR, 'latest.json'), help='Файл результатов')
+    parser.add_argument('--baseline', default=os.path.join(RESULTS_DIR, 'baseline.json'), help='Базовые результаты')
+    parser.add_argument('--save-baseline', action='store_true', help='Сохранить результаты как базовые')
+    parser.add_argument('--compare', action='store_true', help='Сравнить с базовыми результатами')
+    parser.add_argument('--threshold', type=float, default=10.0, help='Допустимое ухудшение медианы, %%')
+    args = parser.parse_args()
+
+    _ = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])  # QApplication живет до конца замеров
+    results = {}
+
+    with tempfile.TemporaryDirectory() as workdir, silentDialogs():
+        window = BenchmarkWindow(workdir)
+
+        for name, prepare, repeat in buildCases(window, workdir, args.rows):
+            if args.cases and not any(case in name for case in args.cases):
+                continue
+
+            results[name] = measure(prepare(), repeat)
+            print(f'  {name:<52} best {results[name]["best_ms"]:10.3f} мс   '
+                  f'median {results[name]["median_ms"]:10.3f} мс   ({results[name]["loops"]}x{repeat})')
+
+        for history in OPEN_PRICE_HISTORIES:
+            history.close()
+        window.deleteLater()
+
+    data = {
+        'created_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'pandas': pd.__version__,
+        'results': results
+    }
+
+    for path in [args.output] + ([args.baseline] if args.save_baseline else []):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+
+    print(f'\nРезультаты сохранены: {args.output}')
+    if args.save_baseline:
+        print(f'Базовые результаты сохранены: {args.baseline}')
+
+    if not args.compare:
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f'Нет базовых результатов: {args.baseline} (запустите с --save-baseline)')
+        return 1
+
+    with open(args.baseline, encoding='utf-8') as f:
+        regressions = compareResults(results, json.load(f)['results'], args.threshold)
+
+    if regressions:
+        print('\nРегрессии:')
+        for regression in regressions:
+            print(f'  - {regression}')
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""Локальный mock-сервер API для замеров без обращения к реальному API_URL.
+
+Сервер отвечает в том же формате, что и API (JSON-строка внутри XML), поэтому
+приложение работает с ним без изменений: достаточно указать в .env
+    API_URL=http://127.0.0.1:8765/
+
+Режимы:
+    - synthetic (по умолчанию): ответ генерируется по артикулу и бренду
+      (benchmarks/syntheticData.py), одинаковый для одинаковых запросов и seed
+    - --record DIR --upstream URL: запросы проксируются в реальный API,
+      успешные ответы сохраняются в DIR как фикстуры (api_key не сохраняется)
+    - --replay DIR: ответы отдаются из фикстур, для отсутствующих - 404
+
+Задержка, доля ошибок и ограничение частоты (429) применяются в режимах synthetic и replay.
+Ошибки выбираются генератором случайных чисел с seed, поэтому при последовательных
+запросах (как в потоке парсинга) последовательность ответов повторяется от запуска к запуску.
+
+Запуск:
+    python benchmarks/mockAPIServer.py --port 8765 --latency-ms 150 --jitter-ms 50 --offers 500
+    python benchmarks/mockAPIServer.py --error-rate 0.05 --rate-limit 5 --rate-burst 10
+    python benchmarks/mockAPIServer.py --record fixtures --upstream https://api.example/
+    python benchmarks/mockAPIServer.py --replay fixtures --latency-ms 100
+"""
+import argparse
+import hashlib
+import os
+import random
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from syntheticData import makeResponseXML  # noqa: E402
+
+
+CONTENT_TYPE = 'text/xml; charset=utf-8'
+
+
+def fixtureName(article: str, brand: str) -> str:
+    """Возвращает имя файла фикстуры для пары (артикул, бренд).
+
+    Имя содержит читаемую часть (для просмотра папки) и хеш исходных значений,
+    чтобы различать артикулы, отличающиеся только спецсимволами.
+    """
+    readable = re.sub(r'[^0-9A-Za-z_-]+', '_', f'{brand}_{article}')[:80]
+    digest = hashlib.sha1(f'{article}\x00{brand}'.encode('utf-8')).hexdigest()[:12]
+
+    return f'{readable}_{digest}.xml'
+
+
+class _RateLimiter:
+    """Ограничение частоты запросов по api_key (token bucket).
+
+    Args:
+        rate (float): Запросов в секунду на ключ (0 - без ограничения)
+        burst (int): Размер «корзины» - сколько запросов подряд допускается без ожидания
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str) -> Optional[float]:
+        """Возвращает None, если запрос разрешен, иначе через сколько секунд повторить."""
+        if self.rate <= 0:
+            return None
+
+        now = time.monotonic()
+
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (float(self.burst), now))
+            tokens = min(float(self.burst), tokens + (now - updated_at) * self.rate)
+
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                return (1 - tokens) / self.rate
+
+            self._buckets[key] = (tokens - 1, now)
+            return None
+
+
+class MockAPIServer(ThreadingHTTPServer):
+    """HTTP-сервер с настройками ответа (см. аргументы командной строки)."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], args: argparse.Namespace):
+        super().__init__(address, _MockAPIHandler)
+
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.random_lock = threading.Lock()
+        self.rate_limiter = _RateLimiter(args.rate_limit, args.rate_burst)
+        self.statuses = Counter()
+
+        if args.record:
+            os.makedirs(args.record, exist_ok=True)
+
+    def draw(self) -> tuple[float, float]:
+        """Возвращает (случайное число для ошибки, задержку в секундах) для очередного запроса."""
+        with self.random_lock:
+            error_draw = self.random.random()
+            jitter = self.random.uniform(-self.args.jitter_ms, self.args.jitter_ms) if self.args.jitter_ms else 0.0
+
+        return error_draw, max(0.0, self.args.latency_ms + jitter) / 1000
+
+
+class _MockAPIHandler(BaseHTTPRequestHandler):
+    server: MockAPIServer
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        query = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(self.path).query, keep_blank_values=True))
+        article = query.get('partnumber', '')
+        brand = query.get('class_man', '')
+        args = self.server.args
+
+        if args.record:
+            self._proxy(query, article, brand)
+            return
+
+        retry_after = self.server.rate_limiter.acquire(query.get('api_key', ''))
+        if retry_after is not None:
+            self._send(429, b'Too Many Requests', {'Retry-After': str(max(1, round(retry_after)))})
+            return
+
+        error_draw, delay = self.server.draw()
+        time.sleep(delay)
+
+        if error_draw < args.error_rate:
+            self._send(500, b'Internal Server Error')
+            return
+
+        if args.replay:
+            path = os.path.join(args.replay, fixtureName(article, brand))
+
+            if not os.path.exists(path):
+                self._send(404, f'Нет фикстуры для {brand} {article}'.encode('utf-8'))
+                return
+
+            with open(path, 'rb') as f:
+                body = f.read()
+        else:
+            body = makeResponseXML(article, brand, args.offers, args.seed)
+
+        self._send(200, body)
+
+    def _proxy(self, query: dict[str, str], article: str, brand: str) -> None:
+        """Передает запрос в реальный API и сохраняет успешный ответ как фикстуру."""
+        url = f'{self.server.args.upstream}?{urllib.parse.urlencode(query)}'
+        request = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.server.args.upstream_timeout) as response:
+                status, body = response.status, response.read()
+        except urllib.error.HTTPError as ex:
+            status, body = ex.code, ex.read()
+        except (urllib.error.URLError, TimeoutError) as ex:
+            self._send(502, str(ex).encode('utf-8'))
+            return
+
+        if status == 200 and body:
+            path = os.path.join(self.server.args.record, fixtureName(article, brand))
+            with open(path, 'wb') as f:
+                f.write(body)
+
+        self._send(status, body)
+
+    def _send(self, status: int, body: bytes, headers: Optional[dict[str, str]] = None) -> None:
+        self.server.statuses[status] += 1
+
+        self.send_response(status)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.args.verbose:
+            super().log_message(format, *args)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Локальный mock-сервер API ProductPercentageApplication')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Задержка ответа')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Разброс задержки (±)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Доля ответов 500 (0..1)')
+    parser.add_argument('--rate-limit', type=float, default=0.0,
+                        help='Запросов в секунду на api_key, сверх лимита - 429 (0 - без лимита)')
+    parser.add_argument('--rate-burst', type=int, default=1, help='Запросов подряд без ожидания')
+    parser.add_argument('--offers', type=int, default=500, help='Предложений в ответе (размер ответа)')
+    parser.add_argument('--seed', type=int, default=0)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--record', metavar='DIR', help='Проксировать в --upstream и сохранять ответы в DIR')
+    mode.add_argument('--replay', metavar='DIR', help='Отдавать ответы из фикстур DIR')
+    parser.add_argument('--upstream', help='URL реального API для режима --record')
+    parser.add_argument('--upstream-timeout', type=float, default=30.0)
+    parser.add_argument('--verbose', action='store_true', help='Выводить каждый запрос')
+    args = parser.parse_args()
+
+    if args.record and not args.upstream:
+        parser.error('--record требует --upstream')
+    if args.replay and not os.path.isdir(args.replay):
+        parser.error(f'Папка фикстур не найдена: {args.replay}')
+
+    server = MockAPIServer((args.host, args.port), args)
+    mode_name = 'record' if args.record else 'replay' if args.replay else 'synthetic'
+    print(f'Mock API ({mode_name}): API_URL=http://{args.host}:{server.server_port}/')
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+    print('Ответы:', ', '.join(f'{status}: {count}' for status, count in sorted(server.statuses.items())) or 'нет')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
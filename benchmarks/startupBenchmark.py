@@ -0,0 +1,205 @@
+"""Бенчмарк запуска приложения: время до первой отрисовки окна и время импорта модулей.
+
+Каждый замер выполняется в отдельном процессе (холодный запуск интерпретатора)
+во временной рабочей папке, поэтому конфиги и логи пользователя не затрагиваются.
+
+Измеряется:
+    - import_ms: импорт app.py
+    - construct_ms: создание главного окна (App())
+    - first_paint_ms: от старта процесса до первого события Paint главного окна
+    - время импорта отдельных модулей (python -X importtime), модули приложения
+      и самые тяжелые сторонние модули
+
+Дополнительно проверяется, что тяжелые модули (pandas, numpy, requests, xlsxwriter)
+не загружаются до первой отрисовки окна.
+
+Запуск:
+    python benchmarks/startupBenchmark.py
+    python benchmarks/startupBenchmark.py --runs 10 --budget-first-paint-ms 800 --json startup.json
+
+Код возврата 1, если медиана превышает бюджет или при запуске загружен тяжелый модуль.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+_PROCESS_STARTED_AT = time.perf_counter()
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY_MODULES = ('pandas', 'numpy', 'requests', 'xlsxwriter', 'openpyxl')
+
+DEFAULT_BUDGETS = {
+    'import_ms': 600,
+    'first_paint_ms': 1500
+}
+
+
+def runChild() -> None:
+    """Выполняется в дочернем процессе: запускает окно и печатает замеры в stdout (JSON)."""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    os.environ.setdefault('API_KEYS', 'benchmark')
+    os.environ.setdefault('API_URL', 'http://127.0.0.1/')
+    os.environ.setdefault('USERPROFILE', os.getcwd())
+    sys.path.insert(0, REPO_ROOT)
+
+    import_started_at = time.perf_counter()
+
+    from PyQt6 import QtWidgets
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+
+    import app
+
+    import_ms = (time.perf_counter() - import_started_at) * 1000
+    qt_app = QtWidgets.QApplication(sys.argv[:1])
+
+    construct_started_at = time.perf_counter()
+    window = app.App()
+    construct_ms = (time.perf_counter() - construct_started_at) * 1000
+
+    metrics = {}
+
+    class PaintWatcher(QObject):
+        def eventFilter(self, watched, event) -> bool:
+            if event.type() == QEvent.Type.Paint and 'first_paint_ms' not in metrics:
+                metrics['first_paint_ms'] = (time.perf_counter() - _PROCESS_STARTED_AT) * 1000
+                QTimer.singleShot(0, qt_app.quit)
+            return False
+
+    watcher = PaintWatcher()
+    window.installEventFilter(watcher)
+    window.show()
+
+    QTimer.singleShot(10000, qt_app.quit)
+    qt_app.exec()
+
+    metrics.update({
+        'import_ms': import_ms,
+        'construct_ms': construct_ms,
+        'lazy_modules_loaded': [name for name in LAZY_MODULES if name in sys.modules]
+    })
+
+    window.list_storage.close()
+    print(json.dumps(metrics))
+
+
+def _runProcess(extra_args: list[str], workdir: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *extra_args, os.path.abspath(__file__), '--child'],
+        cwd=workdir,
+        capture_output=True,
+        text=True,
+        timeout=60
+    )
+
+
+def measureStartup(runs: int) -> list[dict]:
+    """Выполняет runs холодных запусков и возвращает замеры каждого запуска."""
+    results = []
+
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as workdir:
+            completed = _runProcess([], workdir)
+
+        if completed.returncode != 0:
+            raise RuntimeError(f'Дочерний процесс завершился с ошибкой:\n{completed.stderr}')
+
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    return results
+
+
+def measureImportTimes(top: int) -> list[tuple[str, float, float]]:
+    """Возвращает время импорта модулей по данным python -X importtime.
+
+    Returns:
+        list[tuple[str, float, float]]: (модуль, собственное время мс, суммарное время мс)
+            для модулей приложения (app, tools.*, ui.*) и top самых тяжелых остальных модулей
+    """
+    with tempfile.TemporaryDirectory() as workdir:
+        completed = _runProcess(['-X', 'importtime'], workdir)
+
+    modules = {}
+
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        modules[name] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+
+    own = [name for name in modules if name == 'app' or name.startswith(('tools.', 'ui.'))]
+    top_level = sorted(
+        (name for name in modules if name not in own and '.' not in name),
+        key=lambda name: modules[name][1],
+        reverse=True
+    )[:top]
+
+    return [(name, *modules[name]) for name in sorted(own) + top_level]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Бенчмарк запуска ProductPercentageApplication')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--runs', type=int, default=5, help='Количество холодных запусков')
+    parser.add_argument('--top', type=int, default=10, help='Количество самых тяжелых сторонних модулей')
+    parser.add_argument('--budget-import-ms', type=float, default=DEFAULT_BUDGETS['import_ms'])
+    parser.add_argument('--budget-first-paint-ms', type=float, default=DEFAULT_BUDGETS['first_paint_ms'])
+    parser.add_argument('--json', help='Сохранить результаты в JSON-файл')
+    args = parser.parse_args()
+
+    if args.child:
+        runChild()
+        return 0
+
+    runs = measureStartup(args.runs)
+    summary = {
+        key: statistics.median(run[key] for run in runs)
+        for key in ('import_ms', 'construct_ms', 'first_paint_ms')
+    }
+    lazy_loaded = sorted({name for run in runs for name in run['lazy_modules_loaded']})
+    import_times = measureImportTimes(args.top)
+
+    print(f'Запусков: {len(runs)} (медиана)')
+    for key, value in summary.items():
+        print(f'  {key:<16} {value:8.1f} мс')
+
+    print('\nВремя импорта модулей (собственное / суммарное, мс):')
+    for name, self_ms, cumulative_ms in import_times:
+        print(f'  {name:<45} {self_ms:8.1f} {cumulative_ms:8.1f}')
+
+    failures = []
+    if summary['import_ms'] > args.budget_import_ms:
+        failures.append(f'import_ms {summary["import_ms"]:.1f} > {args.budget_import_ms:.0f}')
+    if summary['first_paint_ms'] > args.budget_first_paint_ms:
+        failures.append(f'first_paint_ms {summary["first_paint_ms"]:.1f} > {args.budget_first_paint_ms:.0f}')
+    if lazy_loaded:
+        failures.append(f'при запуске загружены модули: {", ".join(lazy_loaded)}')
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'summary': summary,
+                'runs': runs,
+                'import_times': import_times,
+                'failures': failures
+            }, f, indent=4, ensure_ascii=False)
+
+    if failures:
+        print('\nПревышен бюджет запуска:')
+        for failure in failures:
+            print(f'  - {failure}')
+        return 1
+
+    print('\nБюджет запуска соблюден')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Генераторы синтетических данных в формате API и файлов приложения.
+
+Используются локальным mock-сервером API (mockAPIServer.py) и микробенчмарками.
+Все генераторы детерминированы: одинаковые аргументы и seed дают одинаковый результат.
+"""
+import json
+import random
+import zlib
+
+from typing import Any
+from xml.sax.saxutils import escape
+
+
+BRANDS = [
+    'BOSCH', 'MANN-FILTER', 'MAHLE', 'NGK', 'DENSO', 'FEBI', 'SACHS', 'LEMFORDER',
+    'TRW', 'VALEO', 'HELLA', 'GATES', 'CONTITECH', 'SKF', 'INA', 'LUK', 'KYB', 'MONROE'
+]
+STORES = [f'Магазин {index}' for index in range(1, 301)]
+STOCK_DESCRIPTIONS = ['В наличии', 'Под заказ', 'В наличии, гарантия 12 мес', 'Мало', 'Много']
+PAYMENT_TERMS = ['Оплата картой', 'Наличные', 'Безналичный расчет', 'Предоплата']
+
+
+def _rng(*parts: Any) -> random.Random:
+    """Возвращает генератор случайных чисел, зависящий только от переданных значений."""
+    return random.Random(zlib.crc32('|'.join(map(str, parts)).encode('utf-8')))
+
+
+def makeArticle(index: int) -> tuple[str, str]:
+    """Возвращает пару (бренд, артикул) для строки index файла поиска."""
+    rng = _rng('article', index)
+
+    return rng.choice(BRANDS), f'{rng.randint(10, 99)}{rng.choice("ABCDEFGHKMX")}-{index:06d}'
+
+
+def makeOffers(article: str, brand: str, count: int, seed: int = 0) -> list[dict[str, Any]]:
+    """Генерирует count предложений магазинов (элементы поля table ответа API)."""
+    rng = _rng('offers', article, brand, seed)
+    offers = []
+
+    for _ in range(count):
+        in_stock = rng.random() < 0.6
+
+        offers.append({
+            'priceV2': round(rng.uniform(100, 50000), 2),
+            'qtyV2': rng.randint(-1, 200),
+            'descr_qtyV2': rng.choice(STOCK_DESCRIPTIONS),
+            'class_cat': f'Деталь {article}',
+            'class_man': brand if rng.random() < 0.8 else rng.choice(BRANDS),
+            'class_user': rng.choice(STORES),
+            'descr_price': rng.choice(PAYMENT_TERMS),
+            'delivery_days': 0 if in_stock else rng.randint(1, 30),
+            'instock': 1 if in_stock else 0,
+            'rating': rng.randint(1, 5)
+        })
+
+    return offers
+
+
+def makeResponseData(article: str, brand: str, offers_count: int = 500, seed: int = 0) -> dict[str, Any]:
+    """Возвращает данные ответа API (то, что возвращает parseXMLResponseToDict)."""
+    offers = makeOffers(article, brand, offers_count, seed)
+    in_stock = [offer['priceV2'] for offer in offers if offer['instock'] == 1] or [0]
+    on_order = [offer['priceV2'] for offer in offers if offer['instock'] != 1] or [0]
+
+    return {
+        'price_min_instock': min(in_stock),
+        'price_avg_instock': round(sum(in_stock) / len(in_stock), 2),
+        'price_max_instock': max(in_stock),
+        'price_min_order': min(on_order),
+        'price_avg_order': round(sum(on_order) / len(on_order), 2),
+        'price_max_order': max(on_order),
+        'table': offers
+    }
+
+
+def wrapResponseXML(data: dict[str, Any]) -> bytes:
+    """Оборачивает данные ответа в XML так же, как API: JSON-строка в тексте корневого элемента."""
+    body = escape(json.dumps(data, ensure_ascii=False))
+
+    return f'<?xml version="1.0" encoding="utf-8"?>\n<string>{body}</string>'.encode('utf-8')
+
+
+def makeResponseXML(article: str, brand: str, offers_count: int = 500, seed: int = 0) -> bytes:
+    """Возвращает тело ответа API (XML с JSON внутри) для артикула."""
+    return wrapResponseXML(makeResponseData(article, brand, offers_count, seed))
+
+
+def makeSearchRows(count: int) -> list[list[str]]:
+    """Возвращает строки файла поиска [Производитель, Артикул]."""
+    return [list(makeArticle(index)) for index in range(count)]
+
+
+def makeResultRows(count: int, stores: int = 10) -> list[list[Any]]:
+    """Возвращает строки результатов парсинга в формате generateColumns(stores)."""
+    rows = []
+
+    for index in range(count):
+        brand, article = makeArticle(index)
+        rng = _rng('result', index)
+        row = [brand, article] + [round(rng.uniform(100, 50000), 2) for _ in range(6)]
+        filled = rng.randint(0, stores)
+
+        for offer in makeOffers(article, brand, filled):
+            row += [
+                str(int(offer['priceV2'])), str(max(offer['qtyV2'], 0)), offer['descr_qtyV2'],
+                offer['class_cat'], offer['class_user'], offer['descr_price'], str(offer['delivery_days'])
+            ]
+
+        if filled < stores:
+            row.append('Данные отсутствуют' if filled == 0 else 'Больше данных нет')
+            row += [''] * (8 + stores * 7 - len(row))
+
+        rows.append(row)
+
+    return rows
@@ -0,0 +1,52 @@
+import os
+import sys
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.resultControl import generateColumns  # noqa: E402
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@pytest.fixture(scope='session')
+def qt_app():
+    """QApplication для тестов моделей Qt (один на сессию)."""
+    from PyQt6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+def makeResultFrame(rows: list[dict]) -> 'pd.DataFrame':
+    """Результат в формате generateColumns(2) из коротких описаний строк.
+
+    Строка задается словарем: brand, article, min_instock, min_order и stores - список
+    пар (магазин, цена) не длиннее двух; остальные ячейки пустые, как у парсинга.
+    """
+    import pandas as pd
+
+    columns = generateColumns(2)
+    data = []
+
+    for row in rows:
+        values = dict.fromkeys(columns, '')
+        values.update({
+            'Бренд': row['brand'],
+            'Артикул': row['article'],
+            'Мин НАЛИЧИЕ': row.get('min_instock', 0),
+            'Мин ПОД ЗАКАЗ': row.get('min_order', 0)
+        })
+
+        for number, (store, price) in enumerate(row.get('stores', []), start=1):
+            values[f'Название магазина {number}'] = store
+            values[f'Цена магазина {number}'] = price
+            values[f'Кол-во дней доставки магазина {number}'] = row.get('delivery_days', 1)
+
+        data.append([values[column] for column in columns])
+
+    return pd.DataFrame(data, columns=columns)
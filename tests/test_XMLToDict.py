@@ -0,0 +1,34 @@
+import pytest
+
+from tools import XMLToDict
+from tools.XMLToDict import decodeXMLResponseContent
+
+
+PAYLOAD = b'{"price_min_instock": 10, "table": [{"class_user": "\xd0\x9c"}]}'
+EXPECTED = {'price_min_instock': 10, 'table': [{'class_user': 'М'}]}
+
+
+@pytest.mark.parametrize('content', [
+    b'<root>' + PAYLOAD + b'</root>',
+    b'<?xml version="1.0" encoding="UTF-8"?>\n<root attr="1">\n' + PAYLOAD + b'\n</root>',
+    b'\xef\xbb\xbf<root>' + PAYLOAD + b'</root>',
+])
+def test_fast_path(content, monkeypatch):
+    monkeypatch.setattr(XMLToDict.ET, 'fromstring', lambda *_: pytest.fail('ElementTree не должен вызываться'))
+
+    assert decodeXMLResponseContent(content) == EXPECTED
+
+
+@pytest.mark.parametrize('content', [
+    b'<root>{"a": "x &amp; y"}</root>',
+    b'<root><![CDATA[{"a": "x & y"}]]></root>',
+    '<?xml version="1.0" encoding="windows-1251"?><root>{"a": "x & y"}</root>'.replace('&', '&amp;').encode('cp1251'),
+])
+def test_fallback_matches_elementtree(content):
+    assert decodeXMLResponseContent(content) == {'a': 'x & y'}
+
+
+@pytest.mark.parametrize('content', [b'<root></root>', b'<root/>', b'<root>{bad</root>', b'not xml'])
+def test_invalid_content(content):
+    with pytest.raises(ValueError):
+        decodeXMLResponseContent(content)
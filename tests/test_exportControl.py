@@ -0,0 +1,40 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from tools.exportControl import parquetColumns, runReportSidecarPath
+
+
+def test_parquetColumns_single_type_per_column():
+    data = pd.DataFrame({
+        'Бренд': ['MANN', 'BOSCH'],
+        'Артикул': [712, 'W 712'],
+        'Мин НАЛИЧИЕ': [100.5, 'Данные отсутствуют'],
+        'Цена магазина 1': [300, ''],
+        'Название магазина 1': ['S1', None],
+        'Кол-во дней доставки магазина 1': [1, 2],
+    })
+
+    result = parquetColumns(data)
+
+    assert result['Артикул'].tolist() == ['712', 'W 712']
+    assert result['Мин НАЛИЧИЕ'].dtype.kind == 'f' and np.isnan(result['Мин НАЛИЧИЕ'][1])
+    assert result['Цена магазина 1'].dtype.kind == 'f' and np.isnan(result['Цена магазина 1'][1])
+    assert result['Название магазина 1'].isna().tolist() == [False, True]
+    assert result['Кол-во дней доставки магазина 1'].dtype.kind == 'i'
+    for column in result.columns:
+        assert len({type(value) for value in result[column].dropna()}) == 1, column
+
+
+def test_parquetColumns_keeps_source_frame():
+    data = pd.DataFrame({'Мин НАЛИЧИЕ': [1, 'x']})
+
+    parquetColumns(data)
+
+    assert data['Мин НАЛИЧИЕ'].tolist() == [1, 'x']
+
+
+def test_runReportSidecarPath():
+    assert runReportSidecarPath('/out/Проценка.csv') == '/out/Проценка.report.json'
+    assert json.dumps(runReportSidecarPath('a.b.jsonl')) == '"a.b.report.json"'
@@ -0,0 +1,58 @@
+import pytest
+
+from PyQt6.QtCore import Qt
+
+from tools.listModel import PairListModel
+
+
+@pytest.fixture
+def model(qt_app):
+    model = PairListModel()
+    model.setPairs([['MANN', 'S1'], ['BOSCH', 'S2']])
+    model.clearChanges()
+
+    return model
+
+
+def test_setPairs_skips_duplicates_and_incomplete(qt_app):
+    model = PairListModel()
+
+    assert model.setPairs([[' MANN ', 'S1'], ['MANN', 'S1'], ['', 'S2'], ['BOSCH', None]]) == 3
+    assert model.pairs() == [['MANN', 'S1']]
+    assert model.contains('MANN', 'S1')
+
+
+def test_pendingChanges_tracks_difference(model):
+    added, skipped = model.addPairs([['TRW', 'S3'], ['MANN', 'S1']])
+    model.removeSourceRows([1])
+
+    assert (added, skipped) == (1, 1)
+    replaced, added_pairs, removed_pairs = model.pendingChanges()
+    assert not replaced
+    assert added_pairs == [('TRW', 'S3')]
+    assert removed_pairs == [('BOSCH', 'S2')]
+
+
+def test_add_then_remove_leaves_no_change(model):
+    model.addPairs([['TRW', 'S3']])
+    model.removeSourceRows([2])
+
+    assert model.pendingChanges() == (False, [], [])
+
+
+def test_edit_rejects_duplicate(model):
+    rejected = []
+    model.duplicateRejected.connect(lambda brand, store: rejected.append((brand, store)))
+
+    assert model.setData(model.index(1, 0), 'MANN', Qt.ItemDataRole.EditRole)
+    assert not model.setData(model.index(1, 1), 'S1', Qt.ItemDataRole.EditRole)
+    assert rejected == [('MANN', 'S1')]
+    assert model.pairSet() == {('MANN', 'S1'), ('MANN', 'S2')}
+
+
+def test_search_filters_view_rows(model):
+    model.setSearchText('bos')
+
+    assert model.rowCount() == 1
+    assert model.sourceRow(0) == 1
+    assert model.totalRowCount() == 2
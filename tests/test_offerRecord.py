@@ -0,0 +1,49 @@
+import pytest
+
+from tools.offerRecord import OFFER_FIELDS, projectOffers
+
+
+BASE_OFFER = {
+    'priceV2': '1500', 'qtyV2': '-2', 'descr_qtyV2': '5 шт', 'class_cat': 'Фильтр',
+    'class_user': 'Магазин', 'descr_price': 'Безналичный', 'delivery_days': '3'
+}
+
+
+def test_projectOffers_typed_fields():
+    offer, = projectOffers([dict(BASE_OFFER, class_man='MANN', instock='1', rating='4.5')])
+
+    assert (offer.price, offer.qty, offer.delivery_days) == (1500, 0, 3)
+    assert (offer.brand, offer.store) == ('MANN', 'Магазин')
+    assert offer.in_stock is True
+    assert offer.rating == 4.5
+
+
+def test_projectOffers_filter_fields_are_optional():
+    offer, = projectOffers([dict(BASE_OFFER)])
+
+    assert (offer.brand, offer.in_stock, offer.rating) == ('', False, 0.0)
+
+
+@pytest.mark.parametrize('instock, rating', [(None, None), ('', 'n/a'), ('x', '')])
+def test_projectOffers_lenient_filter_values(instock, rating):
+    offer, = projectOffers([dict(BASE_OFFER, instock=instock, rating=rating)])
+
+    assert (offer.in_stock, offer.rating) == (False, 0.0)
+
+
+@pytest.mark.parametrize('field', OFFER_FIELDS)
+def test_projectOffers_missing_required_field(field):
+    offer = {key: value for key, value in BASE_OFFER.items() if key != field}
+
+    with pytest.raises(ValueError, match=field):
+        projectOffers([BASE_OFFER, offer])
+
+
+def test_projectOffers_bad_value_names_offer():
+    with pytest.raises(ValueError, match='предложении 2'):
+        projectOffers([BASE_OFFER, dict(BASE_OFFER, priceV2='abc')])
+
+
+def test_projectOffers_not_a_list():
+    with pytest.raises(ValueError):
+        projectOffers({'priceV2': 1})
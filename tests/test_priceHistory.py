@@ -0,0 +1,70 @@
+import datetime
+
+import pytest
+
+from tools.constants import AppConstants
+from tools.offerRecord import projectOffers
+from tools.priceHistory import PriceHistory
+
+
+TODAY = datetime.date(2026, 3, 10)
+
+
+def offers(*rows):
+    return projectOffers([
+        {'priceV2': price, 'qtyV2': 1, 'descr_qtyV2': '', 'class_cat': '', 'class_user': store,
+         'descr_price': '', 'delivery_days': 1, 'instock': int(in_stock), 'rating': 5}
+        for store, price, in_stock in rows
+    ])
+
+
+@pytest.fixture
+def history(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    history = PriceHistory('user')
+    history.startRun('2026-03-10T10:00:00')
+
+    yield history
+
+    history.close()
+
+
+def test_minPrice_over_month_partitions(history):
+    history.add('B', 'A', offers(('S1', 300, True), ('S2', 200, False)), day=TODAY)
+    history.add('B', 'A', offers(('S1', 150, True)), day=datetime.date(2026, 2, 20))
+    history.add('B', 'A', offers(('S1', 50, True)), day=datetime.date(2025, 12, 1))
+    history.flush()
+
+    assert history.minPrice('B', 'A', 30, today=TODAY) == 150
+    assert history.minPrice('B', 'A', 30, in_stock=False, today=TODAY) == 200
+    assert history.minPrice('B', 'A', 5, today=TODAY) == 200
+    assert history.minPrice('B', 'нет', 30, today=TODAY) is None
+    assert history.storeMinPrices('B', 'A', 30, today=TODAY) == {'S1': 150, 'S2': 200}
+
+
+def test_reader_sees_tables_created_by_another_instance(history):
+    reader = PriceHistory('user')
+
+    try:
+        assert reader.minPrice('B', 'A', today=TODAY) is None
+
+        history.add('B', 'A', offers(('S1', 100, True)), day=TODAY)
+        history.flush()
+        assert reader.minPrice('B', 'A', today=TODAY) == 100
+
+        history.prune(today=TODAY + datetime.timedelta(days=31 * (AppConstants.PRICE_HISTORY_MONTHS + 1)))
+        assert reader.minPrice('B', 'A', today=TODAY) is None
+    finally:
+        reader.close()
+
+
+def test_prune_drops_only_old_months(history):
+    old_day = datetime.date(2023, 1, 15)
+    history.add('B', 'A', offers(('S1', 10, True)), day=old_day)
+    history.add('B', 'A', offers(('S1', 20, True)), day=TODAY)
+    history.flush()
+
+    history.prune(today=TODAY)
+
+    assert history.minPrice('B', 'A', 1, today=old_day) is None
+    assert history.minPrice('B', 'A', 1, today=TODAY) == 20
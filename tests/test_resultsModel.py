@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.conftest import makeResultFrame
+from tools.resultsModel import ResultsIndex
+
+
+@pytest.fixture
+def index():
+    return ResultsIndex(makeResultFrame([
+        {'brand': 'MANN', 'article': 'W 712/75', 'stores': [('S1', 300), ('S2', 250)], 'delivery_days': 2},
+        {'brand': 'BOSCH', 'article': 'F026-400', 'stores': [('S2', 900)], 'delivery_days': 5},
+        {'brand': 'MANN', 'article': 'HU 816', 'stores': [('S3', 'Данные отсутствуют')]},
+    ]))
+
+
+def rows(mask: np.ndarray) -> list[int]:
+    return np.flatnonzero(mask).tolist()
+
+
+def test_search_prefix_ignores_separators_and_case(index):
+    assert rows(index.query(text='w71275')) == [0]
+    assert rows(index.query(text='f026')) == [1]
+    assert rows(index.query(text='man')) == [0, 2]
+
+
+def test_brand_and_store_filters(index):
+    assert rows(index.query(brand='MANN')) == [0, 2]
+    assert rows(index.query(store='S2')) == [0, 1]
+    assert rows(index.query(brand='MANN', store='S2')) == [0]
+    assert rows(index.query(store='нет такого')) == []
+
+
+def test_price_range_uses_row_minimum(index):
+    assert rows(index.query(price_from=200, price_to=260)) == [0]
+    assert rows(index.query(price_from=260)) == [1]
+    assert rows(index.query(price_to=1000)) == [0, 1]
+
+
+def test_delivery_days(index):
+    assert rows(index.query(max_delivery_days=3)) == [0, 2]
+
+
+def test_empty_result():
+    index = ResultsIndex(pd.DataFrame(columns=makeResultFrame([]).columns))
+
+    assert index.row_count == 0
+    assert rows(index.query(text='a')) == []
@@ -0,0 +1,60 @@
+from tests.conftest import makeResultFrame
+from tools.runDiff import compareRuns
+
+
+OLD = makeResultFrame([
+    {'brand': 'B', 'article': 'A1', 'min_instock': 100, 'stores': [('S1', 100), ('S2', 150)]},
+    {'brand': 'B', 'article': 'A2', 'min_instock': 200, 'stores': [('S1', 200)]},
+    {'brand': 'B', 'article': 'LOST', 'min_instock': 10, 'stores': [('S1', 10)]},
+    {'brand': 'B', 'article': 'STOCK', 'min_instock': 50, 'stores': [('S1', 50)]},
+])
+
+
+def changesByArticle(delta):
+    return dict(zip(delta['Артикул'], delta['Изменения']))
+
+
+def test_compareRuns_same_run_has_no_changes():
+    delta, summary = compareRuns(OLD, OLD.copy(), 5)
+
+    assert delta.empty
+    assert summary['matched'] == 4
+    assert summary['changed'] == 0
+
+
+def test_compareRuns_detects_changes():
+    new = makeResultFrame([
+        {'brand': 'B', 'article': 'A1', 'min_instock': 110, 'stores': [('S1', 110), ('S2', 150)]},
+        {'brand': 'B', 'article': 'A2', 'min_instock': 200, 'stores': [('S3', 200)]},
+        {'brand': 'B', 'article': 'STOCK', 'min_instock': 0, 'stores': [('S1', 50)]},
+        {'brand': 'B', 'article': 'NEW', 'min_instock': 5, 'stores': [('S1', 5)]},
+    ])
+
+    delta, summary = compareRuns(OLD, new, 5)
+    changes = changesByArticle(delta)
+
+    assert (summary['matched'], summary['added'], summary['lost']) == (3, 1, 1)
+    assert changes['NEW'] == 'новый артикул'
+    assert changes['LOST'] == 'нет в новом запуске'
+    assert 'цена' in changes['A1'].split('; ')
+    assert 'цены магазинов' in changes['A1']
+    assert 'магазины' in changes['A2'].split('; ')
+    assert 'наличие' in changes['STOCK'].split('; ')
+    assert summary['changed'] == len(delta) == 5
+
+
+def test_compareRuns_price_threshold():
+    new = OLD.copy()
+    new.loc[0, 'Мин НАЛИЧИЕ'] = 103
+
+    assert compareRuns(OLD, new, 5)[0].empty
+    assert changesByArticle(compareRuns(OLD, new, 0)[0]) == {'A1': 'цена'}
+
+
+def test_compareRuns_missing_data_markers():
+    old = OLD.copy()
+    old.loc[1, 'Цена магазина 2'] = 'Больше данных нет'
+
+    delta, _ = compareRuns(old, old.copy(), 0)
+
+    assert delta.empty
@@ -1,15 +1,31 @@
 import logging
+import time
+
 import requests
 
 from typing import Optional
 
+from urllib3.exceptions import ReadTimeoutError
+
 from PyQt6 import QtWidgets
 
 from tools.constants import AppConstants
+from tools.offerRecord import projectOffers
 from tools.XMLToDict import parseXMLResponseToDict
 
 
-def safeAPIRequest(window: QtWidgets, params: dict) -> Optional[dict]:
+def _isReadTimeout(ex: requests.ConnectionError) -> bool:
+    """Проверяет, что ConnectionError вызван таймаутом чтения тела ответа.
+
+    При stream=True тело читается после получения заголовков, и requests оборачивает
+    таймаут чтения urllib3 (ReadTimeoutError) в ConnectionError, а не в Timeout.
+    """
+    reasons = (*ex.args, ex.__cause__, ex.__context__)
+
+    return any(isinstance(reason, ReadTimeoutError) for reason in reasons)
+
+
+def safeAPIRequest(window: QtWidgets, params: dict, metrics: Optional[dict] = None) -> Optional[dict]:
     """
     Выполняет безопасный запрос к API с обработкой возможных ошибок.
 
@@ -17,48 +33,99 @@ def safeAPIRequest(window: QtWidgets, params: dict) -> Optional[dict]:
         window (QtWidgets.QWidget): Родительское окно для диалоговых сообщений.
             Должно быть виджетом из QtWidgets для корректного отображения QMessageBox.
         params (dict): Параметры запроса, которые будут переданы в GET-запросе.
+        metrics (Optional[dict]): Если передан, заполняется замерами запроса:
+            - status (int | None): HTTP-статус ответа
+            - bytes (int): Размер тела ответа
+            - ttfb_ms (float): Время до получения заголовков ответа
+            - latency_ms (float): Полное время запроса (включая загрузку тела)
+            - parse_ms (float): Время разбора XML/JSON и преобразования предложений
+            - error (str | None): Код ошибки: 'timeout', 'http', 'connection',
+              'empty', 'parse', 'request' или None при успехе
 
     Returns:
         Optional[dict]: Словарь с данными ответа в случае успеха, None в случае ошибки.
+            Предложения (поле table) преобразуются в list[OfferRecord] (см. projectOffers).
 
     Note:
         - Используется стандартный таймаут из AppConstants.API_TIMEOUT
         - Включена верификация SSL сертификата (verify=True)
         - Обрабатываются следующие исключения:
           * requests.RequestException - проблемы с сетевым запросом
-          * ValueError - проблемы при парсинге XML ответа
+          * ValueError - проблемы при парсинге XML ответа или неверный формат предложений
+        - Таймаут чтения тела ответа (requests оборачивает его в ConnectionError)
+          тоже учитывается как 'timeout' (см. _isReadTimeout)
         - Все ошибки логируются с указанием деталей исключения
     """
+    if metrics is None:
+        metrics = {}
+
+    metrics.update(status=None, bytes=0, ttfb_ms=None, latency_ms=None, parse_ms=None, error=None)
+    started_at = time.perf_counter()
+    response = None
+
     try:
         response = requests.get(
             url=window.api_url,
             params=params,
             timeout=AppConstants.API_TIMEOUT,
             verify=True,
-            headers={'User-Agent': 'Mozilla/5.0'}
+            headers={'User-Agent': 'Mozilla/5.0'},
+            stream=True
         )
+        metrics['ttfb_ms'] = (time.perf_counter() - started_at) * 1000
+        metrics['status'] = response.status_code
 
         response.raise_for_status()
 
-        if not response.content:
+        content = response.content
+        metrics['latency_ms'] = (time.perf_counter() - started_at) * 1000
+        metrics['bytes'] = len(content)
+
+        if not content:
+            metrics['error'] = 'empty'
             logging.warning('Получен пустой ответ от API')
             return
 
-        return parseXMLResponseToDict(response)
+        parse_started_at = time.perf_counter()
+        try:
+            response_data = parseXMLResponseToDict(response)
+            response_data['table'] = projectOffers(response_data.get('table') or [])
+            return response_data
+        except ValueError:
+            metrics['error'] = 'parse'
+            raise
+        finally:
+            metrics['parse_ms'] = (time.perf_counter() - parse_started_at) * 1000
 
     except requests.Timeout:
+        metrics['error'] = 'timeout'
         logging.error(f'Таймаут соединения с API (превышено {AppConstants.API_TIMEOUT} секунд)')
         return
 
     except requests.HTTPError as http_err:
-        status_code = response.status_code if 'response' in locals() else 'неизвестен'
+        metrics['error'] = 'http'
+        status_code = response.status_code if response is not None else 'неизвестен'
         logging.error(f'Ошибка HTTP {status_code}: {str(http_err)}')
         return
 
-    except requests.ConnectionError:
+    except requests.ConnectionError as connection_err:
+        if _isReadTimeout(connection_err):
+            metrics['error'] = 'timeout'
+            logging.error(f'Таймаут чтения ответа API (превышено {AppConstants.API_TIMEOUT} секунд)')
+            return
+
+        metrics['error'] = 'connection'
         logging.error('Ошибка подключения к API: невозможно установить соединение')
         return
 
     except (requests.RequestException, ValueError) as ex:
+        metrics['error'] = metrics['error'] or 'request'
         logging.error(f'Ошибка при выполнении запроса к API: {str(ex)}', exc_info=True)
         return
+
+    finally:
+        if response is not None:
+            response.close()
+
+        if metrics['latency_ms'] is None:
+            metrics['latency_ms'] = (time.perf_counter() - started_at) * 1000
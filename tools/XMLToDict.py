@@ -1,21 +1,129 @@
 import json
+import re
 import requests
 
 import xml.etree.ElementTree as ET
 
-from typing import Any
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+JSON_BACKEND = 'orjson' if orjson is not None else 'json'
+
+_XML_DECLARATION_ENCODING = re.compile(rb'^<\?xml[^>]*?encoding\s*=\s*["\']([A-Za-z0-9._-]+)["\']')
+_UTF8_ENCODINGS = {b'utf-8', b'utf8'}
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+
+def _loadsJSON(payload: bytes) -> Any:
+    """Разбирает JSON из байтов UTF-8: orjson, если установлен, иначе стандартный json.
+
+    orjson строже стандартного модуля (например, не принимает NaN и целые больше 64 бит),
+    поэтому при его ошибке выполняется повторная попытка через json.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(payload)
+
+
+def _rootTextSlice(content: bytes) -> tuple[int, int] | None:
+    """Находит границы текста корневого элемента XML без построения дерева.
+
+    Returns:
+        tuple[int, int] | None: (начало, конец) текста корневого элемента в content или None,
+            если документ нельзя разобрать быстрым путем (другая кодировка, сущности,
+            CDATA, вложенные элементы, комментарии) - тогда используется ElementTree
+    """
+    declaration = _XML_DECLARATION_ENCODING.match(content)
+    if declaration and declaration.group(1).lower() not in _UTF8_ENCODINGS:
+        return None
+
+    position = 0
+    while True:
+        start = content.find(b'<', position)
+        if start == -1 or start + 1 >= len(content):
+            return None
+        if content[start + 1] not in b'?!':
+            break
+        position = content.find(b'>', start) + 1
+        if position == 0:
+            return None
+
+    start_tag_end = content.find(b'>', start)
+    if start_tag_end == -1 or content[start_tag_end - 1] == ord('/'):
+        return None
+
+    end = content.rfind(b'</')
+    if end <= start_tag_end:
+        return None
+
+    text_start = start_tag_end + 1
+    if content.find(b'<', text_start, end) != -1 or content.find(b'&', text_start, end) != -1:
+        return None
+
+    return text_start, end
+
+
+def decodeXMLResponseContent(content: bytes, loads: Callable[[bytes], Any] = _loadsJSON) -> dict[str, Any]:
+    """Извлекает JSON из текста корневого элемента XML, работая с байтами ответа.
+
+    Быстрый путь: границы текста корневого элемента находятся поиском по байтам,
+    срез байтов (без декодирования в str) передается JSON-парсеру (orjson, если установлен).
+    Документы, которые нельзя разобрать так (кодировка не UTF-8, XML-сущности, CDATA,
+    вложенные элементы), разбираются через ElementTree, как раньше.
+
+    Args:
+        content (bytes): Тело ответа API
+        loads (Callable[[bytes], Any]): Функция разбора JSON (для замеров)
+
+    Returns:
+        dict[str, Any]: Данные из JSON
+
+    Raises:
+        ValueError: Если XML или JSON невалидны или корневой элемент не содержит текста
+    """
+    if content.startswith(_UTF8_BOM):
+        content = content[len(_UTF8_BOM):]
+
+    text_slice = _rootTextSlice(content)
+
+    if text_slice is not None:
+        payload = content[text_slice[0]:text_slice[1]].strip()
+    else:
+        try:
+            root = ET.fromstring(content)
+        except ET.ParseError as ex:
+            raise ValueError(f'Не удалось распарсить XML: {ex}') from ex
+
+        payload = (root.text or '').strip().encode('utf-8')
+
+    if not payload:
+        raise ValueError('Корневой элемент XML не содержит текста')
+
+    try:
+        return loads(payload)
+    except ValueError as ex:
+        raise ValueError(f'Не удалось распарсить JSON из XML: {ex}') from ex
 
 
 def parseXMLResponseToDict(response: requests.Response) -> dict[str, Any]:
     """Парсит XML-ответ от API и извлекает JSON данные, преобразуя их в словарь.
 
     Ожидает, что ответ сервера содержит валидный XML, в теле которого находится
-    JSON-строка. Извлекает JSON из текстового содержимого XML и преобразует его
-    в словарь Python.
+    JSON-строка. Разбор выполняется по байтам ответа (response.content), без
+    определения кодировки и построения дерева XML (см. decodeXMLResponseContent).
 
     Args:
         response (requests.Response): Ответ от сервера в XML формате, где:
-            - response.text должен содержать валидный XML
+            - response.content должен содержать валидный XML
             - Корневой элемент XML должен содержать JSON строку в text-атрибуте
 
     Returns:
@@ -45,17 +153,4 @@ def parseXMLResponseToDict(response: requests.Response) -> dict[str, Any]:
     if not isinstance(response, requests.Response):
         raise TypeError(f'Ожидается requests.Response, получен {type(response).__name__}')
 
-    try:
-        root = ET.fromstring(response.text)
-    except ET.ParseError as ex:
-        raise ValueError(f'Не удалось распарсить XML: {ex}') from ex
-
-    if not root.text:
-        raise ValueError('Корневой элемент XML не содержит текста')
-
-    json_str = root.text.strip()
-
-    try:
-        return json.loads(json_str)
-    except json.JSONDecodeError as ex:
-        raise ValueError(f'Не удалось распарсить JSON из XML: {ex}') from ex
+    return decodeXMLResponseContent(response.content)
@@ -2,8 +2,10 @@ import logging
 
 from PyQt6 import QtWidgets
 
-from tools.configControl import saveAppConfig, saveParserConfig
+from tools.configControl import loadParserListPage, saveAppConfig, scheduleParserConfigSave
 
+from tools.constants import AppConstants
+from tools.listControl import validateListModel
 from tools.tableControl import validateTable
 
 
@@ -22,8 +24,11 @@ def changePage(window: QtWidgets, index: int) -> None:
     Note:
         Перед переходом выполняет:
         1. Валидацию данных на текущей странице
-        2. Сохранение соответствующих настроек
+        2. Сохранение соответствующих настроек (настройки парсера - отложенно,
+           см. scheduleParserConfigSave)
         3. Обновление UI при необходимости
+
+        Таблицы списочных страниц заполняются при первом открытии (см. loadParserListPage)
     """
     if not 0 <= index < window.stackedWidget.count():
         raise ValueError(f'Недопустимый индекс страницы: {index}')
@@ -32,25 +37,26 @@ def changePage(window: QtWidgets, index: int) -> None:
         current_page = window.stackedWidget.currentIndex()
 
         if current_page == 0:
-            saveParserConfig(window)
+            scheduleParserConfigSave(window)
 
         elif current_page == 1:
             if not validateTable(window, window.brandsTable):
                 return
-            saveParserConfig(window)
+            scheduleParserConfigSave(window)
 
         elif current_page in {2, 3}:
-            if not validateTable(
+            if not validateListModel(
                     window,
-                    window.blackListTable if current_page == 2 else window.whiteListTable
+                    window.blackListModel if current_page == 2 else window.whiteListModel
             ):
                 return
-            saveParserConfig(window)
+            scheduleParserConfigSave(window)
             updateTableLabels(window, current_page)
 
         elif current_page == 4:
             saveAppConfig(window)
 
+        loadParserListPage(window, index)
         window.stackedWidget.setCurrentIndex(index)
 
     except Exception as ex:
@@ -76,16 +82,20 @@ def updateTableLabels(window: QtWidgets, index: int) -> None:
     Note:
         - Формат текста метки: "(N записи(-ей))", где N - количество строк в таблице
         - Функция не производит действий для индексов, отличных от 2 или 3
-        - Для получения количества строк используется метод rowCount() соответствующей таблицы
+        - Для получения количества строк используется метод totalRowCount() модели списка
+          (без учета поиска по списку), а если страница еще не открывалась - количество
+          записей в хранилище списков
     """
-    if index == 2:
-        row_count = window.blackListTable.rowCount()
-        window.blackListEntitiesAmountLabel.setText(
-            f'({row_count} {"запись" if row_count == 1 else "записи" if 2 <= row_count <= 4 else "записей"})'
-        )
-
-    elif index == 3:
-        row_count = window.whiteListTable.rowCount()
-        window.whiteListEntitiesAmountLabel.setText(
-            f'({row_count} {"запись" if row_count == 1 else "записи" if 2 <= row_count <= 4 else "записей"})'
-        )
+    if index not in {2, 3}:
+        return
+
+    list_type = AppConstants.LIST_PAGES[index]
+
+    if list_type in window.loaded_list_sections:
+        row_count = getattr(window, f'{list_type}Model').totalRowCount()
+    else:
+        row_count = window.list_storage.countPairs(list_type)
+
+    getattr(window, f'{list_type}EntitiesAmountLabel').setText(
+        f'({row_count} {"запись" if row_count == 1 else "записи" if 2 <= row_count <= 4 else "записей"})'
+    )
@@ -1,6 +1,8 @@
 import json
 import logging
 import os
+import sqlite3
+import tempfile
 
 from typing import Literal, Any
 
@@ -8,7 +10,8 @@ from PyQt6 import QtWidgets
 from PyQt6.QtWidgets import QMessageBox
 
 from tools.constants import AppConstants
-from tools.dataConvert import dictToTable, arrayToTable, tableToDict, tableToArray
+from tools.dataConvert import dictToTable, tableToDict
+from tools.logControl import setLogLevel
 
 
 def _create_default_config(config_type: Literal['app', 'parser'], username: str) -> dict[str, Any]:
@@ -24,7 +27,12 @@ def _create_default_config(config_type: Literal['app', 'parser'], username: str)
         'app': {
             'savePath': '',
             'fastExport': 'True',
-            'timeDelay': 5
+            'timeDelay': 5,
+            'logLevel': AppConstants.DEFAULT_LOG_LEVEL,
+            'exportFormat': AppConstants.DEFAULT_EXPORT_FORMAT,
+            'streamExport': 'False',
+            'exportSplit': AppConstants.DEFAULT_EXPORT_SPLIT,
+            'diffThreshold': AppConstants.DIFF_PRICE_THRESHOLD
         },
         'parser': {
             'regionCode': 1,
@@ -38,10 +46,7 @@ def _create_default_config(config_type: Literal['app', 'parser'], username: str)
             'isStoreRatingLimit': 'False',
             'storeRatingLimit': 1,
             'useBlackList': 'False',
-            'useWhiteList': 'False',
-            'brandsList': {},
-            'blackList': [],
-            'whiteList': []
+            'useWhiteList': 'False'
         }
     }
 
@@ -68,6 +73,9 @@ def loadAppConfig(window: QtWidgets) -> dict[str, Any]:
     - Устанавливает путь сохранения
     - Настраивает чекбокс быстрого экспорта
     - Устанавливает задержку между запросами
+    - Устанавливает уровень логирования
+    - Устанавливает формат файла результатов, потоковую запись и разбиение Excel
+    - Устанавливает порог изменения цены для сравнения запусков
 
     Args
         window (QtWidgets.QWidget): Родительское окно для диалоговых сообщений.
@@ -78,11 +86,19 @@ def loadAppConfig(window: QtWidgets) -> dict[str, Any]:
             - savePath (str): Путь для сохранения файлов
             - fastExport (bool): Флаг быстрого экспорта
             - timeDelay (int): Задержка между запросами (сек)
+            - logLevel (str): Уровень логирования
+            - exportFormat (str): Формат файла результатов (ключ AppConstants.EXPORT_FORMATS)
+            - streamExport (bool): Флаг записи результатов в файл во время парсинга
+            - exportSplit (str): Разбиение Excel на листы (ключ AppConstants.EXPORT_SPLIT_MODES)
+            - diffThreshold (int): Порог изменения цены при сравнении запусков (%)
 
     Side effects:
         - Обновляет placeholder поля standardSavePathInput
         - Устанавливает состояние fastExportCheckBox
         - Устанавливает значение timeDelaySpinBox
+        - Устанавливает значение logLevelComboBox и уровень логирования
+        - Устанавливает значение exportFormatComboBox, exportSplitComboBox и состояние streamExportCheckBox
+        - Устанавливает значение diffThresholdSpinBox
         - Обновляет текст statusLabel
     """
     app_config = loadConfig(window, 'app')
@@ -97,6 +113,26 @@ def loadAppConfig(window: QtWidgets) -> dict[str, Any]:
         window.timeDelaySpinBox.setValue(
             int(app_config.get('timeDelay', 1))
         )
+        window.logLevelComboBox.setCurrentText(
+            str(app_config.get('logLevel', AppConstants.DEFAULT_LOG_LEVEL)).upper()
+        )
+        setLogLevel(window.logLevelComboBox.currentText())
+
+        export_format = app_config.get('exportFormat', AppConstants.DEFAULT_EXPORT_FORMAT)
+        if export_format not in AppConstants.EXPORT_FORMATS:
+            export_format = AppConstants.DEFAULT_EXPORT_FORMAT
+        window.exportFormatComboBox.setCurrentIndex(list(AppConstants.EXPORT_FORMATS).index(export_format))
+        window.streamExportCheckBox.setChecked(
+            str(app_config.get('streamExport', 'False')).lower() == 'true'
+        )
+
+        export_split = app_config.get('exportSplit', AppConstants.DEFAULT_EXPORT_SPLIT)
+        if export_split not in AppConstants.EXPORT_SPLIT_MODES:
+            export_split = AppConstants.DEFAULT_EXPORT_SPLIT
+        window.exportSplitComboBox.setCurrentIndex(list(AppConstants.EXPORT_SPLIT_MODES).index(export_split))
+        window.diffThresholdSpinBox.setValue(
+            int(app_config.get('diffThreshold', AppConstants.DIFF_PRICE_THRESHOLD))
+        )
 
         window.statusLabel.setText('Конфиг приложения успешно загружен')
         return app_config
@@ -113,7 +149,11 @@ def loadParserConfig(window: QtWidgets) -> dict[str, Any]:
     - Настраивает параметры доставки и наличия
     - Устанавливает ограничения по рейтингу
     - Применяет черный/белый списки
-    - Заполняет соответствующие таблицы
+    - Загружает замены брендов из хранилища списков (window.list_storage)
+
+    Таблицы списков при запуске не заполняются - это делает loadParserListPage
+    при первом открытии соответствующей страницы. Если JSON-конфиг еще содержит списки
+    (старый формат), они однократно переносятся в хранилище, а конфиг перезаписывается без них.
 
     Args
         window (QtWidgets.QWidget): Родительское окно для диалоговых сообщений.
@@ -129,11 +169,18 @@ def loadParserConfig(window: QtWidgets) -> dict[str, Any]:
     Side effects:
         - Обновляет состояние чекбоксов (deliveryDateCheckBox и др.)
         - Устанавливает значения спинбоксов (rateSpinBox и др.)
-        - Заполняет таблицы (brandsTable, blackListTable, whiteListTable)
+        - Заполняет parser_config['brandsList'] (используется при парсинге)
         - Обновляет текст statusLabel
     """
     parser_config = loadConfig(window, 'parser')
 
+    try:
+        if window.list_storage.migrateFromConfig(parser_config):
+            saveConfig(window, parser_config, 'parser')
+    except sqlite3.Error as ex:
+        logging.exception(f'Ошибка переноса списков в {window.list_storage.path}: {ex}')
+        QMessageBox.critical(window, 'Ошибка', f'Не удалось перенести списки парсера в базу\n{str(ex)}')
+
     try:
         window.deliveryDateCheckBox.setChecked(
             str(parser_config.get('isDeliveryDateLimit', 'False')).lower() == 'true'
@@ -159,9 +206,7 @@ def loadParserConfig(window: QtWidgets) -> dict[str, Any]:
         window.whiteListCheckBox.setChecked(
             str(parser_config.get('useWhiteList', 'False')).lower() == 'true'
         )
-        dictToTable(parser_config.get('brandsList', {}), window.brandsTable)
-        arrayToTable(parser_config.get('blackList', []), window.blackListTable)
-        arrayToTable(parser_config.get('whiteList', []), window.whiteListTable)
+        parser_config['brandsList'] = window.list_storage.loadBrands()
 
         window.statusLabel.setText('--Загрузка конфига парсера прошла успешно--')
         return parser_config
@@ -171,6 +216,61 @@ def loadParserConfig(window: QtWidgets) -> dict[str, Any]:
         return {}
 
 
+def loadParserListPage(window: QtWidgets, index: int) -> None:
+    """Заполняет таблицу списочной страницы данными из хранилища при первом ее открытии.
+
+    Повторные вызовы для уже заполненной страницы ничего не делают, поэтому время запуска
+    приложения не зависит от размера списков.
+
+    Args:
+        window (QtWidgets.QWidget): Главное окно приложения.
+        index (int): Индекс открываемой страницы (1 - замены брендов, 2 - черный список,
+            3 - белый список). Для остальных страниц функция ничего не делает.
+
+    Side effects:
+        - Заполняет brandsTable или модель списка (blackListModel, whiteListModel)
+        - Добавляет раздел в window.loaded_list_sections
+    """
+    section = AppConstants.LIST_PAGES.get(index)
+
+    if section is None or section in window.loaded_list_sections:
+        return
+
+    try:
+        if section == 'brandsList':
+            dictToTable(window.parser_config.get('brandsList', {}), window.brandsTable)
+        else:
+            model = getattr(window, f'{section}Model')
+            model.setPairs(window.list_storage.loadPairs(section))
+            model.clearChanges()
+    except sqlite3.Error as ex:
+        logging.exception(f'Ошибка загрузки списка {section}: {ex}')
+        QMessageBox.warning(window, 'Ошибка', f'Не удалось загрузить список\n{str(ex)}')
+        return
+
+    window.parser_config_dirty.discard(section)
+    window.loaded_list_sections.add(section)
+
+
+def parserListPairs(window: QtWidgets, list_type: str) -> set[tuple[str, str]]:
+    """Возвращает пары Бренд - Магазин черного/белого списка для парсинга.
+
+    Если страница списка уже открывалась, используется модель (с несохраненными правками),
+    иначе пары читаются напрямую из хранилища без заполнения таблицы.
+
+    Args:
+        window (QtWidgets.QWidget): Главное окно приложения.
+        list_type (str): 'blackList' или 'whiteList'
+
+    Returns:
+        set[tuple[str, str]]: Множество пар (бренд, магазин)
+    """
+    if list_type in window.loaded_list_sections:
+        return getattr(window, f'{list_type}Model').pairSet()
+
+    return set(window.list_storage.loadPairs(list_type))
+
+
 def loadConfig(window: QtWidgets, config_type: Literal['app', 'parser']) -> dict[str, Any]:
     """Загружает конфигурацию из JSON-файла и возвращает как словарь.
 
@@ -220,6 +320,11 @@ def saveAppConfig(window: QtWidgets) -> None:
     - Путь для сохранения файлов (standardSavePathInput)
     - Настройку быстрого экспорта (fastExportCheckBox)
     - Задержку между запросами (timeDelaySpinBox)
+    - Уровень логирования (logLevelComboBox)
+    - Формат файла результатов (exportFormatComboBox)
+    - Потоковую запись результатов (streamExportCheckBox)
+    - Разбиение Excel на листы (exportSplitComboBox)
+    - Порог изменения цены для сравнения запусков (diffThresholdSpinBox)
 
     Args
         window (QtWidgets.QWidget): Родительское окно для диалоговых сообщений.
@@ -239,7 +344,12 @@ def saveAppConfig(window: QtWidgets) -> None:
     current_config = {
         'savePath': window.standardSavePathInput.text().strip() or window.app_config['savePath'],
         'fastExport': str(window.fastExportCheckBox.isChecked()),
-        'timeDelay': window.timeDelaySpinBox.value()
+        'timeDelay': window.timeDelaySpinBox.value(),
+        'logLevel': window.logLevelComboBox.currentText(),
+        'exportFormat': list(AppConstants.EXPORT_FORMATS)[window.exportFormatComboBox.currentIndex()],
+        'streamExport': str(window.streamExportCheckBox.isChecked()),
+        'exportSplit': list(AppConstants.EXPORT_SPLIT_MODES)[window.exportSplitComboBox.currentIndex()],
+        'diffThreshold': window.diffThresholdSpinBox.value()
     }
 
     if current_config != window.app_config:
@@ -249,30 +359,81 @@ def saveAppConfig(window: QtWidgets) -> None:
             window.standardSavePathInput.setPlaceholderText(current_config['savePath'])
             window.standardSavePathInput.clear()
 
+        setLogLevel(current_config['logLevel'])
         saveConfig(window, window.app_config, 'app')
         window.statusLabel.setText('Настройки приложения сохранены')
 
 
+def markParserConfigDirty(window: QtWidgets, section: str) -> None:
+    """Отмечает раздел конфига парсера как измененный.
+
+    Args:
+        window (QtWidgets.QWidget): Главное окно приложения.
+        section (str): Списочный раздел конфига ('brandsList', 'blackList' или 'whiteList')
+    """
+    window.parser_config_dirty.add(section)
+
+
+def trackParserConfigChanges(window: QtWidgets) -> None:
+    """Подключает отслеживание изменений списков конфига парсера.
+
+    Каждый список помечается измененным при любом изменении данных, поэтому при сохранении
+    в хранилище записываются только измененные списки. Первичное заполнение таблиц
+    (loadParserListPage) изменением не считается.
+
+    Args:
+        window (QtWidgets.QWidget): Главное окно приложения.
+    """
+    brands_model = window.brandsTable.model()
+
+    window.brandsTable.itemChanged.connect(lambda: markParserConfigDirty(window, 'brandsList'))
+    brands_model.rowsInserted.connect(lambda: markParserConfigDirty(window, 'brandsList'))
+    brands_model.rowsRemoved.connect(lambda: markParserConfigDirty(window, 'brandsList'))
+
+    window.blackListModel.contentChanged.connect(lambda: markParserConfigDirty(window, 'blackList'))
+    window.whiteListModel.contentChanged.connect(lambda: markParserConfigDirty(window, 'whiteList'))
+
+
+def scheduleParserConfigSave(window: QtWidgets) -> None:
+    """Откладывает сохранение конфига парсера (debounce).
+
+    Каждый вызов перезапускает таймер parser_config_save_timer, поэтому при быстрой
+    навигации по страницам конфиг записывается один раз, спустя
+    AppConstants.CONFIG_SAVE_DELAY мс после последнего вызова.
+
+    Args:
+        window (QtWidgets.QWidget): Главное окно приложения.
+    """
+    window.parser_config_save_timer.start()
+
+
 def saveParserConfig(window: QtWidgets) -> None:
-    """Сохраняет текущие настройки парсера в конфигурационный файл.
+    """Сохраняет измененные настройки парсера в конфигурационный файл.
 
     Собирает данные из всех связанных UI элементов:
     - Настройки доставки и наличия
     - Ограничения по рейтингу магазинов
     - Использование черного/белого списков
-    - Данные из таблиц (brandsList, blackList, whiteList)
+    - Данные из таблицы замены брендов и моделей списков (brandsList, blackList, whiteList)
+
+    Скалярные настройки сравниваются с текущим конфигом и записываются в JSON-файл.
+    Списки, помеченные измененными (parser_config_dirty), записываются в хранилище
+    списков (window.list_storage) по разнице с предыдущим сохранением.
 
     Args
         window (QtWidgets.QWidget): Родительское окно для диалоговых сообщений.
             Должно быть виджетом из QtWidgets для корректного отображения QMessageBox.
 
     Returns:
-        None: Сохраняет изменения в файл через saveConfig()
+        None: Сохраняет изменения в файл через saveConfig() и в базу через _saveParserLists()
 
     Side effects:
-        - Обновляет данные в таблицах (brandsTable, blackListTable, whiteListTable)
+        - Останавливает отложенное сохранение (parser_config_save_timer)
+        - Очищает parser_config_dirty (списки, которые не удалось записать, остаются отмеченными)
         - Устанавливает статус в statusLabel
     """
+    window.parser_config_save_timer.stop()
+
     new_config = {
         'regionCode': 1,
         'requestType': 5,
@@ -285,19 +446,90 @@ def saveParserConfig(window: QtWidgets) -> None:
         'isStoreRatingLimit': str(window.rateCheckBox.isChecked()),
         'storeRatingLimit': window.rateSpinBox.value(),
         'useBlackList': str(window.blackListCheckBox.isChecked()),
-        'useWhiteList': str(window.whiteListCheckBox.isChecked()),
-        'brandsList': tableToDict(window.brandsTable),
-        'blackList': tableToArray(window.blackListTable),
-        'whiteList': tableToArray(window.whiteListTable)
+        'useWhiteList': str(window.whiteListCheckBox.isChecked())
     }
+    config_changed = any(window.parser_config.get(key) != value for key, value in new_config.items())
+    lists_saved = _saveParserLists(window)
 
-    if new_config != window.parser_config:
+    if config_changed:
         window.parser_config.update(new_config)
-        saveConfig(window, window.parser_config, 'parser')
+        saveConfig(window, _scalarConfig(window.parser_config), 'parser')
+
+    if config_changed or lists_saved:
         window.statusLabel.setText('Настройки парсера сохранены')
 
 
-def saveConfig(window: QtWidgets, config: dict[str, Any], config_type: Literal['app', 'parser']) -> None:
+def _scalarConfig(config: dict[str, Any]) -> dict[str, Any]:
+    """Возвращает конфиг парсера без списков (списки хранятся в базе, а не в JSON)."""
+    return {key: value for key, value in config.items() if key not in AppConstants.PARSER_LIST_SECTIONS}
+
+
+def _saveParserLists(window: QtWidgets) -> bool:
+    """Записывает измененные списки парсера в хранилище списков.
+
+    Замены брендов сравниваются с последними сохраненными (parser_config['brandsList']),
+    для черного/белого списков используется журнал изменений модели.
+
+    Args:
+        window (QtWidgets.QWidget): Главное окно приложения.
+
+    Returns:
+        bool: True если был записан хотя бы один список
+    """
+    saved = False
+
+    for section in sorted(window.parser_config_dirty):
+        try:
+            if section == 'brandsList':
+                brands = tableToDict(window.brandsTable)
+                window.list_storage.saveBrands(window.parser_config.get('brandsList', {}), brands)
+                window.parser_config['brandsList'] = brands
+            else:
+                model = getattr(window, f'{section}Model')
+                window.list_storage.applyPairChanges(section, *model.pendingChanges())
+                model.clearChanges()
+        except sqlite3.Error as ex:
+            error_msg = f'Ошибка сохранения списка {section}: {str(ex)}'
+            logging.exception(error_msg)
+            QMessageBox.critical(window, 'Ошибка сохранения', error_msg)
+            continue
+
+        window.parser_config_dirty.discard(section)
+        saved = True
+
+    if saved:
+        logging.info('Списки парсера успешно сохранены')
+
+    return saved
+
+
+def _writeFileAtomic(path: str, text: str) -> None:
+    """Записывает текст в файл атомарно: во временный файл рядом, затем os.replace.
+
+    При сбое во время записи исходный файл остается нетронутым.
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_', suffix='.json')
+
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def saveConfig(
+        window: QtWidgets,
+        config: dict[str, Any],
+        config_type: Literal['app', 'parser']
+) -> None:
     """Сохраняет конфигурацию в соответствующий JSON-файл.
 
     Args:
@@ -311,14 +543,14 @@ def saveConfig(window: QtWidgets, config: dict[str, Any], config_type: Literal['
         IOError: При проблемах с записью на диск
 
     Note:
+        Файл записывается атомарно (временный файл + переименование).
         В случае ошибки показывает QMessageBox с описанием проблемы
         и сохраняет детали в лог
     """
     config_path = f'configs/{window.username}/' + AppConstants.CONFIG_FILES[config_type]
 
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4, ensure_ascii=False)
+        _writeFileAtomic(config_path, json.dumps(config, indent=4, ensure_ascii=False))
         logging.info(f'Конфиг {config_type} успешно сохранён')
     except PermissionError:
         error_msg = f'Нет прав для записи в {config_path}'
@@ -2,6 +2,7 @@ class AppConstants:
     COLUMNS = {
         'SEARCH': ['Производитель', 'Артикул'],
         'LISTS': ['Бренд', 'Магазин'],
+        'ERRORS': ['Производитель', 'Артикул', 'Код ошибки', 'Причина', 'Попыток'],
         'RESULT': [
             'Бренд', 'Артикул', 'Мин НАЛИЧИЕ', 'Сред НАЛИЧИЕ',
             'Макс НАЛИЧИЕ', 'Мин ПОД ЗАКАЗ', 'Сред ПОД ЗАКАЗ',
@@ -12,4 +13,45 @@ class AppConstants:
         'app': 'appConfig.json',
         'parser': 'parserConfig.json'
     }
+    LISTS_DATABASE = 'parserLists.sqlite3'
+    PARSER_LIST_SECTIONS = ('brandsList', 'blackList', 'whiteList')
+    LIST_PAGES = {1: 'brandsList', 2: 'blackList', 3: 'whiteList'}
     API_TIMEOUT = 10
+    PROGRESS_REFRESH_INTERVAL = 0.2
+    CONFIG_SAVE_DELAY = 1000
+    RESIZE_CONTENTS_PRECISION = 100
+    LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+    DEFAULT_LOG_LEVEL = 'DEBUG'
+    LOG_MAX_BYTES = 5 * 1024 * 1024
+    LOG_BACKUP_COUNT = 5
+    METRICS_FILES_COUNT = 10
+    PROFILE_FILES_COUNT = 5
+    RUN_HISTORY_COUNT = 50
+    RUN_HISTORY_POPUP_WIDTH = 320
+    DIFF_PRICE_THRESHOLD = 5
+    PRICE_HISTORY_DATABASE = 'priceHistory.sqlite3'
+    PRICE_HISTORY_MONTHS = 24
+    PRICE_HISTORY_FLUSH_ROWS = 5000
+    PRICE_HISTORY_DAYS = 30
+    PROFILE_TOP_COUNT = 30
+    PROFILE_TRACEMALLOC_FRAMES = 5
+    EXPORT_PROGRESS_ROWS = 1000
+    EXPORT_FORMATS = {
+        'xlsx': 'Excel (*.xlsx)',
+        'csv': 'CSV (*.csv)',
+        'parquet': 'Parquet (*.parquet)',
+        'jsonl': 'JSON Lines (*.jsonl)'
+    }
+    DEFAULT_EXPORT_FORMAT = 'xlsx'
+    CSV_SEPARATOR = ';'
+    STREAM_FLUSH_ROWS = 100
+    STREAM_FLUSH_INTERVAL = 5
+    MISSING_DATA_MARKERS = ('Данные отсутствуют', 'Больше данных нет')
+    COLUMN_WIDTH_SAMPLE_ROWS = 5000
+    EXCEL_MAX_ROWS = 1_048_576
+    EXPORT_SHEET_CELLS = 10_000_000
+    EXPORT_FILE_CELLS = 20_000_000
+    EXPORT_MAX_SHEETS_PER_FILE = 250
+    EXPORT_MAX_PROCESSES = 4
+    EXPORT_SPLIT_MODES = {'rows': 'По размеру', 'brand': 'По брендам'}
+    DEFAULT_EXPORT_SPLIT = 'rows'
@@ -1,8 +1,12 @@
-import pandas as pd
+from typing import Any, TYPE_CHECKING
 
-from typing import Any
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QTableView
 
-from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem
+from tools.constants import AppConstants
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def tableToArray(table: QTableWidget) -> list[list[str]]:
@@ -215,29 +219,31 @@ def dictToTable(data: dict[str, Any], table: QTableWidget) -> None:
         table.setItem(row, 1, value_item)
 
 
-def tableFromDataframe(table: QTableWidget, data: pd.DataFrame) -> None:
-    """Заполняет QTableWidget данными из pandas DataFrame с автоматической настройкой заголовков.
+def tableFromDataframe(table: QTableView, data: 'pd.DataFrame') -> None:
+    """Выводит pandas DataFrame в QTableView через ResultsTableModel.
+
+    Заменяет модель таблицы новой ResultsTableModel, которая хранит данные DataFrame
+    и предварительно построенный индекс для поиска и фильтрации (ResultsIndex).
+    Элементы таблицы не создаются: представление запрашивает у модели только видимые ячейки.
+    NaN/None значения отображаются пустыми строками.
 
-    Полностью заменяет содержимое таблицы данными из DataFrame, включая:
-    - Установку соответствующего количества строк и столбцов
-    - Перенос заголовков столбцов DataFrame
-    - Автоматическое преобразование значений в строки
-    - Обработку NaN/None значений (преобразуются в пустые строки)
-    - Автоматическую подгонку ширины столбцов под содержимое
+    pandas и модель результатов импортируются при первом вызове, а не при запуске приложения.
 
     Args:
-        table (QTableWidget): Целевая таблица Qt для заполнения. Существующее содержимое
-            будет полностью очищено перед заполнением.
-        data (pd.DataFrame): DataFrame для переноса в таблицу. Должен содержать:
-            - Заголовки столбцов (для переноса в горизонтальные заголовки таблицы)
-            - Данные, поддерживающие преобразование в строки
+        table (QTableView): Целевая таблица Qt. Предыдущая модель будет заменена.
+        data (pd.DataFrame): DataFrame для вывода в таблицу. Заголовки столбцов
+            переносятся в горизонтальные заголовки таблицы.
 
     Returns:
         None: Метод модифицирует переданную таблицу напрямую.
 
     Raises:
         TypeError: Если входные данные не являются pandas DataFrame
-        ValueError: Если DataFrame пуст или содержит несовместимые данные
+
+    Note:
+        Пустой DataFrame тоже выводится (таблица без строк), чтобы в таблице не оставались
+        прежние результаты. Колонки результата (AppConstants.COLUMNS['RESULT']) должны быть
+        в DataFrame и в этом случае - по ним строится индекс поиска.
 
     Examples:
         >>> df = pd.DataFrame({
@@ -245,35 +251,26 @@ def tableFromDataframe(table: QTableWidget, data: pd.DataFrame) -> None:
         ...     'Age': [25, 30, pd.NA],
         ...     'Score': [4.5, 3.8, 5.0]
         ... })
-        >>> table = QTableWidget()
+        >>> table = QTableView()
         >>> tableFromDataframe(table, df)
-        >>> table.rowCount()
+        >>> table.model().rowCount()
         3
-        >>> table.columnCount()
-        3
-        >>> table.horizontalHeaderItem(0).text()
+        >>> table.model().headerData(0, Qt.Orientation.Horizontal)
         'Name'
-        >>> table.item(2, 0).text()
-        ''
     """
-    if not isinstance(data, pd.DataFrame):
-        raise TypeError(f'Ожидается pandas DataFrame, получен {type(data).__name__}')
-    if data.empty:
-        raise ValueError('DataFrame не должен быть пустым')
+    import pandas as pd
 
-    table.clear()
+    from tools.resultsModel import ResultsTableModel
 
-    n_rows, n_cols = data.shape
-    table.setRowCount(n_rows)
-    table.setColumnCount(n_cols)
+    if not isinstance(data, pd.DataFrame):
+        raise TypeError(f'Ожидается pandas DataFrame, получен {type(data).__name__}')
 
-    table.setHorizontalHeaderLabels(data.columns.tolist())
+    previous_model = table.model()
 
-    for i in range(n_rows):
-        for j in range(n_cols):
-            value = data.iloc[i, j]
-            item_value = str(value) if not pd.isna(value) else ""
-            item = QTableWidgetItem(item_value)
-            table.setItem(i, j, item)
+    table.setModel(ResultsTableModel(data, table))
+    table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+    table.horizontalHeader().setResizeContentsPrecision(AppConstants.RESIZE_CONTENTS_PRECISION)
+    table.resizeColumnsToContents()
 
-    table.resizeColumnsToContents()
\ No newline at end of file
+    if previous_model is not None:
+        previous_model.deleteLater()
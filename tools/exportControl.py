@@ -1,26 +1,307 @@
+import concurrent.futures
 import logging
 import datetime
+import importlib.util
+import json
+import multiprocessing
+import os
+import re
+import time
 
-import pandas as pd
-
-from typing import Literal
+from typing import Any, Literal, Optional, TYPE_CHECKING
 
 from PyQt6 import QtWidgets
-from PyQt6.QtWidgets import QMessageBox, QTableWidget, QFileDialog
+from PyQt6.QtWidgets import QMessageBox, QTableView, QFileDialog
 
 from tools.constants import AppConstants
+from tools.exportWorker import ExportJob, ProgressCallback, startExportJob
+from tools.runDiff import DIFF_COLUMNS, compareRuns, formatRunDiffSummary, runDiffRows
+from tools.runHistory import jsonDefault, loadRun
+from tools.runReport import runReportRows
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import xlsxwriter
+
+
+EXPORT_STYLES = {
+    'list_header': {'bold': True, 'border': 1, 'bg_color': '#607ebc', 'font_color': '#faf5ee', 'align': 'center'},
+    'result_header_text': {'text_wrap': True, 'valign': 'vcenter', 'border': 1, 'bold': True, 'font_size': 12},
+    'result_header_colored': {
+        'text_wrap': True, 'valign': 'vcenter', 'border': 1, 'bold': True, 'font_size': 12,
+        'bg_color': '#607ebc', 'font_color': '#faf5ee', 'align': 'right'
+    },
+    'result_header_numeric': {
+        'text_wrap': True, 'valign': 'vcenter', 'border': 1, 'bold': True, 'font_size': 12, 'align': 'right'
+    },
+    'result_text': {'text_wrap': True, 'valign': 'vcenter', 'border': 1, 'font_size': 10},
+    'result_numeric': {'text_wrap': True, 'valign': 'vcenter', 'border': 1, 'font_size': 10, 'align': 'right'},
+    'missing_data': {'font_color': 'red', 'bold': True},
+    'blank': {'border': 1},
+    'link': {'text_wrap': True, 'valign': 'vcenter', 'border': 1, 'font_size': 10, 'font_color': 'blue', 'underline': 1}
+}
+
+LIST_SHEET_NAME = 'Sheet1'
+RESULT_SHEET_NAME = 'Проценка товаров'
+REPORT_SHEET_NAME = 'Отчет о запуске'
+REPORT_SIDECAR_SUFFIX = '.report.json'
+DIFF_SHEET_NAME = 'Изменения'
+DIFF_SUMMARY_SHEET_NAME = 'Сводка'
+DIFF_TEXT_COLUMNS = ('Бренд', 'Артикул', 'Изменения', 'Наличие', 'Новые магазины', 'Ушедшие магазины', 'Цены магазинов')
+INDEX_SHEET_NAME = 'Содержание'
+RESULT_BRAND_COLUMN = 'Бренд'
+RESULT_ARTICLE_COLUMN = 'Артикул'
+
+RESULT_COLORED_COLUMNS = (
+    'Мин НАЛИЧИЕ', 'Сред НАЛИЧИЕ', 'Макс НАЛИЧИЕ',
+    'Мин ПОД ЗАКАЗ', 'Сред ПОД ЗАКАЗ', 'Макс ПОД ЗАКАЗ'
+)
+RESULT_NUMERIC_PATTERNS = (
+    'Цена магазина',
+    'Кол-во магазина',
+    'Кол-во дней доставки магазина'
+)
+
+RESULT_HEADER_STYLES = {
+    'text': 'result_header_text',
+    'colored': 'result_header_colored',
+    'numeric': 'result_header_numeric'
+}
+RESULT_DATA_STYLES = {
+    'text': 'result_text',
+    'colored': 'result_numeric',
+    'numeric': 'result_numeric'
+}
+
+
+class FormatRegistry:
+    """Форматы книги xlsxwriter по именам стилей EXPORT_STYLES.
+
+    Формат xlsxwriter принадлежит книге, поэтому реестр создается на каждую книгу,
+    а каждый стиль добавляется в нее один раз - при первом обращении.
+
+    Args:
+        workbook (xlsxwriter.Workbook): Книга
+
+    Examples:
+        >>> formats = FormatRegistry(workbook)
+        >>> worksheet.write_string(0, 0, 'Бренд', formats['list_header'])
+    """
+
+    def __init__(self, workbook: 'xlsxwriter.Workbook'):
+        self.workbook = workbook
+        self._formats: dict[str, Any] = {}
+
+    def __getitem__(self, style: Optional[str]) -> Any:
+        """Возвращает формат стиля (None для None - ячейка без оформления)."""
+        if style is None:
+            return None
+
+        cell_format = self._formats.get(style)
+        if cell_format is None:
+            cell_format = self._formats[style] = self.workbook.add_format(EXPORT_STYLES[style])
+
+        return cell_format
+
+
+def columnWidths(data: 'pd.DataFrame', sample_rows: int = AppConstants.COLUMN_WIDTH_SAMPLE_ROWS) -> list[float]:
+    """Рассчитывает ширину колонок листа по длине значений и заголовков.
+
+    Длина строк берется через .str.len() без промежуточного astype(str) (копии колонки),
+    строковое представление строится только для нестроковых значений. Для больших таблиц
+    длина считается по выборке из sample_rows строк, равномерно распределенных по таблице
+    (включая первую), поэтому ширина редкого длинного значения может быть занижена.
+
+    Args:
+        data (pd.DataFrame): Данные
+        sample_rows (int): Максимум строк для расчета
+
+    Returns:
+        list[float]: Ширина каждой колонки: min(50, (длина + 2) * 1.1)
+    """
+    if len(data) > sample_rows:
+        data = data.iloc[::-(-len(data) // sample_rows)]
+
+    widths = []
+
+    for col, column in enumerate(data.columns):
+        max_len = len(str(column))
+
+        try:
+            values = data.iloc[:, col]
+            lengths = values.str.len() if values.dtype == object or values.dtype == 'str' else None
+
+            if lengths is None:
+                lengths = values.astype(str).str.len()
+            else:
+                others = values[lengths.isna() & values.notna()]
+                if not others.empty:
+                    max_len = max(max_len, max(len(str(value)) for value in others))
+
+            if not lengths.empty and lengths.max() == lengths.max():
+                max_len = max(max_len, int(lengths.max()))
+        except Exception as ex:
+            logging.warning(f"Ошибка в столбце {column}: {str(ex)}")
+
+        widths.append(min(50, (max_len + 2) * 1.1))
+
+    return widths
+
+
+def writeTableRow(worksheet: 'xlsxwriter.worksheet.Worksheet', row: int, values: Any, column_formats: list) -> None:
+    """Записывает одну строку таблицы в лист, каждую ячейку с форматом ее колонки.
+
+    Тип значения проверяется напрямую, без общего worksheet.write (он проверяет строку
+    регулярными выражениями на ссылки и формулы). Пустые строки, None и NaN не записываются:
+    оформление пустых ячеек задается условным форматированием (см. addResultConditionalFormats).
+
+    Args:
+        worksheet: Лист xlsxwriter
+        row (int): Номер строки листа
+        values (Any): Значения ячеек строки (по колонкам)
+        column_formats (list): Формат xlsxwriter для каждой колонки
+    """
+    for col, value in enumerate(values):
+        value_type = value.__class__
+
+        if value_type is str:
+            if value:
+                worksheet.write_string(row, col, value, column_formats[col])
+        elif value_type is float or value_type is int:
+            if value == value:
+                worksheet.write_number(row, col, value, column_formats[col])
+        elif value is not None:
+            worksheet.write(row, col, value, column_formats[col])
+
+
+def writeDataframeRows(worksheet: 'xlsxwriter.worksheet.Worksheet', data: 'pd.DataFrame',
+                       column_formats: list, first_row: int = 1, progress: Optional[ProgressCallback] = None) -> None:
+    """Записывает строки DataFrame в лист (см. writeTableRow).
+
+    Строки записываются по порядку, поэтому функция подходит для режима constant_memory.
+
+    Args:
+        worksheet: Лист xlsxwriter
+        data (pd.DataFrame): Данные
+        column_formats (list): Формат xlsxwriter для каждой колонки
+        first_row (int): Номер строки листа для первой строки данных
+        progress (Optional[ProgressCallback]): Вызывается каждые AppConstants.EXPORT_PROGRESS_ROWS
+            строк с (записано строк, всего строк)
+    """
+    rows = zip(*(data.iloc[:, col].tolist() for col in range(data.shape[1])))
+    total = len(data)
+    progress_step = AppConstants.EXPORT_PROGRESS_ROWS
+
+    for row, values in enumerate(rows, start=first_row):
+        if progress is not None and (row - first_row) % progress_step == 0:
+            progress(row - first_row, total)
+
+        writeTableRow(worksheet, row, values, column_formats)
+
+    if progress is not None:
+        progress(total, total)
+
 
+def writeTableHeader(worksheet: 'xlsxwriter.worksheet.Worksheet', columns: list[str],
+                     header_formats: list, widths: list[float]) -> None:
+    """Задает ширину колонок, закрепляет первую строку и записывает заголовок.
 
-def exportListExcelFile(window: QtWidgets, table: QTableWidget, table_type: Literal['black', 'white']) -> None:
+    Args:
+        worksheet: Лист xlsxwriter
+        columns (list[str]): Заголовки колонок
+        header_formats (list): Формат заголовка каждой колонки
+        widths (list[float]): Ширина каждой колонки (см. columnWidths)
+    """
+    for col, width in enumerate(widths):
+        worksheet.set_column(col, col, width)
+
+    worksheet.freeze_panes(1, 0)
+    for col, column in enumerate(columns):
+        worksheet.write_string(0, col, str(column), header_formats[col])
+
+
+def writeTableSheet(
+        workbook: 'xlsxwriter.Workbook',
+        formats: FormatRegistry,
+        sheet_name: str,
+        data: 'pd.DataFrame',
+        header_styles: list[str],
+        data_styles: list[Optional[str]],
+        progress: Optional[ProgressCallback] = None
+) -> 'xlsxwriter.worksheet.Worksheet':
+    """Добавляет в книгу лист с таблицей: ширина колонок, заголовок и строки данных.
+
+    Args:
+        workbook (xlsxwriter.Workbook): Книга
+        formats (FormatRegistry): Форматы книги
+        sheet_name (str): Название листа
+        data (pd.DataFrame): Данные
+        header_styles (list[str]): Стиль заголовка каждой колонки (ключи EXPORT_STYLES)
+        data_styles (list[Optional[str]]): Стиль данных каждой колонки (None - без оформления)
+        progress (Optional[ProgressCallback]): Обратный вызов прогресса записи строк (см. ExportWorker)
+
+    Returns:
+        xlsxwriter.worksheet.Worksheet: Записанный лист
+    """
+    worksheet = workbook.add_worksheet(sheet_name)
+
+    writeTableHeader(worksheet, list(data.columns), [formats[style] for style in header_styles], columnWidths(data))
+    writeDataframeRows(worksheet, data, [formats[style] for style in data_styles], progress=progress)
+
+    return worksheet
+
+
+def writeTableWorkbook(
+        file_path: str,
+        data: 'pd.DataFrame',
+        sheet_name: str,
+        header_styles: list[str],
+        data_styles: list[Optional[str]],
+        progress: Optional[ProgressCallback] = None
+) -> None:
+    """Общий путь экспорта таблицы в Excel: все экспорты приложения записываются через него.
+
+    Книга создается xlsxwriter в режиме constant_memory (строки сразу сбрасываются на диск),
+    ширина колонок рассчитывается один раз (см. columnWidths), каждая непустая ячейка
+    записывается один раз с форматом своей колонки из FormatRegistry. Результаты парсинга
+    могут занимать несколько листов и файлов (см. writeResultWorkbook) - каждый лист
+    записывается тем же writeTableSheet.
+
+    Args:
+        file_path (str): Путь к файлу .xlsx
+        data (pd.DataFrame): Данные
+        sheet_name (str): Название листа
+        header_styles (list[str]): Стиль заголовка каждой колонки (ключи EXPORT_STYLES)
+        data_styles (list[Optional[str]]): Стиль данных каждой колонки (None - без оформления)
+        progress (Optional[ProgressCallback]): Обратный вызов прогресса записи строк (см. ExportWorker)
+
+    Raises:
+        PermissionError: Если файл открыт или нет прав на запись
+    """
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(file_path, {'constant_memory': True})
+
+    try:
+        writeTableSheet(workbook, FormatRegistry(workbook), sheet_name, data, header_styles, data_styles, progress)
+    finally:
+        workbook.close()
+
+
+def exportListExcelFile(window: QtWidgets, table: QTableView,
+                        table_type: Literal['black', 'white']) -> Optional[ExportJob]:
     """
-    Экспортирует данные из QTableWidget в Excel файл с предварительной валидацией.
+    Экспортирует данные черного/белого списка в Excel файл с предварительной валидацией.
 
     Args:
         window (QtWidgets.QWidget): Родительское окно для диалоговых сообщений.
             Должно быть виджетом из QtWidgets для корректного отображения QMessageBox.
-        table (QTableWidget): Таблица Qt, содержащая данные для экспорта
+        table (QTableView): Таблица списка с моделью PairListModel, содержащая данные для экспорта
         table_type: Тип таблицы ('black' или 'white')
 
+    Returns:
+        Optional[ExportJob]: Запущенный фоновый экспорт или None, если экспорт не начат
+
     Raises:
         - Отсутствие данных в таблице
         - Пустые строки после валидации
@@ -33,36 +314,22 @@ def exportListExcelFile(window: QtWidgets, table: QTableWidget, table_type: Lite
         3. Проверяет валидность собранных данных (должны быть ровно 2 столбца)
         4. Запрашивает подтверждение если найдены пустые ячейки
         5. Открывает диалог сохранения файла
-        6. Сохраняет данные в Excel
-        7. Выводит результат операции
+        6. Сохраняет данные в Excel в потоке экспорта (см. writeTableWorkbook)
+        7. Выводит результат операции (в GUI-потоке, см. ExportJob)
     """
-    if table.rowCount() == 0:
+    model = table.model()
+
+    if model.totalRowCount() == 0:
         QMessageBox.warning(
             window,
             'Нет данных для экспорта',
             'Экспортируемая таблица не содержит данных'
         )
-        return
+        return None
 
     headers = AppConstants.COLUMNS['LISTS']
-    valid_data = []
-    empty_rows_count = 0
-
-    for row in range(table.rowCount()):
-        row_data = []
-
-        for col in range(table.columnCount()):
-            item = table.item(row, col)
-
-            if item is None or not item.text().strip():
-                continue
-
-            row_data.append(item.text().strip())
-
-        if len(row_data) == 2:
-            valid_data.append(row_data)
-        else:
-            empty_rows_count += 1
+    valid_data = model.pairs()
+    empty_rows_count = len(model.incompleteRows())
 
     if not valid_data:
         QMessageBox.warning(
@@ -70,7 +337,7 @@ def exportListExcelFile(window: QtWidgets, table: QTableWidget, table_type: Lite
             'Нет данных для экспорта',
             'После удаления строк с пустыми ячейками таблица стала пустой. Экспорт отменен'
         )
-        return
+        return None
 
     if empty_rows_count > 0:
         reply = QMessageBox.question(
@@ -82,7 +349,7 @@ def exportListExcelFile(window: QtWidgets, table: QTableWidget, table_type: Lite
             QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.No:
-            return
+            return None
 
     file_path, _ = QFileDialog.getSaveFileName(
         window,
@@ -92,313 +359,793 @@ def exportListExcelFile(window: QtWidgets, table: QTableWidget, table_type: Lite
     )
 
     if not file_path:
-        return
+        return None
 
-    try:
-        df = pd.DataFrame(valid_data, columns=headers)
-
-        with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
-            df.to_excel(writer, index=False)
-
-            workbook = writer.book
-            worksheet = writer.sheets['Sheet1']
-
-            header_format = workbook.add_format({
-                'bold': True,
-                'border': 1,
-                'bg_color': '#607ebc',
-                'font_color': '#faf5ee',
-                'align': 'center'
-            })
-
-            for col_num, value in enumerate(df.columns.values):
-                worksheet.write(0, col_num, value, header_format)
-
-            for i, column in enumerate(df.columns):
-                try:
-                    str_lengths = df[column].astype(str).str.len()
-                    max_len = max(str_lengths.max(), len(column))
-                    width = min(50, (max_len + 2) * 1.1)
-                    worksheet.set_column(i, i, width)
-                except AttributeError as ex:
-                    logging.warning(f"Ошибка в столбце {column}: {str(ex)}")
-                    continue
-                except Exception as ex:
-                    logging.warning(f"Ошибка в столбце {column}: {str(ex)}")
-                    continue
-
-            worksheet.freeze_panes(1, 0)
-
-        QMessageBox.information(
-            window,
-            'Экспорт завершен',
-            f'Данные успешно экспортированы в файл:\n{file_path}'
-        )
+    import pandas as pd
+
+    data = pd.DataFrame(valid_data, columns=headers)
+
+    return startExportJob(
+        window,
+        'черный список' if table_type == 'black' else 'белый список',
+        file_path,
+        lambda progress: writeTableWorkbook(
+            file_path, data, LIST_SHEET_NAME, ['list_header'] * len(headers), [None] * len(headers), progress
+        ),
+        'export_list'
+    )
+
+
+def writeErrorArticlesWorkbook(file_path: str, data: 'pd.DataFrame', progress: Optional[ProgressCallback] = None) -> None:
+    """Записывает ошибочные артикулы в Excel файл (выполняется в потоке экспорта).
+
+    Args:
+        file_path (str): Путь к файлу .xlsx
+        data (pd.DataFrame): Ошибочные артикулы (AppConstants.COLUMNS['ERRORS'])
+        progress (Optional[ProgressCallback]): Обратный вызов прогресса (см. ExportWorker)
+
+    Raises:
+        PermissionError: Если файл открыт или нет прав на запись
+    """
+    column_count = len(data.columns)
+
+    writeTableWorkbook(
+        file_path, data, LIST_SHEET_NAME, ['list_header'] * column_count, [None] * column_count, progress
+    )
 
-    except PermissionError:
-        QMessageBox.critical(
-            window,
-            'Ошибка доступа',
-            'Невозможно сохранить файл. Закройте файл если он открыт.'
-        )
-    except Exception as ex:
-        logging.error(f'Ошибка экспорта: {str(ex)}', exc_info=True)
-        QMessageBox.critical(
-            window,
-            'Ошибка экспорта',
-            f'Не удалось экспортировать данные:\n{str(ex)}'
-        )
 
+def standardErrorFilePath(app_config: dict[str, Any], base_save_path: str) -> str:
+    """Возвращает путь файла ошибочных артикулов в стандартной папке (как standardResultFilePath).
 
-def exportErrorArticlesExcelFile(window: QtWidgets.QWidget, data: pd.DataFrame) -> None:
+    Returns:
+        str: Путь вида '{папка}/Ошибочные артикулы от ДД-Мес-ГГГГ ЧЧ-ММ-СС.xlsx'
     """
-    Экспортирует DataFrame с ошибочными артикулами в Excel файл с предварительной проверкой данных.
+    save_path = app_config.get('savePath') or base_save_path
+    file_name = f'Ошибочные артикулы от {datetime.datetime.now().strftime("%d-%b-%Y %H-%M-%S")}.xlsx'
+
+    return f'{save_path}/{file_name}'
+
+
+def exportErrorArticlesExcelFile(window: QtWidgets.QWidget, data: 'pd.DataFrame', save_type: str = 'as',
+                                 notify: bool = True) -> Optional[ExportJob]:
+    """
+    Экспортирует DataFrame с ошибочными артикулами в Excel файл в фоновом потоке.
 
     Args:
         window (QtWidgets): Родительское окно для диалоговых сообщений.
-        data (pd.DataFrame): DataFrame для экспорта. Если пустой, функция отменяется без оповещения.
+        data (pd.DataFrame): Ошибочные артикулы (AppConstants.COLUMNS['ERRORS']: бренд, артикул,
+            код и причина ошибки, количество попыток). Если пустой, функция отменяется без оповещения.
+        save_type (str): Тип сохранения:
+            - 'standard' - сохраняет в стандартную папку без диалогов (после парсинга
+              с быстрым экспортом, см. standardErrorFilePath)
+            - любое другое значение - открывает диалог выбора файла
+        notify (bool): Показать сообщение об успешном завершении (иначе только строка статуса)
 
-    Raises:
-        - Ошибки сохранения файла
-        - Проблемы с доступом к файловой системе
+    Returns:
+        Optional[ExportJob]: Запущенный фоновый экспорт или None, если экспорт не начат
+
+    Note:
+        Файл выбирается в GUI-потоке, запись выполняется ExportJob (см. writeErrorArticlesWorkbook),
+        о завершении и ошибках сообщается в GUI-потоке.
     """
-    if data.empty:
-        return
+    if data is None or data.empty:
+        return None
+
+    file_path = standardErrorFilePath(window.app_config, window.base_save_path)
+
+    if save_type != 'standard':
+        file_path, _ = QFileDialog.getSaveFileName(
+            window,
+            'Сохранить список ошибочных артикулов',
+            os.path.basename(file_path),
+            'Excel Files (*.xlsx)'
+        )
+
+        if not file_path:
+            return None
 
-    QMessageBox.information(
+    return startExportJob(
         window,
-        'Экспорт ошибочных артикулов',
-        'Проводится экспорт ошибочных артикулов'
+        'ошибочные артикулы',
+        file_path,
+        lambda progress: writeErrorArticlesWorkbook(file_path, data, progress),
+        'export_errors',
+        notify
     )
 
+
+def classifyResultColumns(columns: list[str]) -> list[Literal['colored', 'numeric', 'text']]:
+    """Определяет тип каждой колонки результата (один раз на экспорт, а не для каждой ячейки).
+
+    Returns:
+        list[Literal['colored', 'numeric', 'text']]: 'colored' - цены сводки (Мин/Сред/Макс),
+            'numeric' - числовые колонки магазинов, 'text' - остальные
+    """
+    return [
+        'colored' if column in RESULT_COLORED_COLUMNS
+        else 'numeric' if any(pattern in column for pattern in RESULT_NUMERIC_PATTERNS)
+        else 'text'
+        for column in map(str, columns)
+    ]
+
+
+def resultStyles(columns: list[str]) -> tuple[list[str], list[str]]:
+    """Возвращает стили заголовка и данных каждой колонки результата (см. classifyResultColumns)."""
+    kinds = classifyResultColumns(columns)
+
+    return [RESULT_HEADER_STYLES[kind] for kind in kinds], [RESULT_DATA_STYLES[kind] for kind in kinds]
+
+
+def addResultConditionalFormats(worksheet: 'xlsxwriter.worksheet.Worksheet', row_count: int,
+                                column_count: int, formats: FormatRegistry) -> None:
+    """Добавляет рамку пустым ячейкам и выделение отметок AppConstants.MISSING_DATA_MARKERS.
+
+    Условное форматирование записывается при закрытии книги, поэтому его можно
+    добавить после строк и в режиме constant_memory.
+    """
+    if row_count <= 0 or column_count <= 0:
+        return
+
+    worksheet.conditional_format(1, 0, row_count, column_count - 1, {'type': 'blanks', 'format': formats['blank']})
+
+    for marker in AppConstants.MISSING_DATA_MARKERS:
+        worksheet.conditional_format(1, 0, row_count, column_count - 1, {
+            'type': 'cell',
+            'criteria': '==',
+            'value': f'"{marker}"',
+            'format': formats['missing_data']
+        })
+
+
+def writeRunReportSheet(workbook: 'xlsxwriter.Workbook', run_report: dict[str, Any], formats: FormatRegistry) -> None:
+    """Добавляет лист 'Отчет о запуске' (см. runReportRows)."""
+    report_sheet = workbook.add_worksheet(REPORT_SHEET_NAME)
+    report_sheet.set_column(0, 0, 40)
+    report_sheet.set_column(1, 1, 70)
+    report_sheet.write_row(0, 0, ['Показатель', 'Значение'], formats['result_header_text'])
+
+    for row, values in enumerate(runReportRows(run_report), start=1):
+        report_sheet.write_row(row, 0, values, formats['result_text'])
+
+
+def runReportSidecarPath(file_path: str) -> str:
+    """Путь файла отчета о запуске рядом с файлом результатов: '{имя}.report.json'."""
+    return f'{os.path.splitext(file_path)[0]}{REPORT_SIDECAR_SUFFIX}'
+
+
+def writeRunReportSidecar(file_path: str, run_report: dict[str, Any]) -> str:
+    """Записывает отчет о запуске рядом с файлом результатов без оформления (CSV, Parquet, JSONL).
+
+    В таких файлах нет листа 'Отчет о запуске', поэтому отчет сохраняется отдельным JSON:
+    summary - строки [Показатель, Значение] как на листе Excel (см. runReportRows),
+    report - отчет целиком (см. RunStats.report).
+
+    Args:
+        file_path (str): Путь к файлу результатов
+        run_report (dict[str, Any]): Отчет о запуске
+
+    Returns:
+        str: Путь к файлу отчета (см. runReportSidecarPath)
+    """
+    sidecar_path = runReportSidecarPath(file_path)
+
+    with open(sidecar_path, 'w', encoding='utf-8') as f:
+        json.dump(
+            {'summary': runReportRows(run_report), 'report': run_report},
+            f, ensure_ascii=False, indent=2, default=jsonDefault
+        )
+
+    return sidecar_path
+
+
+def writeRunDiffWorkbook(file_path: str, delta: 'pd.DataFrame', summary: dict[str, int], price_threshold: float,
+                         progress: Optional[ProgressCallback] = None) -> None:
+    """Записывает сравнение запусков в Excel файл (выполняется в потоке экспорта).
+
+    Лист 'Изменения' - изменившиеся артикулы (см. compareRuns), лист 'Сводка' - количество
+    изменений по видам (см. runDiffRows).
+
+    Args:
+        file_path (str): Путь к файлу .xlsx
+        delta (pd.DataFrame): Изменения (колонки DIFF_COLUMNS)
+        summary (dict[str, int]): Сводка сравнения
+        price_threshold (float): Порог изменения цены, с которым выполнено сравнение (%)
+        progress (Optional[ProgressCallback]): Обратный вызов прогресса (см. ExportWorker)
+
+    Raises:
+        PermissionError: Если файл открыт или нет прав на запись
+    """
+    import xlsxwriter
+
+    text_columns = [column in DIFF_TEXT_COLUMNS for column in DIFF_COLUMNS]
+    workbook = xlsxwriter.Workbook(file_path, {'constant_memory': True})
+
+    try:
+        formats = FormatRegistry(workbook)
+        writeTableSheet(
+            workbook, formats, DIFF_SHEET_NAME, delta.reindex(columns=DIFF_COLUMNS),
+            ['result_header_text' if text else 'result_header_numeric' for text in text_columns],
+            ['result_text' if text else 'result_numeric' for text in text_columns],
+            progress
+        )
+
+        summary_sheet = workbook.add_worksheet(DIFF_SUMMARY_SHEET_NAME)
+        summary_sheet.set_column(0, 0, 40)
+        summary_sheet.set_column(1, 1, 20)
+        summary_sheet.write_row(0, 0, ['Показатель', 'Значение'], formats['result_header_text'])
+
+        for row, values in enumerate(runDiffRows(summary, price_threshold), start=1):
+            summary_sheet.write_row(row, 0, values, formats['result_text'])
+    finally:
+        workbook.close()
+
+
+def exportRunDiffExcelFile(window: QtWidgets.QWidget, run_path: str, current: 'pd.DataFrame',
+                           price_threshold: float) -> Optional[ExportJob]:
+    """Сравнивает текущие результаты с запуском из истории и экспортирует изменения в фоновом потоке.
+
+    Загрузка архива запуска (loadRun) и сравнение (compareRuns) выполняются в потоке экспорта
+    вместе с записью файла, поэтому окно не блокируется, а ошибка чтения архива выводится
+    как ошибка экспорта. Если изменений нет, файл содержит пустой лист изменений и сводку.
+    После записи сводка сравнения выводится в строке статуса.
+
+    Args:
+        window (QtWidgets): Родительское окно для диалоговых сообщений.
+        run_path (str): Путь к архиву запуска, с которым сравниваются результаты
+        current (pd.DataFrame): Текущие результаты
+        price_threshold (float): Порог изменения цены (%)
+
+    Returns:
+        Optional[ExportJob]: Запущенный фоновый экспорт или None, если файл не выбран
+    """
     file_path, _ = QFileDialog.getSaveFileName(
         window,
-        'Сохранить список ошибочных артикулов',
-        f'Ошибочные_артикулы_{datetime.datetime.now().strftime("%Y-%m-%d")}.xlsx',
+        'Сохранить сравнение запусков',
+        f'Сравнение запусков от {datetime.datetime.now().strftime("%d-%b-%Y %H-%M-%S")}.xlsx',
         'Excel Files (*.xlsx)'
     )
 
     if not file_path:
-        return
+        return None
+
+    comparison = {}
+
+    def write(progress: ProgressCallback) -> None:
+        baseline, _, _ = loadRun(run_path)
+
+        started_at = time.perf_counter()
+        delta, summary = compareRuns(baseline, current, price_threshold)
+        logging.info(f'Сравнение с запуском {run_path} за {time.perf_counter() - started_at:.2f} с: {summary}')
+
+        comparison['summary'] = summary
+        writeRunDiffWorkbook(file_path, delta, summary, price_threshold, progress)
+
+    job = startExportJob(window, 'сравнение запусков', file_path, write, 'export_run_diff', status=False)
+    job.finished.connect(lambda _: window.statusLabel.setText(formatRunDiffSummary(comparison['summary'])))
+
+    return job
+
+
+class SheetPartition:
+    """Часть результата для одного листа Excel.
+
+    Attributes:
+        name (str): Название листа (уникальное в пределах файла, см. planResultPartitions)
+        positions (slice | np.ndarray): Номера строк результата (позиции для DataFrame.iloc)
+        rows (int): Количество строк
+    """
+
+    __slots__ = ('name', 'positions', 'rows')
+
+    def __init__(self, name: str, positions: Any, rows: int):
+        self.name = name
+        self.positions = positions
+        self.rows = rows
+
+    def take(self, data: 'pd.DataFrame') -> 'pd.DataFrame':
+        return data.iloc[self.positions]
+
+    def __repr__(self) -> str:
+        return f'SheetPartition({self.name!r}, rows={self.rows})'
+
+
+_SHEET_NAME_FORBIDDEN = re.compile(r"[\[\]:*?/\\]")
+
+
+def _sheetName(name: str, used: set[str]) -> str:
+    """Приводит название к ограничениям Excel (31 символ, без []:*?/\\, уникальное без учета регистра)."""
+    base = _SHEET_NAME_FORBIDDEN.sub('_', str(name)).strip("' ") or 'Лист'
+    candidate = base[:31]
+    number = 2
+
+    while candidate.lower() in used:
+        suffix = f' ({number})'
+        candidate = base[:31 - len(suffix)] + suffix
+        number += 1
+
+    used.add(candidate.lower())
+    return candidate
+
+
+def planResultPartitions(data: 'pd.DataFrame', split: Literal['rows', 'brand'] = 'rows') -> list[list[SheetPartition]]:
+    """Разбивает результат на листы и файлы Excel по бюджету размера.
+
+    На листе не больше AppConstants.EXPORT_SHEET_CELLS ячеек (и не больше
+    AppConstants.EXCEL_MAX_ROWS строк с заголовком), в файле - не больше
+    AppConstants.EXPORT_FILE_CELLS ячеек и AppConstants.EXPORT_MAX_SHEETS_PER_FILE листов.
+    Обычный результат помещается на один лист одного файла.
+
+    Args:
+        data (pd.DataFrame): Результаты парсинга
+        split (Literal['rows', 'brand']): 'rows' - листы по порядку строк,
+            'brand' - отдельный лист для каждого бренда (в порядке первого появления)
+
+    Returns:
+        list[list[SheetPartition]]: Листы каждого файла (первый файл - основной)
+    """
+    column_count = max(1, len(data.columns))
+    sheet_rows = max(1, min(AppConstants.EXCEL_MAX_ROWS - 1, AppConstants.EXPORT_SHEET_CELLS // column_count))
+    file_rows = max(sheet_rows, AppConstants.EXPORT_FILE_CELLS // column_count)
+
+    if split == 'brand' and len(data) > 0 and RESULT_BRAND_COLUMN in data.columns:
+        groups = data.groupby(RESULT_BRAND_COLUMN, sort=False, dropna=False).indices
+        sheets = [
+            SheetPartition(str(brand), positions[start:start + sheet_rows], len(positions[start:start + sheet_rows]))
+            for brand, positions in groups.items()
+            for start in range(0, len(positions), sheet_rows)
+        ]
+    else:
+        sheets = [
+            SheetPartition(
+                RESULT_SHEET_NAME if number == 1 else f'{RESULT_SHEET_NAME} ({number})',
+                slice(start, start + sheet_rows),
+                min(sheet_rows, len(data) - start)
+            )
+            for number, start in enumerate(range(0, len(data), sheet_rows), start=1)
+        ] or [SheetPartition(RESULT_SHEET_NAME, slice(0, 0), 0)]
+
+    files = [[]]
+    file_rows_used = 0
+
+    for sheet in sheets:
+        current = files[-1]
+        if current and (file_rows_used + sheet.rows > file_rows
+                        or len(current) >= AppConstants.EXPORT_MAX_SHEETS_PER_FILE):
+            files.append([])
+            file_rows_used = 0
+
+        files[-1].append(sheet)
+        file_rows_used += sheet.rows
+
+    for file_sheets in files:
+        used = {INDEX_SHEET_NAME.lower(), REPORT_SHEET_NAME.lower()}
+        for sheet in file_sheets:
+            sheet.name = _sheetName(sheet.name, used)
+
+    return files
+
+
+def partitionFilePath(file_path: str, number: int) -> str:
+    """Возвращает путь файла части результата: 'Имя.xlsx' -> 'Имя (часть 2).xlsx' (1 - сам file_path)."""
+    if number == 1:
+        return file_path
+
+    stem, extension = os.path.splitext(file_path)
+    return f'{stem} (часть {number}){extension}'
+
+
+def resultIndexRows(data: 'pd.DataFrame', files: list[list[SheetPartition]], file_paths: list[str]) -> list[list[Any]]:
+    """Строит строки листа 'Содержание': файл, лист, количество строк, первая и последняя позиции.
+
+    Позиция - бренд и артикул первой/последней строки листа.
+    """
+    has_keys = RESULT_BRAND_COLUMN in data.columns and RESULT_ARTICLE_COLUMN in data.columns
+    rows = []
+
+    for file_path, file_sheets in zip(file_paths, files):
+        for sheet in file_sheets:
+            first = last = ''
+            if has_keys and sheet.rows > 0:
+                keys = sheet.take(data)[[RESULT_BRAND_COLUMN, RESULT_ARTICLE_COLUMN]]
+                first = ' '.join(map(str, keys.iloc[0]))
+                last = ' '.join(map(str, keys.iloc[-1]))
+
+            rows.append([os.path.basename(file_path), sheet.name, sheet.rows, first, last])
+
+    return rows
+
+
+def writeIndexSheet(workbook: 'xlsxwriter.Workbook', index_rows: list[list[Any]],
+                    file_name: str, formats: FormatRegistry) -> None:
+    """Добавляет лист 'Содержание' со ссылками на листы результата (в этом и других файлах)."""
+    worksheet = workbook.add_worksheet(INDEX_SHEET_NAME)
+
+    for col, width in enumerate((45, 32, 10, 35, 35)):
+        worksheet.set_column(col, col, width)
+    worksheet.freeze_panes(1, 0)
+    worksheet.write_row(0, 0, ['Файл', 'Лист', 'Строк', 'С', 'По'], formats['result_header_text'])
+
+    for row, (sheet_file, sheet_name, rows, first, last) in enumerate(index_rows, start=1):
+        worksheet.write_string(row, 0, sheet_file, formats['result_text'])
+
+        location = f"'{sheet_name.replace(chr(39), chr(39) * 2)}'!A1"
+        url = f'internal:{location}' if sheet_file == file_name else f'external:{sheet_file}#{location}'
+        worksheet.write_url(row, 1, url, formats['link'], string=sheet_name)
+
+        worksheet.write_number(row, 2, rows, formats['result_numeric'])
+        worksheet.write_string(row, 3, first, formats['result_text'])
+        worksheet.write_string(row, 4, last, formats['result_text'])
+
+
+def writeResultPartitionFile(
+        file_path: str,
+        parts: list[tuple[str, 'pd.DataFrame']],
+        run_report: Optional[dict[str, Any]] = None,
+        index_rows: Optional[list[list[Any]]] = None,
+        progress: Optional[ProgressCallback] = None
+) -> None:
+    """Записывает файл результата: листы частей, а также 'Содержание' и 'Отчет о запуске', если переданы.
+
+    Функция уровня модуля без обращения к окну, поэтому выполняется и в отдельном
+    процессе (см. writeResultWorkbook).
+
+    Args:
+        file_path (str): Путь к файлу .xlsx
+        parts (list[tuple[str, pd.DataFrame]]): Название листа и строки для каждого листа
+        run_report (Optional[dict[str, Any]]): Отчет о запуске (лист 'Отчет о запуске')
+        index_rows (Optional[list[list[Any]]]): Строки листа 'Содержание' (см. resultIndexRows)
+        progress (Optional[ProgressCallback]): Обратный вызов прогресса по строкам всех листов
+    """
+    import xlsxwriter
+
+    total = sum(len(frame) for _, frame in parts)
+    header_styles, data_styles = resultStyles(list(parts[0][1].columns))
+
+    workbook = xlsxwriter.Workbook(file_path, {'constant_memory': True})
 
     try:
-        with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
-            data.to_excel(writer, index=False)
-
-            workbook = writer.book
-            worksheet = writer.sheets['Sheet1']
-
-            header_format = workbook.add_format({
-                'bold': True,
-                'border': 1,
-                'bg_color': '#607ebc',
-                'font_color': '#faf5ee',
-                'align': 'center'
-            })
-
-            for col_num, value in enumerate(data.columns.values):
-                worksheet.write(0, col_num, value, header_format)
-
-            for i, column in enumerate(data.columns):
-                try:
-                    str_lengths = data[column].astype(str).str.len()
-                    max_len = max(str_lengths.max(), len(column))
-                    width = min(50, (max_len + 2) * 1.1)
-
-                    worksheet.set_column(i, i, width)
-                except AttributeError as ex:
-                    logging.warning(f"Ошибка в столбце {column}: {str(ex)}")
-                    continue
-                except Exception as ex:
-                    logging.warning(f"Ошибка в столбце {column}: {str(ex)}")
-                    continue
-
-            worksheet.freeze_panes(1, 0)
-
-        QMessageBox.information(
-            window,
-            'Экспорт завершен',
-            f'Данные успешно экспортированы в файл:\n{file_path}'
-        )
+        formats = FormatRegistry(workbook)
 
-    except PermissionError:
-        QMessageBox.critical(
-            window,
-            'Ошибка доступа',
-            'Невозможно сохранить файл. Закройте файл если он открыт.'
-        )
-    except Exception as ex:
-        logging.error(f'Ошибка экспорта: {str(ex)}', exc_info=True)
-        QMessageBox.critical(
-            window,
-            'Ошибка экспорта',
-            f'Не удалось экспортировать данные:\n{str(ex)}'
+        if index_rows:
+            writeIndexSheet(workbook, index_rows, os.path.basename(file_path), formats)
+
+        written = 0
+        for sheet_name, frame in parts:
+            def sheet_progress(done: int, _: int, offset: int = written) -> None:
+                if progress is not None:
+                    progress(offset + done, total)
+
+            worksheet = writeTableSheet(workbook, formats, sheet_name, frame, header_styles, data_styles, sheet_progress)
+            addResultConditionalFormats(worksheet, len(frame), len(frame.columns), formats)
+            written += len(frame)
+
+        if run_report is not None:
+            writeRunReportSheet(workbook, run_report, formats)
+    finally:
+        workbook.close()
+
+
+def _writePartitionFilesInProcesses(
+        jobs: list[tuple[str, list[tuple[str, 'pd.DataFrame']], Optional[dict[str, Any]], Optional[list[list[Any]]]]],
+        total: int,
+        progress: Optional[ProgressCallback] = None
+) -> None:
+    """Записывает файлы частей результата параллельно в процессах (spawn).
+
+    Прогресс сообщается по завершенным файлам. При отмене (ExportCancelled из progress)
+    или ошибке ожидающие файлы отменяются, уже запущенные дописываются до конца
+    (процесс нельзя прервать безопасно) - их удаляет вызывающая функция.
+    """
+    workers = max(1, min(len(jobs), AppConstants.EXPORT_MAX_PROCESSES, os.cpu_count() or 1))
+    executor = concurrent.futures.ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'))
+
+    try:
+        futures = {executor.submit(writeResultPartitionFile, *job): sum(len(frame) for _, frame in job[1])
+                   for job in jobs}
+        pending = set(futures)
+        done_rows = 0
+
+        while pending:
+            finished, pending = concurrent.futures.wait(
+                pending, timeout=0.2, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+
+            for future in finished:
+                future.result()
+                done_rows += futures[future]
+
+            if progress is not None:
+                progress(done_rows, total)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def writeResultWorkbook(
+        file_path: str,
+        data: 'pd.DataFrame',
+        run_report: Optional[dict[str, Any]] = None,
+        progress: Optional[ProgressCallback] = None,
+        split: Literal['rows', 'brand'] = 'rows'
+) -> None:
+    """Записывает результаты парсинга в Excel с форматированием (листы - см. writeTableSheet).
+
+    Колонки классифицируются один раз (см. resultStyles). Ячейки 'Данные отсутствуют'/
+    'Больше данных нет' выделяются, а пустые ячейки таблицы получают рамку условным
+    форматированием, без записи каждой ячейки.
+
+    Большой результат (или split='brand') разбивается на листы и файлы
+    (см. planResultPartitions): в основном файле (file_path) появляется лист 'Содержание'
+    со ссылками на все листы, остальные файлы называются 'Имя (часть N).xlsx'
+    и записываются параллельно в отдельных процессах.
+
+    Args:
+        file_path (str): Путь к файлу .xlsx
+        data (pd.DataFrame): Результаты парсинга
+        run_report (Optional[dict[str, Any]]): Отчет о запуске (см. RunStats.report).
+            Если передан, в основной файл добавляется лист 'Отчет о запуске'
+        progress (Optional[ProgressCallback]): Обратный вызов прогресса записи строк (см. ExportWorker)
+        split (Literal['rows', 'brand']): Способ разбиения (см. planResultPartitions)
+
+    Raises:
+        PermissionError: Если файл открыт или нет прав на запись
+    """
+    files = planResultPartitions(data, split)
+    file_paths = [partitionFilePath(file_path, number) for number in range(1, len(files) + 1)]
+    index_rows = resultIndexRows(data, files, file_paths) if sum(map(len, files)) > 1 else None
+
+    jobs = [
+        (
+            path,
+            [(sheet.name, sheet.take(data)) for sheet in file_sheets],
+            run_report if number == 0 else None,
+            index_rows if number == 0 else None
         )
+        for number, (path, file_sheets) in enumerate(zip(file_paths, files))
+    ]
+
+    if len(jobs) == 1:
+        writeResultPartitionFile(*jobs[0], progress=progress)
+        return
+
+    logging.info(f'Результат разбит на {len(jobs)} файлов и {sum(map(len, files))} листов: {file_path}')
+
+    try:
+        _writePartitionFilesInProcesses(jobs, len(data), progress)
+    except BaseException:
+        for path in file_paths:
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except OSError as ex:
+                logging.warning(f'Не удалось удалить недописанный файл {path}: {ex}')
+        raise
+
+
+def _dataframeChunks(data: 'pd.DataFrame', progress: Optional[ProgressCallback] = None):
+    """Перебирает DataFrame частями по AppConstants.EXPORT_PROGRESS_ROWS строк.
+
+    После обработки каждой части (когда генератор запрашивают повторно) вызывает progress,
+    поэтому экспорт отменяется между частями. Для пустого DataFrame возвращает одну пустую часть,
+    чтобы в файл попал заголовок.
+
+    Yields:
+        tuple[int, pd.DataFrame]: Номер первой строки части и сама часть
+    """
+    total = len(data)
+    step = AppConstants.EXPORT_PROGRESS_ROWS
+
+    for start in range(0, max(total, 1), step):
+        yield start, data.iloc[start:start + step]
+
+        if progress is not None:
+            progress(min(start + step, total), total)
+
+
+def writeResultCSV(file_path: str, data: 'pd.DataFrame', progress: Optional[ProgressCallback] = None) -> None:
+    """Записывает результаты в CSV без оформления (выполняется в потоке экспорта).
+
+    Кодировка UTF-8 с BOM и разделитель AppConstants.CSV_SEPARATOR - файл открывается
+    в Excel с русской локалью без мастера импорта.
+
+    Args:
+        file_path (str): Путь к файлу .csv
+        data (pd.DataFrame): Результаты парсинга
+        progress (Optional[ProgressCallback]): Обратный вызов прогресса (см. ExportWorker)
+    """
+    with open(file_path, 'w', encoding='utf-8-sig', newline='') as f:
+        for start, chunk in _dataframeChunks(data, progress):
+            chunk.to_csv(f, sep=AppConstants.CSV_SEPARATOR, index=False, header=start == 0)
+
+
+def writeResultJSONL(file_path: str, data: 'pd.DataFrame', progress: Optional[ProgressCallback] = None) -> None:
+    """Записывает результаты в JSON Lines: одна строка результата - один JSON-объект.
+
+    Args:
+        file_path (str): Путь к файлу .jsonl
+        data (pd.DataFrame): Результаты парсинга
+        progress (Optional[ProgressCallback]): Обратный вызов прогресса (см. ExportWorker)
+    """
+    with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
+        for _, chunk in _dataframeChunks(data, progress):
+            if chunk.empty:
+                continue
+
+            lines = chunk.to_json(orient='records', lines=True, force_ascii=False)
+            f.write(lines if lines.endswith('\n') else lines + '\n')
+
+
+def parquetEngineAvailable() -> bool:
+    """Проверяет, установлен ли движок Parquet для pandas (pyarrow или fastparquet)."""
+    return any(importlib.util.find_spec(name) is not None for name in ('pyarrow', 'fastparquet'))
+
+
+def parquetColumns(data: 'pd.DataFrame') -> 'pd.DataFrame':
+    """Приводит колонки результата к одному типу для Parquet.
+
+    В колонках object результата вперемешку числа, строки ('Данные отсутствуют', '' у пустых
+    магазинов) и пустые ячейки, а Parquet хранит колонку одного типа. Цены, количества
+    и сроки доставки (RESULT_COLORED_COLUMNS, RESULT_NUMERIC_PATTERNS) приводятся к числу
+    (нечисловые значения - пустые), остальные колонки - к строке (пустые ячейки сохраняются).
+    """
+    import pandas as pd
+
+    columns = {}
+
+    for name in data.columns:
+        values = data[name]
+
+        if values.dtype.kind in 'biuf':
+            continue
+
+        if name in RESULT_COLORED_COLUMNS or any(pattern in name for pattern in RESULT_NUMERIC_PATTERNS):
+            columns[name] = pd.to_numeric(values, errors='coerce')
+        else:
+            columns[name] = values.astype('string')
+
+    return data.assign(**columns) if columns else data
+
+
+def writeResultParquet(file_path: str, data: 'pd.DataFrame', progress: Optional[ProgressCallback] = None) -> None:
+    """Записывает результаты в Parquet (без оформления, типы колонок - см. parquetColumns).
+
+    Файл пишется одним вызовом pandas, поэтому прогресс сообщается только в конце.
+
+    Args:
+        file_path (str): Путь к файлу .parquet
+        data (pd.DataFrame): Результаты парсинга
+        progress (Optional[ProgressCallback]): Обратный вызов прогресса (см. ExportWorker)
 
+    Raises:
+        ImportError: Если не установлен ни pyarrow, ни fastparquet
+    """
+    parquetColumns(data).to_parquet(file_path, index=False)
+
+    if progress is not None:
+        progress(len(data), len(data))
+
+
+def resultExportFormat(app_config: dict[str, Any]) -> str:
+    """Возвращает формат файла результатов из настроек (ключ AppConstants.EXPORT_FORMATS)."""
+    export_format = app_config.get('exportFormat', AppConstants.DEFAULT_EXPORT_FORMAT)
+
+    return export_format if export_format in AppConstants.EXPORT_FORMATS else AppConstants.DEFAULT_EXPORT_FORMAT
+
+
+def standardResultFilePath(app_config: dict[str, Any], base_save_path: str, export_format: str) -> str:
+    """Возвращает путь файла результатов в стандартной папке (savePath из настроек или base_save_path).
+
+    Args:
+        app_config (dict[str, Any]): Конфиг приложения
+        base_save_path (str): Папка по умолчанию (рабочий стол пользователя)
+        export_format (str): Формат файла (расширение)
 
-def exportResultExcelFile(window: QtWidgets, save_type: str) -> None:
+    Returns:
+        str: Путь вида '{папка}/Проценка товара от ДД-Мес-ГГГГ ЧЧ-ММ-СС.{формат}'
     """
-    Экспортирует результаты парсинга в Excel файл с форматированием.
+    save_path = app_config.get('savePath') or base_save_path
+    file_name = f'Проценка товара от {datetime.datetime.now().strftime("%d-%b-%Y %H-%M-%S")}.{export_format}'
+
+    return f'{save_path}/{file_name}'
+
+
+RESULT_FLAT_WRITERS = {
+    'csv': writeResultCSV,
+    'parquet': writeResultParquet,
+    'jsonl': writeResultJSONL
+}
+
+
+def exportResultExcelFile(window: QtWidgets, save_type: str, notify: bool = True) -> Optional[ExportJob]:
+    """
+    Экспортирует результаты парсинга в файл в фоновом потоке.
+
+    Формат берется из настроек (app_config['exportFormat']): Excel с форматированием
+    или CSV/Parquet/JSONL - запись DataFrame как есть, без оформления и расчета ширины колонок.
 
     Args:
         window (QtWidgets.QWidget): Родительское окно для диалоговых сообщений.
             Должно быть виджетом из QtWidgets для корректного отображения QMessageBox.
         save_type (str): Тип сохранения:
             - 'standard' - сохраняет в стандартную папку (self.base_save_path или из конфига)
-            - любое другое значение - открывает диалог выбора файла
+              в формате из настроек
+            - любое другое значение - открывает диалог выбора файла, формат определяется
+              по расширению выбранного файла (или по выбранному фильтру)
+        notify (bool): Показать сообщение об успешном завершении (для быстрого экспорта
+            после парсинга - только строка статуса)
 
-    Raises:
-        - Проблемы с созданием файла
-        - Ошибки записи данных
-        - Проблемы с форматами
+    Returns:
+        Optional[ExportJob]: Запущенный фоновый экспорт или None, если экспорт не начат
 
     Note:
         1. Формирует имя файла с текущей датой/временем
-        2. Определяет путь сохранения в зависимости от save_type
-        3. Создает Excel файл с помощью xlsxwriter
-        4. Применяет форматирование:
-            - Заголовки столбцов с разными стилями
-            - Разные форматы для числовых данных
-            - Особое форматирование для отсутствующих данных
-            - Автоподбор ширины столбцов
-            - Закрепление заголовков
-        5. Обрабатывает ошибки экспорта
-    """
-    file_name = f'Проценка товара от {datetime.datetime.now().strftime("%d-%b-%Y %H-%M-%S")}.xlsx'
-
-    if save_type == 'standard':
-        save_path = window.app_config.get('savePath') if window.app_config.get('savePath') else window.base_save_path
-        file_path = f'{save_path}/{file_name}'
-    else:
-        file_path, _ = QFileDialog.getSaveFileName(
+        2. Определяет путь и формат сохранения в зависимости от save_type
+        3. Запускает запись в потоке экспорта (ExportJob): Excel файл с форматированием
+           (см. writeResultWorkbook) и листом 'Отчет о запуске' (если есть window.run_report),
+           большой результат разбивается на листы и файлы (app_config['exportSplit'])
+           или файл без оформления (RESULT_FLAT_WRITERS) и рядом с ним отчет о запуске
+           '{имя}.report.json' (см. writeRunReportSidecar).
+           Прогресс выводится в exportProgressBar, экспорт можно отменить
+        4. Ошибки экспорта выводятся в GUI-потоке, недописанный файл удаляется
+    """
+    if window.result_data is None:
+        QMessageBox.warning(window, 'Нет данных для экспорта', 'Нет результатов парсинга для экспорта')
+        return None
+
+    export_format = resultExportFormat(window.app_config)
+    file_path = standardResultFilePath(window.app_config, window.base_save_path, export_format)
+
+    if save_type != 'standard':
+        file_path, selected_filter = QFileDialog.getSaveFileName(
             window,
-            'Сохранить как Excel',
-            '',
-            'Excel Files (*.xlsx)'
+            'Сохранить результаты',
+            os.path.basename(file_path),
+            ';;'.join(AppConstants.EXPORT_FORMATS.values()),
+            AppConstants.EXPORT_FORMATS[export_format]
         )
         if not file_path:
-            return
+            return None
 
-    try:
-        with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
-            window.result_data.to_excel(writer, index=False, sheet_name='Проценка товаров')
-
-            workbook = writer.book
-            worksheet = writer.sheets['Проценка товаров']
-
-            formats = {
-                'header': workbook.add_format({
-                    'bold': True,
-                    'text_wrap': True,
-                    'valign': 'vcenter',
-                    'font_size': 12,
-                    'border': 1
-                }),
-                'colored_header': workbook.add_format({
-                    'bold': True,
-                    'text_wrap': True,
-                    'valign': 'vcenter',
-                    'font_size': 12,
-                    'border': 1,
-                    'bg_color': '#607ebc',
-                    'font_color': '#faf5ee',
-                    'align': 'right'
-                }),
-                'numeric_header': workbook.add_format({
-                    'bold': True,
-                    'text_wrap': True,
-                    'valign': 'vcenter',
-                    'font_size': 12,
-                    'border': 1,
-                    'align': 'right'
-                }),
-                'data': workbook.add_format({
-                    'text_wrap': True,
-                    'valign': 'vcenter',
-                    'font_size': 10,
-                    'border': 1
-                }),
-                'numeric_data': workbook.add_format({
-                    'text_wrap': True,
-                    'valign': 'vcenter',
-                    'font_size': 10,
-                    'border': 1,
-                    'align': 'right'
-                }),
-                'missing_data': workbook.add_format({
-                    'text_wrap': True,
-                    'valign': 'vcenter',
-                    'font_size': 10,
-                    'border': 1,
-                    'font_color': 'red',
-                    'bold': True
-                })
-            }
-
-            colored_columns = [
-                'Мин НАЛИЧИЕ', 'Сред НАЛИЧИЕ', 'Макс НАЛИЧИЕ',
-                'Мин ПОД ЗАКАЗ', 'Сред ПОД ЗАКАЗ', 'Макс ПОД ЗАКАЗ'
-            ]
-            numeric_patterns = [
-                'Цена магазина',
-                'Кол-во магазина',
-                'Кол-во дней доставки магазина'
-            ]
-
-            for col_num, column_name in enumerate(window.result_data.columns):
-                is_colored = column_name in colored_columns
-                is_numeric = any(pattern in column_name for pattern in numeric_patterns)
-                fmt = formats['numeric_header'] if is_numeric else formats['colored_header'] if is_colored else formats['header']
-                worksheet.write(0, col_num, column_name, fmt)
-
-            for row in range(1, len(window.result_data) + 1):
-                for col in range(len(window.result_data.columns)):
-                    cell_value = window.result_data.iloc[row - 1, col]
-                    col_name = window.result_data.columns[col]
-
-                    is_numeric = (col_name in colored_columns or
-                                  any(pattern in col_name for pattern in numeric_patterns))
-
-                    if str(cell_value).strip() in ['Данные отсутствуют', 'Больше данных нет']:
-                        fmt = formats['missing_data']
-                    elif is_numeric:
-                        fmt = formats['numeric_data']
-                    else:
-                        fmt = formats['data']
-
-                    worksheet.write(row, col, cell_value, fmt)
-
-            for i, column in enumerate(window.result_data.columns):
-                try:
-                    str_lengths = window.result_data[column].astype(str).fillna("").str.len()
-
-                    max_len_data = str_lengths.max() if not str_lengths.empty else 0
-                    max_len_column_name = len(str(column))
-
-                    max_len = max(max_len_data, max_len_column_name)
-
-                    width = min(50, (max_len + 2) * 1.1)
-
-                    worksheet.set_column(i, i, width)
-                except AttributeError as ex:
-                    logging.warning(f"Ошибка в столбце {column}: {str(ex)}")
-                    continue
-                except Exception as ex:
-                    logging.warning(f"Ошибка в столбце {column}: {str(ex)}")
-                    continue
-
-            worksheet.freeze_panes(1, 0)
-
-    except PermissionError:
-        QMessageBox.critical(
-            window,
-            'Ошибка доступа',
-            'Нет прав на запись в указанную папку. Закройте файл если он открыт.'
-        )
-    except Exception as ex:
-        logging.exception('Ошибка экспорта в Excel')
-        QMessageBox.critical(
+        extension = os.path.splitext(file_path)[1].lstrip('.').lower()
+        if extension in AppConstants.EXPORT_FORMATS:
+            export_format = extension
+        else:
+            export_format = next(
+                (key for key, file_filter in AppConstants.EXPORT_FORMATS.items() if file_filter == selected_filter),
+                export_format
+            )
+            file_path = f'{file_path}.{export_format}'
+
+    if export_format == 'parquet' and not parquetEngineAvailable():
+        QMessageBox.warning(
             window,
-            'Ошибка экспорта',
-            f'Не удалось экспортировать данные: {str(ex)}'
+            'Экспорт в Parquet недоступен',
+            'Для экспорта в Parquet установите пакет pyarrow (pip install pyarrow)\n'
+            'или выберите другой формат в настройках'
         )
+        return None
+
+    data = window.result_data
+    run_report = window.run_report
+
+    if export_format == 'xlsx':
+        split = window.app_config.get('exportSplit', AppConstants.DEFAULT_EXPORT_SPLIT)
+
+        def write(progress: ProgressCallback) -> None:
+            writeResultWorkbook(file_path, data, run_report, progress, split)
+    else:
+        flat_writer = RESULT_FLAT_WRITERS[export_format]
+
+        def write(progress: ProgressCallback) -> None:
+            flat_writer(file_path, data, progress)
+
+            if run_report is not None:
+                writeRunReportSidecar(file_path, run_report)
+
+    return startExportJob(
+        window,
+        'результаты',
+        file_path,
+        write,
+        'export',
+        notify
+    )
@@ -0,0 +1,299 @@
+import logging
+import os
+import time
+
+from typing import Callable, Optional
+
+from PyQt6 import QtWidgets
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+from PyQt6.QtWidgets import QMessageBox
+
+from tools.profiling import profileSection
+
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class ExportCancelled(Exception):
+    """Экспорт отменен пользователем (выбрасывается из обратного вызова прогресса)."""
+
+
+class ExportWorker(QObject):
+    """Выполняет запись файла экспорта в отдельном потоке (QThread).
+
+    Функция записи получает обратный вызов прогресса progress(done, total). Он испускает
+    progressChanged и при отмене (cancel) выбрасывает ExportCancelled, поэтому запись
+    прерывается в ближайшей точке отчета о прогрессе.
+
+    Signals:
+        progressChanged (int): Процент выполнения (0-100), только при изменении
+        finished (): Файл записан
+        failed (str, str): Заголовок и текст ошибки
+        cancelled (): Экспорт отменен
+
+    Attributes:
+        outcome (Optional[str]): 'finished', 'cancelled' или 'failed' после завершения записи
+
+    Args:
+        write (Callable[[ProgressCallback], None]): Функция записи файла
+        profile_name (str): Название блока для режима профилирования (см. profileSection)
+        log_dir (str): Папка логов пользователя (для файлов профилирования)
+    """
+    progressChanged = pyqtSignal(int)
+    finished = pyqtSignal()
+    failed = pyqtSignal(str, str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, write: Callable[[ProgressCallback], None], profile_name: str, log_dir: str):
+        super().__init__()
+
+        self.write = write
+        self.profile_name = profile_name
+        self.log_dir = log_dir
+        self.outcome: Optional[str] = None
+        self._cancel_requested = False
+        self._percent = -1
+
+    def cancel(self) -> None:
+        """Запрашивает отмену. Вызывается из GUI-потока, проверяется в потоке записи."""
+        self._cancel_requested = True
+
+    def _progress(self, done: int, total: int) -> None:
+        if self._cancel_requested:
+            raise ExportCancelled()
+
+        percent = min(100, done * 100 // total) if total > 0 else 100
+        if percent != self._percent:
+            self._percent = percent
+            self.progressChanged.emit(percent)
+
+    @pyqtSlot()
+    def run(self) -> None:
+        """Точка входа потока: записывает файл и сообщает результат сигналом."""
+        try:
+            with profileSection(self.profile_name, self.log_dir):
+                self.write(self._progress)
+
+            self.outcome = 'finished'
+            self.finished.emit()
+
+        except ExportCancelled:
+            self.outcome = 'cancelled'
+            self.cancelled.emit()
+
+        except PermissionError:
+            self.outcome = 'failed'
+            self.failed.emit('Ошибка доступа', 'Невозможно сохранить файл. Закройте файл если он открыт.')
+
+        except Exception as ex:
+            self.outcome = 'failed'
+            logging.error(f'Ошибка экспорта: {str(ex)}', exc_info=True)
+            self.failed.emit('Ошибка экспорта', f'Не удалось экспортировать данные:\n{str(ex)}')
+
+
+class ExportJob(QObject):
+    """Фоновый экспорт в файл: поток с ExportWorker и обработка его сигналов в GUI-потоке.
+
+    Объект создается и живет в GUI-потоке, поэтому сигналы воркера доставляются
+    в его слоты через очередь событий, а сообщения пользователю показываются в GUI-потоке.
+    Активные задачи хранятся в window.export_jobs, общий прогресс экспортов, которые может
+    отменить пользователь, выводится в window.exportProgressBar (см. updateExportProgress).
+
+    Signals:
+        finished (float): Файл записан, время экспорта в миллисекундах
+
+    Args:
+        window (QtWidgets.QWidget): Главное окно
+        title (str): Название экспорта для прогресса и сообщений ('результаты', ...)
+        file_path (str): Путь к файлу. При отмене или ошибке недописанный файл удаляется
+        write (Callable[[ProgressCallback], None]): Функция записи файла
+        profile_name (str): Название блока для режима профилирования
+        notify (bool): Показать сообщение об успешном завершении (иначе только строка статуса)
+        status (bool): Сообщить об успешном завершении в строке статуса (для служебной записи,
+            например истории запусков, - False; ошибки выводятся всегда)
+        cancellable (bool): Экспорт, запущенный пользователем: показывается в прогрессе экспорта,
+            отменяется кнопкой 'Отменить экспорт' и при закрытии окна. Служебная запись
+            (cancellable=False) не отменяется - при закрытии окна ее завершение дожидаются
+    """
+    finished = pyqtSignal(float)
+
+    def __init__(
+            self,
+            window: QtWidgets,
+            title: str,
+            file_path: str,
+            write: Callable[[ProgressCallback], None],
+            profile_name: str,
+            notify: bool = True,
+            status: bool = True,
+            cancellable: bool = True
+    ):
+        super().__init__(window)
+
+        self.window = window
+        self.title = title
+        self.file_path = file_path
+        self.notify = notify
+        self.status = status
+        self.cancellable = cancellable
+        self.percent = 0
+        self._started_at = 0.0
+
+        self.export_thread = QThread(self)
+        self.worker = ExportWorker(write, profile_name, window.log_dir)
+        self.worker.moveToThread(self.export_thread)
+
+        self.export_thread.started.connect(self.worker.run)
+        self.worker.progressChanged.connect(self._onProgress)
+        self.worker.finished.connect(self._onFinished)
+        self.worker.failed.connect(self._onFailed)
+        self.worker.cancelled.connect(self._onCancelled)
+
+        for signal in (self.worker.finished, self.worker.failed, self.worker.cancelled):
+            signal.connect(self.export_thread.quit)
+        self.export_thread.finished.connect(self.worker.deleteLater)
+
+    def start(self) -> None:
+        self._started_at = time.perf_counter()
+        self.window.export_jobs.append(self)
+        updateExportProgress(self.window)
+
+        self.export_thread.start()
+
+    def cancel(self) -> None:
+        self.worker.cancel()
+
+    def wait(self) -> None:
+        """Дожидается завершения потока записи (например, при закрытии окна).
+
+        Сигналы воркера в этом случае уже не обрабатываются, поэтому недописанный файл
+        (экспорт отменен или завершился ошибкой) удаляется здесь.
+        """
+        self.export_thread.quit()
+        self.export_thread.wait()
+
+        if self.worker.outcome != 'finished':
+            self._removePartialFile()
+
+    @pyqtSlot(int)
+    def _onProgress(self, percent: int) -> None:
+        self.percent = percent
+        updateExportProgress(self.window)
+
+    @pyqtSlot()
+    def _onFinished(self) -> None:
+        elapsed_ms = (time.perf_counter() - self._started_at) * 1000
+        self._close()
+
+        logging.info(f'Экспорт ({self.title}) завершен за {elapsed_ms / 1000:.2f} с: {self.file_path}')
+        if self.status:
+            self.window.statusLabel.setText(f'Экспорт ({self.title}) завершен: {os.path.basename(self.file_path)}')
+        self.finished.emit(elapsed_ms)
+
+        if self.notify:
+            QMessageBox.information(
+                self.window,
+                'Экспорт завершен',
+                f'Данные успешно экспортированы в файл:\n{self.file_path}'
+            )
+
+    @pyqtSlot(str, str)
+    def _onFailed(self, title: str, message: str) -> None:
+        self._close()
+        self._removePartialFile()
+
+        self.window.statusLabel.setText(f'Экспорт ({self.title}) не выполнен')
+        QMessageBox.critical(self.window, title, message)
+
+    @pyqtSlot()
+    def _onCancelled(self) -> None:
+        self._close()
+        self._removePartialFile()
+
+        logging.info(f'Экспорт ({self.title}) отменен: {self.file_path}')
+        self.window.statusLabel.setText(f'Экспорт ({self.title}) отменен')
+
+    def _close(self) -> None:
+        if self in self.window.export_jobs:
+            self.window.export_jobs.remove(self)
+        updateExportProgress(self.window)
+
+        self.export_thread.quit()
+        self.export_thread.wait()
+        self.deleteLater()
+
+    def _removePartialFile(self) -> None:
+        try:
+            if os.path.exists(self.file_path):
+                os.remove(self.file_path)
+        except OSError as ex:
+            logging.warning(f'Не удалось удалить недописанный файл {self.file_path}: {ex}')
+
+
+def startExportJob(
+        window: QtWidgets,
+        title: str,
+        file_path: str,
+        write: Callable[[ProgressCallback], None],
+        profile_name: str,
+        notify: bool = True,
+        status: bool = True,
+        cancellable: bool = True
+) -> ExportJob:
+    """Запускает фоновый экспорт (см. ExportJob) и возвращает задачу.
+
+    Args:
+        window (QtWidgets.QWidget): Главное окно
+        title (str): Название экспорта для прогресса и сообщений
+        file_path (str): Путь к файлу экспорта
+        write (Callable[[ProgressCallback], None]): Функция записи файла, выполняется в потоке экспорта.
+            Не должна обращаться к виджетам; данные для записи нужно захватить заранее
+        profile_name (str): Название блока для режима профилирования
+        notify (bool): Показать сообщение об успешном завершении
+        status (bool): Сообщить об успешном завершении в строке статуса
+        cancellable (bool): Экспорт может отменить пользователь (см. ExportJob)
+
+    Returns:
+        ExportJob: Запущенная задача (сигнал finished - время экспорта в мс)
+    """
+    job = ExportJob(window, title, file_path, write, profile_name, notify, status, cancellable)
+    job.start()
+
+    return job
+
+
+def cancellableExportJobs(window: QtWidgets) -> list[ExportJob]:
+    """Возвращает активные экспорты, которые может отменить пользователь (без служебной записи)."""
+    return [job for job in window.export_jobs if job.cancellable]
+
+
+def cancelExportJobs(window: QtWidgets) -> None:
+    """Отменяет активные экспорты пользователя (кнопка 'Отменить экспорт')."""
+    for job in cancellableExportJobs(window):
+        job.cancel()
+
+
+def waitExportJobs(window: QtWidgets, cancel: bool = False) -> None:
+    """Дожидается завершения всех потоков экспорта, при cancel=True - предварительно отменяет
+    экспорты пользователя (служебная запись дописывается)."""
+    if cancel:
+        cancelExportJobs(window)
+
+    for job in list(window.export_jobs):
+        job.wait()
+
+
+def updateExportProgress(window: QtWidgets) -> None:
+    """Показывает общий прогресс активных экспортов пользователя или скрывает прогресс, если их нет."""
+    jobs = cancellableExportJobs(window)
+    active = bool(jobs)
+
+    window.exportProgressBar.setVisible(active)
+    window.cancelExportButton.setVisible(active)
+
+    if not active:
+        window.exportProgressBar.setValue(0)
+        return
+
+    window.exportProgressBar.setValue(sum(job.percent for job in jobs) // len(jobs))
+    window.exportProgressBar.setFormat(f'Экспорт: {", ".join(job.title for job in jobs)} - %p%')
@@ -1,10 +1,8 @@
 import logging
 import os
 
-import pandas as pd
-
 from PyQt6 import QtWidgets
-from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem, QFileDialog, QTableWidget
+from PyQt6.QtWidgets import QMessageBox, QFileDialog, QTableView
 
 from tools.constants import AppConstants
 
@@ -77,6 +75,8 @@ def importSearchExcelFileToArray(window: QtWidgets, path: str) -> list[list[str]
     Raises:
         Exception: Логирует любые исключения при работе с файлом, но не пробрасывает их выше
     """
+    import pandas as pd
+
     try:
         try:
             df = pd.read_excel(path, dtype=str)
@@ -141,14 +141,14 @@ def importSearchExcelFileToArray(window: QtWidgets, path: str) -> list[list[str]
         return None
 
 
-def importListExcelFile(window: QtWidgets, table: QTableWidget) -> None:
+def importListExcelFile(window: QtWidgets, table: QTableView) -> None:
     """
-    Загружает данные из Excel файла в QTableWidget для Черного/Белого списка с валидацией.
+    Загружает данные из Excel файла в модель Черного/Белого списка с валидацией.
 
     Args:
         window (QtWidgets.QWidget): Родительское окно для диалоговых сообщений.
             Должно быть виджетом из QtWidgets для корректного отображения QMessageBox.
-        table (QTableWidget): Целевая таблица для загрузки данных
+        table (QTableView): Таблица списка с моделью PairListModel
 
     Raises:
         - Отсутствие файла или отмена выбора
@@ -163,7 +163,7 @@ def importListExcelFile(window: QtWidgets, table: QTableWidget) -> None:
         3. Валидирует структуру файла (заголовки столбцов)
         4. Удаляет пустые строки и ячейки
         5. Запрашивает подтверждение при наличии пустых значений
-        6. Загружает данные в таблицу Qt
+        6. Загружает данные в модель списка целиком, без поячеечного заполнения (дубли пропускаются)
         7. Выводит результат операции
     """
     file_path, _ = QFileDialog.getOpenFileName(
@@ -176,6 +176,8 @@ def importListExcelFile(window: QtWidgets, table: QTableWidget) -> None:
     if not file_path:
         return
 
+    import pandas as pd
+
     try:
         try:
             df = pd.read_excel(file_path, dtype=str)
@@ -227,21 +229,13 @@ def importListExcelFile(window: QtWidgets, table: QTableWidget) -> None:
             if reply == QMessageBox.StandardButton.No:
                 return
 
-        table.setRowCount(0)
-        table.setRowCount(len(df))
-
-        for row in range(len(df)):
-            for col in range(2):
-                value = str(df.iloc[row, col]).strip()
-                item = QTableWidgetItem(value)
-                table.setItem(row, col, item)
-
-        table.resizeColumnsToContents()
+        skipped = table.model().setPairs(df.iloc[:, :2].itertuples(index=False, name=None))
 
         QMessageBox.information(
             window,
             'Импорт завершен',
-            f'Успешно импортировано {len(df)} строк\nФайл: {os.path.basename(file_path)}'
+            f'Успешно импортировано {len(df) - skipped} строк (пропущено дублей: {skipped})\n'
+            f'Файл: {os.path.basename(file_path)}'
         )
 
     except PermissionError:
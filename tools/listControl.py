@@ -0,0 +1,141 @@
+from PyQt6 import QtWidgets
+from PyQt6.QtGui import QGuiApplication
+from PyQt6.QtWidgets import QMessageBox, QTableView
+
+from tools.listModel import PairListModel
+
+
+def addListRow(table: QTableView) -> None:
+    """
+    Добавляет пустую строку в конец черного/белого списка и открывает ее на редактирование.
+
+    Args:
+        table (QTableView): Таблица списка с моделью PairListModel.
+    """
+    model = table.model()
+    row = model.appendEmptyRow()
+
+    index = model.index(row, 0)
+    table.scrollTo(index)
+    table.setCurrentIndex(index)
+    table.edit(index)
+
+
+def removeListRows(window: QtWidgets.QWidget, table: QTableView) -> None:
+    """Удаляет выбранные строки черного/белого списка после подтверждения действия.
+
+    Args:
+        window (QtWidgets.QWidget): Родительское окно для диалоговых сообщений.
+            Должно быть виджетом из QtWidgets для корректного отображения QMessageBox.
+        table (QTableView): Таблица списка с моделью PairListModel.
+
+    Note:
+        - Все выбранные строки удаляются за один проход по данным списка.
+        - Перед удалением запрашивается подтверждение у пользователя.
+        - Показывает предупреждение, если не выбрано ни одной строки.
+    """
+    model = table.model()
+
+    if model.rowCount() == 0:
+        return
+
+    selected_rows = {index.row() for index in table.selectionModel().selectedIndexes()}
+
+    if not selected_rows:
+        QMessageBox.warning(
+            window,
+            'Не выбраны строки',
+            'Пожалуйста, выделите строки для удаления'
+        )
+        return
+
+    confirm = QMessageBox.question(
+        window,
+        'Подтверждение удаления',
+        f'Вы действительно хотите удалить {len(selected_rows)} строк(у)?',
+        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        QMessageBox.StandardButton.No
+    )
+
+    if confirm == QMessageBox.StandardButton.No:
+        return
+
+    model.removeViewRows(selected_rows)
+
+
+def validateListModel(window: QtWidgets, model: PairListModel) -> bool:
+    """Проверяет список на наличие строк с пустыми ячейками и удаляет их после подтверждения.
+
+    Args:
+        window (QtWidgets.QWidget): Родительское окно для диалоговых сообщений.
+            Должен быть виджетом из QtWidgets для корректного отображения QMessageBox.
+        model (PairListModel): Модель черного/белого списка.
+
+    Returns:
+        bool:
+            - True если список валиден (нет пустых ячеек) или пользователь подтвердил удаление
+            - False если пользователь отменил операцию удаления строк
+    """
+    rows_to_remove = model.incompleteRows()
+
+    if not rows_to_remove:
+        return True
+
+    reply = QMessageBox.question(
+        window,
+        'Пустые значения в таблице',
+        f'Найдено {len(rows_to_remove)} строк с пустыми значениями. Удалить эти строки?',
+        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        QMessageBox.StandardButton.No
+    )
+
+    if reply == QMessageBox.StandardButton.No:
+        return False
+
+    model.removeSourceRows(rows_to_remove)
+
+    return True
+
+
+def pasteListRows(window: QtWidgets, table: QTableView) -> None:
+    """Массово добавляет в список пары Бренд - Магазин из буфера обмена.
+
+    Ожидает текст в формате, который копирует Excel: строки разделены переводом строки,
+    ячейки - табуляцией. Используются только строки ровно с двумя заполненными ячейками,
+    дубли уже существующих пар пропускаются.
+
+    Args:
+        window (QtWidgets.QWidget): Главное окно приложения (для statusLabel).
+        table (QTableView): Таблица списка с моделью PairListModel.
+    """
+    text = QGuiApplication.clipboard().text()
+
+    if not text.strip():
+        return
+
+    pairs = []
+    invalid_count = 0
+
+    for line in text.splitlines():
+        cells = [cell.strip() for cell in line.split('\t') if cell.strip()]
+
+        if len(cells) == 2:
+            pairs.append(cells)
+        elif cells:
+            invalid_count += 1
+
+    added, skipped = table.model().addPairs(pairs)
+
+    window.statusLabel.setText(
+        f'Вставлено записей: {added}, пропущено дублей: {skipped}, некорректных строк: {invalid_count}'
+    )
+
+
+def searchList(table: QTableView, text: str) -> None:
+    """Оставляет в таблице списка только строки, содержащие text в бренде или магазине.
+
+    Args:
+        table (QTableView): Таблица списка с моделью PairListModel.
+        text (str): Строка поиска. Пустая строка показывает все строки.
+    """
+    table.model().setSearchText(text)
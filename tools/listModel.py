@@ -0,0 +1,303 @@
+import sys
+
+from typing import Any, Iterable, Optional
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+
+from tools.constants import AppConstants
+
+
+class PairListModel(QAbstractTableModel):
+    """Модель черного/белого списка (пары Бренд - Магазин) для QTableView.
+
+    Данные хранятся в двух параллельных списках строк (строки интернируются, поэтому
+    повторяющиеся бренды и магазины не дублируются в памяти). Заполненные пары
+    дополнительно хранятся в хеш-индексе (set), который обеспечивает:
+        - удаление дублей при вставке и редактировании
+        - проверку принадлежности пары списку за O(1) (используется в validateResult)
+
+    Строки с пустыми ячейками допускаются (новая строка до заполнения), но в индекс
+    не попадают и не учитываются при проверке принадлежности.
+
+    Модель ведет журнал добавленных и удаленных пар с момента последнего сохранения
+    (pendingChanges/clearChanges), чтобы в хранилище записывалась только разница.
+
+    Signals:
+        duplicateRejected (str, str): Испускается, если редактирование ячейки
+            привело бы к дублю уже существующей пары. Изменение при этом отклоняется.
+        contentChanged: Испускается при любом изменении данных списка
+            (но не при изменении строки поиска).
+    """
+    duplicateRejected = pyqtSignal(str, str)
+    contentChanged = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._headers = AppConstants.COLUMNS['LISTS']
+        self._brands: list[str] = []
+        self._stores: list[str] = []
+        self._pairs: set[tuple[str, str]] = set()
+
+        self._replaced = False
+        self._added: set[tuple[str, str]] = set()
+        self._removed: set[tuple[str, str]] = set()
+
+        self._visible: Optional[list[int]] = None
+        self._search_text = ''
+        self._search_keys: Optional[list[str]] = None
+
+    @staticmethod
+    def _normalize(value: Any) -> str:
+        return sys.intern(str(value).strip()) if value is not None else ''
+
+    def _invalidateSearch(self) -> None:
+        self._search_keys = None
+
+    def _addPair(self, pair: tuple[str, str]) -> None:
+        self._pairs.add(pair)
+
+        if pair in self._removed:
+            self._removed.discard(pair)
+        else:
+            self._added.add(pair)
+
+    def _discardPair(self, pair: tuple[str, str]) -> None:
+        if pair not in self._pairs:
+            return
+
+        self._pairs.discard(pair)
+
+        if pair in self._added:
+            self._added.discard(pair)
+        else:
+            self._removed.add(pair)
+
+    def pendingChanges(self) -> tuple[bool, list[tuple[str, str]], list[tuple[str, str]]]:
+        """Возвращает изменения списка с момента последнего clearChanges().
+
+        Returns:
+            tuple[bool, list, list]: Признак полной замены списка (setPairs), добавленные
+                и удаленные пары. При полной замене добавленными считаются все пары списка
+        """
+        if self._replaced:
+            return True, [tuple(pair) for pair in self.pairs()], []
+
+        return False, list(self._added), list(self._removed)
+
+    def clearChanges(self) -> None:
+        """Очищает журнал изменений (после успешной записи в хранилище или загрузки из него)."""
+        self._replaced = False
+        self._added, self._removed = set(), set()
+
+    def sourceRow(self, row: int) -> int:
+        """Преобразует номер строки представления (с учетом поиска) в номер строки данных."""
+        return row if self._visible is None else self._visible[row]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return len(self._brands) if self._visible is None else len(self._visible)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else 2
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return None
+
+        row = self.sourceRow(index.row())
+
+        return self._brands[row] if index.column() == 0 else self._stores[row]
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+
+        return str(section + 1)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+
+        row = self.sourceRow(index.row())
+        value = self._normalize(value)
+
+        old_pair = (self._brands[row], self._stores[row])
+        new_pair = (value, old_pair[1]) if index.column() == 0 else (old_pair[0], value)
+
+        if new_pair == old_pair:
+            return False
+
+        if all(new_pair) and new_pair in self._pairs:
+            self.duplicateRejected.emit(*new_pair)
+            return False
+
+        self._discardPair(old_pair)
+        if all(new_pair):
+            self._addPair(new_pair)
+
+        self._brands[row], self._stores[row] = new_pair
+        self._invalidateSearch()
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        self.contentChanged.emit()
+
+        return True
+
+    def totalRowCount(self) -> int:
+        """Количество строк в списке без учета поиска (включая незаполненные)."""
+        return len(self._brands)
+
+    def pairCount(self) -> int:
+        """Количество заполненных уникальных пар."""
+        return len(self._pairs)
+
+    def contains(self, brand: str, store: str) -> bool:
+        """Проверяет наличие пары в списке за O(1)."""
+        return (brand, store) in self._pairs
+
+    def pairSet(self) -> set[tuple[str, str]]:
+        """Возвращает копию хеш-индекса заполненных пар (снимок для потока парсинга)."""
+        return set(self._pairs)
+
+    def pairs(self) -> list[list[str]]:
+        """Возвращает заполненные пары в порядке строк списка (формат конфига парсера)."""
+        return [[brand, store] for brand, store in zip(self._brands, self._stores) if brand and store]
+
+    def incompleteRows(self) -> list[int]:
+        """Возвращает номера строк данных, содержащих пустые ячейки."""
+        return [row for row, (brand, store) in enumerate(zip(self._brands, self._stores)) if not (brand and store)]
+
+    def setPairs(self, pairs: Iterable[Iterable[Any]]) -> int:
+        """Полностью заменяет содержимое списка. Дубли и неполные пары пропускаются.
+
+        Args:
+            pairs (Iterable[Iterable[Any]]): Пары [бренд, магазин]
+
+        Returns:
+            int: Количество пропущенных строк (дубли и неполные пары)
+        """
+        self.beginResetModel()
+
+        self._brands, self._stores, self._pairs = [], [], set()
+        skipped = self._appendPairs(pairs)
+        self._replaced = True
+        self._added, self._removed = set(), set()
+
+        self._visible = None
+        self._search_text = ''
+        self._invalidateSearch()
+        self.endResetModel()
+        self.contentChanged.emit()
+
+        return skipped
+
+    def addPairs(self, pairs: Iterable[Iterable[Any]]) -> tuple[int, int]:
+        """Добавляет пары в конец списка (массовая вставка, например из буфера обмена).
+
+        Args:
+            pairs (Iterable[Iterable[Any]]): Пары [бренд, магазин]
+
+        Returns:
+            tuple[int, int]: Количество добавленных и пропущенных (дубли, неполные) пар
+        """
+        self.beginResetModel()
+
+        before = len(self._brands)
+        skipped = self._appendPairs(pairs)
+
+        self._visible = None
+        self._search_text = ''
+        self._invalidateSearch()
+        self.endResetModel()
+        self.contentChanged.emit()
+
+        return len(self._brands) - before, skipped
+
+    def _appendPairs(self, pairs: Iterable[Iterable[Any]]) -> int:
+        skipped = 0
+
+        for pair in pairs:
+            brand, store = (self._normalize(value) for value in pair)
+            key = (brand, store)
+
+            if not (brand and store) or key in self._pairs:
+                skipped += 1
+                continue
+
+            self._addPair(key)
+            self._brands.append(brand)
+            self._stores.append(store)
+
+        return skipped
+
+    def appendEmptyRow(self) -> int:
+        """Добавляет пустую строку в конец списка и сбрасывает поиск.
+
+        Returns:
+            int: Номер добавленной строки
+        """
+        if self._visible is not None:
+            self.setSearchText('')
+
+        row = len(self._brands)
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._brands.append('')
+        self._stores.append('')
+        self._invalidateSearch()
+        self.endInsertRows()
+
+        return row
+
+    def removeSourceRows(self, rows: Iterable[int]) -> None:
+        """Удаляет строки данных по их номерам за один проход по списку."""
+        rows = set(rows)
+
+        if not rows:
+            return
+
+        self.beginResetModel()
+
+        for row in rows:
+            self._discardPair((self._brands[row], self._stores[row]))
+
+        self._brands = [brand for row, brand in enumerate(self._brands) if row not in rows]
+        self._stores = [store for row, store in enumerate(self._stores) if row not in rows]
+        self._invalidateSearch()
+        self._visible = self._searchRows(self._search_text) if self._search_text else None
+
+        self.endResetModel()
+        self.contentChanged.emit()
+
+    def removeViewRows(self, rows: Iterable[int]) -> None:
+        """Удаляет строки по номерам строк представления (с учетом поиска)."""
+        self.removeSourceRows(self.sourceRow(row) for row in rows)
+
+    def _searchRows(self, text: str) -> list[int]:
+        if self._search_keys is None:
+            self._search_keys = [
+                f'{brand}\t{store}'.lower() for brand, store in zip(self._brands, self._stores)
+            ]
+
+        return [row for row, key in enumerate(self._search_keys) if text in key]
+
+    def setSearchText(self, text: str) -> None:
+        """Оставляет видимыми только строки, где бренд или магазин содержит text (без учета регистра)."""
+        self.beginResetModel()
+
+        self._search_text = text.strip().lower()
+        self._visible = self._searchRows(self._search_text) if self._search_text else None
+
+        self.endResetModel()
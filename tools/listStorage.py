@@ -0,0 +1,167 @@
+import logging
+import os
+import sqlite3
+
+from typing import Any, Iterable
+
+from tools.constants import AppConstants
+
+
+class ListStorage:
+    """Хранилище списков парсера (замена брендов, черный и белый списки) в SQLite.
+
+    База лежит рядом с конфигами пользователя (configs/{username}/) и содержит:
+        - brands: замены брендов (бренд в запросе -> бренд на сайте), ключ - бренд в запросе
+        - list_entries: пары Бренд - Магазин черного и белого списков,
+          уникальный индекс по (list_type, brand, store)
+
+    Порядок записей сохраняется через rowid (порядок вставки). Изменения записываются
+    по разнице с предыдущим состоянием, поэтому время сохранения зависит от количества
+    изменений, а не от размера списков.
+
+    Args:
+        username (str): Имя пользователя (папка конфигов)
+    """
+
+    PAIR_LISTS = ('blackList', 'whiteList')
+
+    def __init__(self, username: str):
+        config_dir = f'configs/{username}/'
+        os.makedirs(config_dir, exist_ok=True)
+
+        self.path = os.path.join(config_dir, AppConstants.LISTS_DATABASE)
+        self.connection = sqlite3.connect(self.path)
+
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS brands (
+                request_brand TEXT PRIMARY KEY,
+                site_brand TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS list_entries (
+                list_type TEXT NOT NULL,
+                brand TEXT NOT NULL,
+                store TEXT NOT NULL,
+                PRIMARY KEY (list_type, brand, store)
+            );
+        ''')
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def loadBrands(self) -> dict[str, str]:
+        """Возвращает замены брендов в порядке добавления."""
+        return dict(self.connection.execute('SELECT request_brand, site_brand FROM brands ORDER BY rowid'))
+
+    def loadPairs(self, list_type: str) -> list[tuple[str, str]]:
+        """Возвращает пары Бренд - Магазин списка list_type в порядке добавления."""
+        self._checkListType(list_type)
+
+        return self.connection.execute(
+            'SELECT brand, store FROM list_entries WHERE list_type = ? ORDER BY rowid',
+            (list_type,)
+        ).fetchall()
+
+    def countPairs(self, list_type: str) -> int:
+        """Возвращает количество пар в списке list_type по индексу, без загрузки списка."""
+        self._checkListType(list_type)
+
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM list_entries WHERE list_type = ?',
+            (list_type,)
+        ).fetchone()[0]
+
+    def saveBrands(self, old: dict[str, str], new: dict[str, str]) -> None:
+        """Записывает изменения замен брендов одной транзакцией.
+
+        Args:
+            old (dict[str, str]): Ранее сохраненные замены
+            new (dict[str, str]): Текущие замены
+        """
+        removed = [(key,) for key in old.keys() - new.keys()]
+        changed = [(key, value) for key, value in new.items() if old.get(key) != value]
+
+        with self.connection:
+            self.connection.executemany('DELETE FROM brands WHERE request_brand = ?', removed)
+            self.connection.executemany(
+                'INSERT INTO brands (request_brand, site_brand) VALUES (?, ?) '
+                'ON CONFLICT(request_brand) DO UPDATE SET site_brand = excluded.site_brand',
+                changed
+            )
+
+    def applyPairChanges(
+            self,
+            list_type: str,
+            replaced: bool,
+            added: Iterable[tuple[str, str]],
+            removed: Iterable[tuple[str, str]]
+    ) -> None:
+        """Записывает изменения черного/белого списка одной транзакцией.
+
+        Args:
+            list_type (str): 'blackList' или 'whiteList'
+            replaced (bool): Список заменен целиком (импорт) - старые записи удаляются
+            added (Iterable[tuple[str, str]]): Добавленные пары (при replaced - весь список)
+            removed (Iterable[tuple[str, str]]): Удаленные пары
+        """
+        self._checkListType(list_type)
+
+        with self.connection:
+            if replaced:
+                self.connection.execute('DELETE FROM list_entries WHERE list_type = ?', (list_type,))
+            else:
+                self.connection.executemany(
+                    'DELETE FROM list_entries WHERE list_type = ? AND brand = ? AND store = ?',
+                    ((list_type, brand, store) for brand, store in removed)
+                )
+
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO list_entries (list_type, brand, store) VALUES (?, ?, ?)',
+                ((list_type, brand, store) for brand, store in added)
+            )
+
+    def migrateFromConfig(self, parser_config: dict[str, Any]) -> bool:
+        """Однократно переносит списки из JSON-конфига парсера в базу.
+
+        Списки удаляются из parser_config; вызывающий код должен перезаписать JSON-файл.
+        Если в базе уже есть записи соответствующего списка, они не перезаписываются.
+
+        Args:
+            parser_config (dict[str, Any]): Загруженный JSON-конфиг парсера
+
+        Returns:
+            bool: True если в конфиге были списки и они перенесены
+        """
+        sections = [section for section in AppConstants.PARSER_LIST_SECTIONS if section in parser_config]
+
+        if not sections:
+            return False
+
+        brands = parser_config.pop('brandsList', None) or {}
+        pairs = {list_type: parser_config.pop(list_type, None) or [] for list_type in self.PAIR_LISTS}
+
+        with self.connection:
+            if not self.connection.execute('SELECT 1 FROM brands LIMIT 1').fetchone():
+                self.connection.executemany(
+                    'INSERT OR IGNORE INTO brands (request_brand, site_brand) VALUES (?, ?)',
+                    ((str(key).strip(), str(value).strip()) for key, value in brands.items() if str(key).strip())
+                )
+
+            for list_type, rows in pairs.items():
+                if self.countPairs(list_type):
+                    continue
+
+                self.connection.executemany(
+                    'INSERT OR IGNORE INTO list_entries (list_type, brand, store) VALUES (?, ?, ?)',
+                    ((list_type, str(row[0]).strip(), str(row[1]).strip()) for row in rows
+                     if len(row) == 2 and str(row[0]).strip() and str(row[1]).strip())
+                )
+
+        logging.info(f'Списки {", ".join(sections)} перенесены из конфига парсера в {self.path}')
+
+        return True
+
+    def _checkListType(self, list_type: str) -> None:
+        if list_type not in self.PAIR_LISTS:
+            raise ValueError(f'Неподдерживаемый тип списка: {list_type}')
@@ -0,0 +1,133 @@
+import glob
+import logging
+import os
+import queue
+
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
+
+from tools.constants import AppConstants
+
+
+LOG_FORMAT = '%(levelname)s (%(asctime)s): %(message)s (Line: %(lineno)d) [%(filename)s]'
+LOG_DATE_FORMAT = '%d/%m/%Y %I:%M:%S'
+
+_listener: Optional[QueueListener] = None
+_file_handler: Optional[RotatingFileHandler] = None
+_log_queue: Optional[queue.SimpleQueue] = None
+
+
+class _RunRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler, который дополнительно ротирует файл по служебной записи из очереди.
+
+    Ротация выполняется в потоке QueueListener после записи всех ранее поставленных
+    в очередь сообщений, поэтому они попадают в предыдущий файл.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if getattr(record, 'rollover', False):
+            if self.stream is not None and self.stream.tell() > 0:
+                self.doRollover()
+            return
+
+        super().emit(record)
+
+
+def setupLogging(log_file: str, level: str = AppConstants.DEFAULT_LOG_LEVEL) -> None:
+    """Настраивает асинхронное логирование в файл с ротацией.
+
+    Потоки приложения (GUI и парсинг) только кладут записи в очередь (QueueHandler),
+    запись в файл выполняет отдельный поток QueueListener. Файл ротируется по размеру
+    (AppConstants.LOG_MAX_BYTES), хранится AppConstants.LOG_BACKUP_COUNT предыдущих файлов
+    (logs.log.1, logs.log.2, ...).
+
+    Args:
+        log_file (str): Путь к файлу логов
+        level (str): Уровень логирования ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+    """
+    global _listener, _file_handler, _log_queue
+
+    stopLogging()
+
+    os.makedirs(os.path.dirname(log_file) or '.', exist_ok=True)
+
+    _file_handler = _RunRotatingFileHandler(
+        log_file,
+        maxBytes=AppConstants.LOG_MAX_BYTES,
+        backupCount=AppConstants.LOG_BACKUP_COUNT,
+        encoding='UTF-8'
+    )
+    _file_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+
+    _log_queue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(QueueHandler(_log_queue))
+    setLogLevel(level)
+
+    _listener = QueueListener(_log_queue, _file_handler)
+    _listener.start()
+
+
+def setLogLevel(level: str) -> None:
+    """Устанавливает уровень логирования. Записи ниже уровня отбрасываются до постановки в очередь.
+
+    Args:
+        level (str): Название уровня ('DEBUG', 'INFO', 'WARNING', 'ERROR').
+            Неизвестное значение заменяется на AppConstants.DEFAULT_LOG_LEVEL
+    """
+    level = str(level).upper()
+
+    if level not in AppConstants.LOG_LEVELS:
+        level = AppConstants.DEFAULT_LOG_LEVEL
+
+    logging.getLogger().setLevel(level)
+
+
+def rotateLogFile() -> None:
+    """Начинает новый файл логов (например, перед запуском парсинга).
+
+    Текущий файл сохраняется как logs.log.1 (более старые сдвигаются), поэтому логи
+    предыдущих запусков остаются доступны. Пустой файл не ротируется.
+
+    Ротация ставится в очередь логирования, поэтому все записи, сделанные до вызова,
+    остаются в предыдущем файле.
+    """
+    if _log_queue is None:
+        return
+
+    _log_queue.put_nowait(logging.makeLogRecord({'rollover': True}))
+
+
+def removeOldLogFiles(directory: str, pattern: str, keep: int) -> None:
+    """Удаляет старые файлы по шаблону имени, оставляя keep последних (по имени с датой).
+
+    Args:
+        directory (str): Папка с файлами
+        pattern (str): Шаблон имени (glob), например 'requests_*.jsonl'
+        keep (int): Сколько последних файлов оставить
+    """
+    files = sorted(glob.glob(os.path.join(directory, pattern)))
+
+    for path in files[:-keep] if keep > 0 else files:
+        try:
+            os.remove(path)
+        except OSError as ex:
+            logging.warning(f'Не удалось удалить старый файл {path}: {ex}')
+
+
+def stopLogging() -> None:
+    """Дописывает записи из очереди в файл и останавливает поток логирования."""
+    global _listener, _file_handler, _log_queue
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+    if _file_handler is not None:
+        _file_handler.close()
+        _file_handler = None
+
+    _log_queue = None
@@ -0,0 +1,107 @@
+from typing import Any
+
+
+OFFER_FIELDS = (
+    'priceV2', 'qtyV2', 'descr_qtyV2', 'class_cat',
+    'class_user', 'descr_price', 'delivery_days'
+)
+
+
+def _lenientFloat(value: Any) -> float:
+    """Число для полей, которые нужны только фильтрам: None и нечисловые значения - 0.0."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _lenientFlag(value: Any) -> bool:
+    """Признак 'равно 1' для полей фильтров: None и нечисловые значения - False."""
+    return _lenientFloat(value) == 1
+
+
+class OfferRecord:
+    """Предложение магазина из ответа API с типизированными полями.
+
+    Хранит только поля, которые используют validateResult и createResultsRow
+    (ответ API содержит больше полей). Значения приводятся к нужным типам один раз
+    при разборе ответа, поэтому фильтрация и сборка строк результата не проверяют
+    и не преобразуют их повторно.
+
+    Обязательны только поля строки результата (OFFER_FIELDS). Поля, которые используют
+    только фильтры (instock, rating, class_man), могут отсутствовать и приводятся мягко:
+    пустое или нечисловое значение дает False / 0.0 / '', а не ошибку разбора всего
+    ответа - при выключенных фильтрах эти поля не влияют на результат.
+
+    Attributes:
+        price (int): Цена (priceV2, целая часть)
+        qty (int): Количество (qtyV2, отрицательные значения приравниваются к 0)
+        qty_description (str): Описание количества (descr_qtyV2)
+        part_name (str): Название детали (class_cat)
+        brand (str): Производитель (class_man, '' если поля нет)
+        store (str): Магазин (class_user)
+        payment_terms (str): Условия оплаты (descr_price)
+        delivery_days (int): Срок доставки в днях
+        in_stock (bool): Товар в наличии (instock == 1)
+        rating (float): Рейтинг магазина
+    """
+
+    __slots__ = (
+        'price', 'qty', 'qty_description', 'part_name', 'brand',
+        'store', 'payment_terms', 'delivery_days', 'in_stock', 'rating'
+    )
+
+    def __init__(self, offer: dict[str, Any]):
+        self.price = int(offer['priceV2'])
+        self.qty = max(int(offer['qtyV2']), 0)
+        self.qty_description = str(offer['descr_qtyV2'])
+        self.part_name = str(offer['class_cat'])
+        self.brand = offer.get('class_man', '')
+        self.store = offer['class_user']
+        self.payment_terms = str(offer['descr_price'])
+        self.delivery_days = int(offer['delivery_days'])
+        self.in_stock = _lenientFlag(offer.get('instock'))
+        self.rating = _lenientFloat(offer.get('rating'))
+
+    def __repr__(self) -> str:
+        return f'OfferRecord({self.brand!r}, {self.store!r}, price={self.price}, qty={self.qty})'
+
+
+def projectOffers(table: Any) -> list[OfferRecord]:
+    """Преобразует список предложений из ответа API в список OfferRecord.
+
+    Формат проверяется для ответа целиком: при успешном разборе проверок по каждой
+    записи нет, а при ошибке определяется первая неверная запись для сообщения.
+
+    Args:
+        table (Any): Значение поля table ответа API (ожидается list[dict])
+
+    Returns:
+        list[OfferRecord]: Предложения в исходном порядке
+
+    Raises:
+        ValueError: Если table не список или в предложении нет нужного поля
+            (OFFER_FIELDS) или значение нельзя привести к нужному типу
+    """
+    if not isinstance(table, list):
+        raise ValueError(f'Поле table должно быть списком, получен {type(table).__name__}')
+
+    try:
+        return [OfferRecord(offer) for offer in table]
+    except (KeyError, TypeError, ValueError):
+        pass
+
+    for i, offer in enumerate(table, 1):
+        if not isinstance(offer, dict):
+            raise ValueError(f'Предложение {i} должно быть dict, получен {type(offer).__name__}')
+
+        missing_keys = set(OFFER_FIELDS) - offer.keys()
+        if missing_keys:
+            raise ValueError(f'Отсутствуют обязательные ключи в предложении {i}: {missing_keys}')
+
+        try:
+            OfferRecord(offer)
+        except (TypeError, ValueError) as ex:
+            raise ValueError(f'Неверное значение в предложении {i}: {ex}') from ex
+
+    raise ValueError('Неверный формат предложений')
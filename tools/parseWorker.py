@@ -0,0 +1,450 @@
+import datetime
+import logging
+import os
+import sqlite3
+import time
+
+from typing import Optional
+
+from PyQt6 import QtWidgets
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from tools.constants import AppConstants
+
+from tools.configControl import parserListPairs
+from tools.exportControl import resultExportFormat, standardResultFilePath
+from tools.priceHistory import PriceHistory
+from tools.profiling import profileSection
+from tools.requestMetrics import RequestMetricsLog
+from tools.runHistory import configSnapshot, inputHash
+from tools.runReport import RunStats, errorReason
+from tools.resultControl import generateColumns, validateResult, createResultsRow
+from tools.resultSink import ResultSink, openResultSink
+
+
+def formatDuration(seconds: float) -> str:
+    """Форматирует длительность в секундах в строку вида ЧЧ:ММ:СС.
+
+    Args:
+        seconds (float): Длительность в секундах. Отрицательные значения приравниваются к нулю.
+
+    Returns:
+        str: Строка формата 'ЧЧ:ММ:СС'
+
+    Examples:
+        >>> formatDuration(3725)
+        '01:02:05'
+    """
+    seconds = max(0, int(round(seconds)))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+
+    return f'{hours:02d}:{minutes:02d}:{seconds:02d}'
+
+
+class ParseWorker(QObject):
+    """Выполняет парсинг артикулов в отдельном потоке (QThread).
+
+    Воркер не обращается к виджетам окна: все изменения интерфейса передаются
+    через типизированные сигналы и выполняются в GUI-потоке. Из окна читаются
+    только данные (api_url, api_keys, parser_config, app_config). Черный и белый
+    списки копируются при создании воркера (в GUI-потоке), поэтому правки списков
+    во время парсинга на него не влияют.
+
+    При включенных быстром экспорте и потоковой записи (app_config['streamExport'])
+    строки результата сразу записываются в файл (см. ResultSink). Для CSV и JSONL строки
+    при этом не хранятся в памяти во время парсинга, но после парсинга результат целиком
+    загружается из файла в DataFrame для таблицы результатов, истории запусков и экспорта,
+    поэтому пик памяти в конце запуска такой же, как без потоковой записи.
+
+    Для каждого ошибочного артикула сохраняются код и причина ошибки (см. errorReason)
+    и количество попыток. При повторном запуске только ошибочных артикулов (attempts)
+    потоковая запись не используется: результаты объединяются с предыдущими в GUI-потоке.
+
+    Signals:
+        progressChanged (int, int, str, float, float): Количество обработанных артикулов,
+            общее количество, текущий артикул, скорость (артикулов в секунду)
+            и оставшееся время в секундах. Испускается не чаще, чем раз
+            в AppConstants.PROGRESS_REFRESH_INTERVAL секунд.
+        finished (pd.DataFrame, pd.DataFrame, dict): Результаты парсинга, ошибочные артикулы
+            (колонки AppConstants.COLUMNS['ERRORS']) и отчет о запуске (см. RunStats.report).
+            Если результаты записаны потоково, в отчете есть result_file - путь к файлу,
+            для повторного запуска - retry=True. Для истории запусков в отчет добавляются
+            started_at, input_hash и config (см. runMeta).
+        failed (str): Текст ошибки, если поток парсинга аварийно завершился.
+
+    Args:
+        window (QtWidgets.QWidget): Главное окно
+        search_data (list[list[str]]): Пары [бренд, артикул] для парсинга
+        attempts (Optional[dict[tuple[str, str], int]]): Для повторного запуска ошибочных
+            артикулов - количество уже выполненных попыток по паре (бренд, артикул)
+    """
+    progressChanged = pyqtSignal(int, int, str, float, float)
+    finished = pyqtSignal(object, object, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, window: QtWidgets, search_data: list[list[str]],
+                 attempts: Optional[dict[tuple[str, str], int]] = None):
+        super().__init__()
+
+        self.window = window
+        self.search_data = search_data
+        self.attempts = attempts
+
+        config = window.parser_config
+        self.black_list = parserListPairs(window, 'blackList') if config.get('useBlackList') == 'True' else set()
+        self.white_list = parserListPairs(window, 'whiteList') if config.get('useWhiteList') == 'True' else set()
+        self.config_snapshot = configSnapshot(config, window.app_config, self.black_list, self.white_list)
+
+        self._started_at = 0.0
+        self._last_emit_at = 0.0
+        self.stats: Optional[RunStats] = None
+        self.sink: Optional[ResultSink] = None
+        self.price_history: Optional[PriceHistory] = None
+
+    def _pause(self) -> None:
+        """Выдерживает паузу между запросами (app_config['timeDelay']) и учитывает ее в отчете."""
+        started_at = time.perf_counter()
+        time.sleep(self.window.app_config['timeDelay'])
+        self.stats.addTime('delay', (time.perf_counter() - started_at) * 1000)
+
+    def _openSink(self, columns: list[str]) -> Optional[ResultSink]:
+        """Открывает потоковую запись результатов, если она включена в настройках.
+
+        Returns:
+            Optional[ResultSink]: Открытый файл или None (запись выключена, формат ее
+                не поддерживает или файл не удалось создать - тогда результаты
+                экспортируются после парсинга, как раньше)
+        """
+        app_config = self.window.app_config
+
+        if (self.attempts is not None
+                or app_config.get('fastExport') != 'True' or app_config.get('streamExport') != 'True'):
+            return None
+
+        export_format = resultExportFormat(app_config)
+        file_path = standardResultFilePath(app_config, self.window.base_save_path, export_format)
+
+        try:
+            sink = openResultSink(export_format, file_path, columns)
+        except Exception as ex:
+            logging.error(f'Не удалось открыть файл результатов {file_path}: {ex}')
+            return None
+
+        if sink is None:
+            logging.info(f'Формат {export_format} не поддерживает потоковую запись, экспорт после парсинга')
+        else:
+            logging.info(f'Потоковая запись результатов: {file_path}')
+
+        return sink
+
+    def _storeRow(self, row: list, success_rows: list[list]) -> None:
+        """Сохраняет строку результата: в файл (потоковая запись) и/или в память.
+
+        При ошибке записи потоковая запись отключается: уже записанные строки загружаются
+        из файла (для CSV/JSONL) и вместе с незаписанными возвращаются в success_rows.
+        """
+        sink = self.sink
+
+        if sink is not None:
+            started_at = time.perf_counter()
+
+            try:
+                sink.write(row)
+            except Exception as ex:
+                logging.error(f'Ошибка потоковой записи результатов в {sink.path}: {ex}', exc_info=True)
+
+                self.sink = None
+                sink.abort()
+
+                if sink.reloadable:
+                    success_rows.extend(sink.load().values.tolist())
+                    success_rows.extend(sink.pendingRows())
+                    return
+            finally:
+                self.stats.addTime('export', (time.perf_counter() - started_at) * 1000)
+
+            if sink.reloadable:
+                return
+
+        success_rows.append(row)
+
+    def _openPriceHistory(self, started_at: str, input_hash: str) -> Optional[PriceHistory]:
+        """Открывает историю цен в потоке парсинга и регистрирует в ней запуск.
+
+        Returns:
+            Optional[PriceHistory]: История цен или None, если базу не удалось открыть
+                (парсинг продолжается без записи истории)
+        """
+        try:
+            price_history = PriceHistory(self.window.username)
+            price_history.prune()
+            price_history.startRun(started_at, input_hash)
+        except (sqlite3.Error, OSError) as ex:
+            logging.error(f'Не удалось открыть историю цен: {ex}')
+            return None
+
+        return price_history
+
+    def _recordPrices(self, brand: str, article: str, offers: list) -> None:
+        """Добавляет предложения артикула после фильтрации в историю цен.
+
+        При ошибке записи история цен отключается до конца запуска.
+        """
+        price_history = self.price_history
+
+        if price_history is None:
+            return
+
+        started_at = time.perf_counter()
+
+        try:
+            price_history.add(brand, article, offers)
+        except sqlite3.Error as ex:
+            logging.error(f'Ошибка записи истории цен {price_history.path}: {ex}', exc_info=True)
+
+            self.price_history = None
+            price_history.close()
+        finally:
+            self.stats.addTime('history', (time.perf_counter() - started_at) * 1000)
+
+    def _closePriceHistory(self) -> None:
+        """Записывает оставшиеся предложения и закрывает историю цен."""
+        price_history, self.price_history = self.price_history, None
+
+        if price_history is None:
+            return
+
+        started_at = time.perf_counter()
+
+        try:
+            price_history.flush()
+        except sqlite3.Error as ex:
+            logging.error(f'Ошибка записи истории цен {price_history.path}: {ex}', exc_info=True)
+        finally:
+            price_history.close()
+            self.stats.addTime('history', (time.perf_counter() - started_at) * 1000)
+
+    def _attempt(self, brand: str, article: str) -> int:
+        """Возвращает номер попытки запроса артикула (1 - первый запуск)."""
+        return (self.attempts or {}).get((brand, article), 0) + 1
+
+    @staticmethod
+    def _errorRow(record: dict) -> list:
+        """Формирует строку ошибочного артикула (AppConstants.COLUMNS['ERRORS']) из записи замеров."""
+        code = record.get('error') or 'request'
+
+        return [record['brand'], record['article'], code, errorReason(code, record.get('status')), record['attempt']]
+
+    def _emitProgress(self, processed: int, total: int, article: str, force: bool = False) -> None:
+        """Испускает progressChanged, объединяя частые обновления до фиксированной частоты.
+
+        Args:
+            processed (int): Количество обработанных артикулов
+            total (int): Общее количество артикулов
+            article (str): Текущий артикул
+            force (bool): Испустить сигнал независимо от частоты обновления
+        """
+        now = time.monotonic()
+
+        if not force and now - self._last_emit_at < AppConstants.PROGRESS_REFRESH_INTERVAL:
+            return
+
+        self._last_emit_at = now
+
+        elapsed = now - self._started_at
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        eta = (total - processed) / rate if rate > 0 else 0.0
+
+        self.progressChanged.emit(processed, total, article, rate, eta)
+
+    @pyqtSlot()
+    def run(self) -> None:
+        """
+        Точка входа потока воркера: выполняет парсинг, в режиме профилирования -
+        под cProfile и tracemalloc (см. profileSection).
+        """
+        with profileSection('parse', self.window.log_dir):
+            self._parse()
+
+    def _parse(self) -> None:
+        """
+        Основной метод парсинга, выполняемый в потоке воркера.
+
+        Note:
+            1. Для каждого элемента в search_data:
+               - Нормализует артикул и бренд
+               - Формирует и отправляет API-запрос
+               - Обрабатывает ответ (success/error)
+               - Сохраняет результаты
+               - Выдерживает паузу между запросами
+            2. Строки результатов копятся в списках, DataFrame собирается один раз в конце.
+               При потоковой записи строки сразу пишутся в файл (см. _storeRow), для CSV/JSONL
+               DataFrame загружается из этого файла
+            3. По завершении испускает finished, при аварии - failed
+            4. pandas и requests импортируются здесь, а не при запуске приложения
+            5. Для каждого запроса пишется запись замеров в JSONL (см. RequestMetricsLog),
+               по замерам формируется отчет о запуске (см. RunStats)
+            6. Предложения после фильтрации (все, не только топ-10) записываются
+               в историю цен (см. PriceHistory)
+            7. Ошибочный артикул (ошибка запроса или обработки ответа) попадает в df_errors
+               с кодом, причиной ошибки и номером попытки
+        """
+        try:
+            import pandas as pd
+
+            from tools.APIRequst import safeAPIRequest
+
+            window = self.window
+            columns = generateColumns(10)
+            success_rows = []
+            error_rows = []
+            total_items = len(self.search_data)
+
+            self._started_at = time.monotonic()
+            self._last_emit_at = 0.0
+            started_at = datetime.datetime.now().isoformat(timespec='seconds')
+            input_hash = inputHash(self.search_data)
+            self.stats = RunStats(len(window.api_keys))
+
+            metrics_log = RequestMetricsLog(os.path.join(window.log_dir, 'metrics'))
+            self.sink = self._openSink(columns)
+            self.price_history = self._openPriceHistory(started_at, input_hash)
+
+            try:
+                for i, (brand, article) in enumerate((item[0], str(item[1]).replace('#', '')) for item
+                                                     in self.search_data):
+                    record = {'ts': None, 'article': article, 'brand': brand, 'key_index': i % len(window.api_keys)}
+                    stored = False
+
+                    try:
+                        normalized_brand = window.parser_config['brandsList'].get(brand, brand)
+                        record['brand'] = normalized_brand
+                        record['attempt'] = self._attempt(normalized_brand, article)
+
+                        self._emitProgress(i, total_items, article)
+
+                        params = {
+                            'api_key': window.api_keys[record['key_index']],
+                            'code_region': window.parser_config['regionCode'],
+                            'partnumber': article,
+                            'class_man': normalized_brand,
+                            "type_request": 5,
+                            'login': '',
+                            'password': '',
+                            'search_text': article,
+                            'row_count': 500
+                        }
+
+                        response_data = safeAPIRequest(window, params, record)
+
+                        if not response_data:
+                            error_rows.append(self._errorRow(record))
+
+                            self._pause()
+                            continue
+
+                        result_row = [
+                            normalized_brand,
+                            article,
+                            response_data['price_min_instock'],
+                            response_data['price_avg_instock'],
+                            response_data['price_max_instock'],
+                            response_data['price_min_order'],
+                            response_data['price_avg_order'],
+                            response_data['price_max_order'],
+                        ]
+
+                        offers = response_data['table']
+                        filter_started_at = time.perf_counter()
+                        validated_data = validateResult(window, offers, self.black_list, self.white_list)
+                        record['filter_ms'] = (time.perf_counter() - filter_started_at) * 1000
+                        record['offers_before'] = len(offers)
+                        record['offers_after'] = len(validated_data)
+
+                        self._recordPrices(normalized_brand, article, validated_data)
+
+                        assemble_started_at = time.perf_counter()
+
+                        if not validated_data:
+                            result_row.extend(['Данные отсутствуют'])
+                            result_row += [''] * (len(columns) - len(result_row))
+                            self._storeRow(result_row, success_rows)
+                            stored = True
+                            record['assemble_ms'] = (time.perf_counter() - assemble_started_at) * 1000
+
+                            self._pause()
+                            continue
+
+                        result_data = validated_data[:10] if len(validated_data) > 10 else validated_data
+                        result_row = createResultsRow(result_row, result_data)
+
+                        if len(validated_data) < 10:
+                            result_row.extend(['Больше данных нет'])
+                            result_row += [''] * (len(columns) - len(result_row))
+
+                        self._storeRow(result_row, success_rows)
+                        stored = True
+                        record['assemble_ms'] = (time.perf_counter() - assemble_started_at) * 1000
+
+                        self._pause()
+
+                    except Exception as ex:
+                        record['error'] = record.get('error') or 'processing'
+                        logging.error(f'Ошибка обработки артикула {article}: {str(ex)}')
+
+                        if not stored:
+                            record.setdefault('attempt', self._attempt(record['brand'], article))
+                            error_rows.append(self._errorRow(record))
+
+                        self._pause()
+                        continue
+
+                    finally:
+                        record['ts'] = round(time.time(), 3)
+                        metrics_log.write(record)
+                        self.stats.add(record)
+
+            finally:
+                metrics_log.close()
+                self._closePriceHistory()
+
+            self._emitProgress(total_items, total_items, '', force=True)
+
+            report = self.stats.report(time.monotonic() - self._started_at)
+            report['metrics_file'] = metrics_log.path
+            report['retry'] = self.attempts is not None
+            report.update(started_at=started_at, input_hash=input_hash, config=self.config_snapshot)
+
+            sink, self.sink = self.sink, None
+            if sink is not None:
+                report['result_file'] = sink.path
+
+                close_started_at = time.perf_counter()
+                sink.close(report)
+                report['time_split_ms']['export'] += (time.perf_counter() - close_started_at) * 1000
+
+            assemble_started_at = time.perf_counter()
+            if sink is not None and sink.reloadable:
+                df_success = sink.load()
+            else:
+                df_success = pd.DataFrame(success_rows, columns=columns)
+            df_errors = pd.DataFrame(error_rows, columns=AppConstants.COLUMNS['ERRORS'])
+            report['time_split_ms']['assemble'] += (time.perf_counter() - assemble_started_at) * 1000
+
+            self.finished.emit(df_success, df_errors, report)
+
+        except Exception as ex:
+            logging.error(f'Ошибка внутри потока: {str(ex)}')
+            self.failed.emit(str(ex))
+
+        finally:
+            if self.sink is not None:
+                sink, self.sink = self.sink, None
+
+                try:
+                    sink.close()
+                    logging.info(f'Частичный результат сохранен: {sink.path}')
+                except Exception as ex:
+                    logging.error(f'Не удалось закрыть файл результатов {sink.path}: {ex}')
+                    sink.abort()
@@ -0,0 +1,342 @@
+import datetime
+import logging
+import os
+import re
+import sqlite3
+
+from typing import Iterable, Optional
+
+from tools.constants import AppConstants
+from tools.offerRecord import OfferRecord
+
+
+PARTITION_PREFIX = 'offers_'
+PARTITION_PATTERN = re.compile(r'^offers_(\d{6})$')
+
+
+def _dayNumber(day: datetime.date) -> int:
+    """Дата в формате колонки day: целое ГГГГММДД."""
+    return day.year * 10000 + day.month * 100 + day.day
+
+
+def _dayFromNumber(number: int) -> datetime.date:
+    return datetime.date(number // 10000, number // 100 % 100, number % 100)
+
+
+def _partitionName(day: datetime.date) -> str:
+    """Таблица месяца: offers_ГГГГММ."""
+    return f'{PARTITION_PREFIX}{day.year:04d}{day.month:02d}'
+
+
+class PriceHistory:
+    """История цен: все предложения магазинов после фильтрации (validateResult) за каждый запуск.
+
+    База SQLite лежит рядом с историей запусков (runs/{username}/). Записи только добавляются:
+    предложения хранятся в таблицах по месяцам offers_ГГГГММ (секционирование по дате),
+    старше AppConstants.PRICE_HISTORY_MONTHS месяцев таблицы удаляются целиком. Запрос
+    за период читает только таблицы попавших в него месяцев. Артикулы и магазины
+    хранятся справочниками (articles, stores), в таблицах предложений - только их
+    целые идентификаторы, поэтому записи и индексы компактны.
+
+    Индексы каждой таблицы месяца:
+        - (article_id, store_id, day, in_stock, price) - цены артикула и магазина по артикулу
+        - (store_id, day, price) - динамика цен магазина по всем артикулам
+
+    Оба индекса покрывающие: запросы minPrice, storeMinPrices и storeTrend читают только
+    индекс, поэтому отвечают за миллисекунды и при миллионах записей.
+
+    Соединение SQLite можно использовать только в потоке, где объект создан
+    (поток парсинга создает свой объект).
+
+    Args:
+        username (str): Имя пользователя (папка истории запусков)
+    """
+
+    def __init__(self, username: str):
+        directory = f'runs/{username}'
+        os.makedirs(directory, exist_ok=True)
+
+        self.path = os.path.join(directory, AppConstants.PRICE_HISTORY_DATABASE)
+        self.connection = sqlite3.connect(self.path)
+        self.run_id: Optional[int] = None
+        self._pending: list[tuple] = []
+        self._article_ids: dict[tuple[str, str], int] = {}
+        self._store_ids: dict[str, int] = {}
+
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY,
+                started_at TEXT NOT NULL,
+                input_hash TEXT
+            );
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY,
+                brand TEXT NOT NULL,
+                article TEXT NOT NULL,
+                UNIQUE (brand, article)
+            );
+            CREATE TABLE IF NOT EXISTS stores (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
+            );
+        ''')
+        self._partitions = set(self._existingPartitions())
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _existingPartitions(self) -> list[str]:
+        return [name for name, in self.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE ?", (f'{PARTITION_PREFIX}%',)
+        ) if PARTITION_PATTERN.match(name)]
+
+    def _ensurePartition(self, name: str) -> None:
+        if name in self._partitions:
+            return
+
+        self.connection.executescript(f'''
+            CREATE TABLE IF NOT EXISTS {name} (
+                run_id INTEGER NOT NULL,
+                day INTEGER NOT NULL,
+                article_id INTEGER NOT NULL,
+                store_id INTEGER NOT NULL,
+                price INTEGER NOT NULL,
+                qty INTEGER NOT NULL,
+                delivery_days INTEGER NOT NULL,
+                in_stock INTEGER NOT NULL,
+                rating REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS {name}_article ON {name} (article_id, store_id, day, in_stock, price);
+            CREATE INDEX IF NOT EXISTS {name}_store ON {name} (store_id, day, price);
+        ''')
+        self._partitions.add(name)
+
+    def _partitionsFor(self, first_day: datetime.date, last_day: datetime.date) -> list[str]:
+        """Существующие таблицы месяцев, пересекающихся с периодом.
+
+        Список таблиц читается из sqlite_master при каждом запросе: таблицы создает и удаляет
+        и другой объект (поток парсинга), а кеш self._partitions нужен только записи (_ensurePartition).
+        """
+        first, last = _partitionName(first_day), _partitionName(last_day)
+
+        return sorted(name for name in self._existingPartitions() if first <= name <= last)
+
+    def _articleId(self, brand: str, article: str, create: bool = False) -> Optional[int]:
+        """Идентификатор артикула из справочника (create=True - добавляет новый)."""
+        key = (brand, article)
+        article_id = self._article_ids.get(key)
+
+        if article_id is None:
+            if create:
+                self.connection.execute('INSERT OR IGNORE INTO articles (brand, article) VALUES (?, ?)', key)
+            row = self.connection.execute('SELECT id FROM articles WHERE brand = ? AND article = ?', key).fetchone()
+            if row is None:
+                return None
+
+            article_id = self._article_ids[key] = row[0]
+
+        return article_id
+
+    def _storeId(self, store: str, create: bool = False) -> Optional[int]:
+        """Идентификатор магазина из справочника (create=True - добавляет новый)."""
+        store_id = self._store_ids.get(store)
+
+        if store_id is None:
+            if create:
+                self.connection.execute('INSERT OR IGNORE INTO stores (name) VALUES (?)', (store,))
+            row = self.connection.execute('SELECT id FROM stores WHERE name = ?', (store,)).fetchone()
+            if row is None:
+                return None
+
+            store_id = self._store_ids[store] = row[0]
+
+        return store_id
+
+    def startRun(self, started_at: str, input_hash: Optional[str] = None) -> int:
+        """Регистрирует запуск, к которому относятся следующие записи (add).
+
+        Args:
+            started_at (str): Время начала запуска (ISO)
+            input_hash (Optional[str]): Хеш входного списка артикулов (см. inputHash)
+
+        Returns:
+            int: Идентификатор запуска
+        """
+        with self.connection:
+            self.run_id = self.connection.execute(
+                'INSERT INTO runs (started_at, input_hash) VALUES (?, ?)', (started_at, input_hash)
+            ).lastrowid
+
+        return self.run_id
+
+    def add(self, brand: str, article: str, offers: Iterable[OfferRecord],
+            day: Optional[datetime.date] = None) -> None:
+        """Добавляет предложения артикула, при заполнении буфера записывает их в базу.
+
+        Args:
+            brand (str): Бренд (после замены брендов)
+            article (str): Артикул
+            offers (Iterable[OfferRecord]): Предложения после фильтрации
+            day (Optional[datetime.date]): Дата наблюдения (по умолчанию - сегодня)
+
+        Raises:
+            sqlite3.Error: Если не удалось записать буфер
+        """
+        day = day or datetime.date.today()
+        run_id, day_number, partition = self.run_id, _dayNumber(day), _partitionName(day)
+
+        self._pending.extend(
+            (partition, run_id, day_number, (brand, article), offer.store, offer.price, offer.qty,
+             offer.delivery_days, int(offer.in_stock), offer.rating)
+            for offer in offers
+        )
+
+        if len(self._pending) >= AppConstants.PRICE_HISTORY_FLUSH_ROWS:
+            self.flush()
+
+    def flush(self) -> None:
+        """Записывает буфер одной транзакцией (по таблицам месяцев)."""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        by_partition = {}
+
+        with self.connection:
+            for partition, run_id, day, key, store, *values in pending:
+                by_partition.setdefault(partition, []).append(
+                    (run_id, day, self._articleId(*key, create=True), self._storeId(store, create=True), *values)
+                )
+
+            for partition in by_partition:
+                self._ensurePartition(partition)
+
+            for partition, rows in by_partition.items():
+                self.connection.executemany(
+                    f'INSERT INTO {partition} (run_id, day, article_id, store_id, price, qty, delivery_days, '
+                    'in_stock, rating) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    rows
+                )
+
+    def prune(self, today: Optional[datetime.date] = None) -> None:
+        """Удаляет таблицы месяцев старше AppConstants.PRICE_HISTORY_MONTHS месяцев."""
+        today = today or datetime.date.today()
+        months = today.year * 12 + today.month - 1 - AppConstants.PRICE_HISTORY_MONTHS
+        oldest = _partitionName(datetime.date(months // 12, months % 12 + 1, 1))
+
+        for name in sorted(self._existingPartitions()):
+            if name >= oldest:
+                break
+
+            self.connection.execute(f'DROP TABLE IF EXISTS {name}')
+            self._partitions.discard(name)
+            logging.info(f'История цен: удалена таблица {name}')
+
+    def _period(self, days: int, today: Optional[datetime.date]) -> tuple[datetime.date, datetime.date]:
+        today = today or datetime.date.today()
+
+        return today - datetime.timedelta(days=max(1, days) - 1), today
+
+    def minPrice(self, brand: str, article: str, days: int = AppConstants.PRICE_HISTORY_DAYS,
+                 in_stock: Optional[bool] = None, today: Optional[datetime.date] = None) -> Optional[int]:
+        """Минимальная цена артикула за последние days дней.
+
+        Args:
+            brand (str): Бренд
+            article (str): Артикул
+            days (int): Период в днях, включая сегодня
+            in_stock (Optional[bool]): Только в наличии (True), только под заказ (False) или все
+            today (Optional[datetime.date]): Последний день периода (по умолчанию - сегодня)
+
+        Returns:
+            Optional[int]: Минимальная цена или None, если предложений за период нет
+        """
+        article_id = self._articleId(brand, article)
+        if article_id is None:
+            return None
+
+        first_day, last_day = self._period(days, today)
+        condition = 'article_id = ? AND day BETWEEN ? AND ?'
+        params = [article_id, _dayNumber(first_day), _dayNumber(last_day)]
+
+        if in_stock is not None:
+            condition += ' AND in_stock = ?'
+            params.append(int(in_stock))
+
+        prices = [
+            price for partition in self._partitionsFor(first_day, last_day)
+            for price, in self.connection.execute(f'SELECT MIN(price) FROM {partition} WHERE {condition}', params)
+            if price is not None
+        ]
+
+        return min(prices) if prices else None
+
+    def storeMinPrices(self, brand: str, article: str, days: int = AppConstants.PRICE_HISTORY_DAYS,
+                       today: Optional[datetime.date] = None) -> dict[str, int]:
+        """Минимальная цена артикула по магазинам за последние days дней.
+
+        Returns:
+            dict[str, int]: Магазин -> минимальная цена
+        """
+        article_id = self._articleId(brand, article)
+        if article_id is None:
+            return {}
+
+        first_day, last_day = self._period(days, today)
+        result = {}
+
+        for partition in self._partitionsFor(first_day, last_day):
+            for store_id, price in self.connection.execute(
+                    f'SELECT store_id, MIN(price) FROM {partition} '
+                    'WHERE article_id = ? AND day BETWEEN ? AND ? GROUP BY store_id',
+                    (article_id, _dayNumber(first_day), _dayNumber(last_day))
+            ):
+                result[store_id] = min(price, result.get(store_id, price))
+
+        names = dict(self.connection.execute(
+            f'SELECT id, name FROM stores WHERE id IN ({", ".join("?" * len(result))})', list(result)
+        )) if result else {}
+
+        return {names[store_id]: price for store_id, price in result.items()}
+
+    def storeTrend(self, store: str, brand: Optional[str] = None, article: Optional[str] = None,
+                   days: int = AppConstants.PRICE_HISTORY_DAYS,
+                   today: Optional[datetime.date] = None) -> list[tuple[datetime.date, int, float, int]]:
+        """Динамика цен магазина по дням: по одному артикулу или по всем артикулам магазина.
+
+        Args:
+            store (str): Магазин
+            brand (Optional[str]): Бренд (вместе с article - динамика цены одного артикула)
+            article (Optional[str]): Артикул
+            days (int): Период в днях, включая сегодня
+            today (Optional[datetime.date]): Последний день периода (по умолчанию - сегодня)
+
+        Returns:
+            list[tuple[datetime.date, int, float, int]]: (день, минимальная цена, средняя цена,
+                количество предложений) по возрастанию дня, дни без предложений пропускаются
+        """
+        store_id = self._storeId(store)
+        article_id = self._articleId(brand, article) if brand is not None and article is not None else None
+        if store_id is None or (brand is not None and article is not None and article_id is None):
+            return []
+
+        first_day, last_day = self._period(days, today)
+
+        if article_id is not None:
+            condition = 'article_id = ? AND store_id = ?'
+            params = [article_id, store_id]
+        else:
+            condition = 'store_id = ?'
+            params = [store_id]
+
+        trend = []
+        for partition in self._partitionsFor(first_day, last_day):
+            trend += self.connection.execute(
+                f'SELECT day, MIN(price), AVG(price), COUNT(*) FROM {partition} '
+                f'WHERE {condition} AND day BETWEEN ? AND ? GROUP BY day ORDER BY day',
+                params + [_dayNumber(first_day), _dayNumber(last_day)]
+            ).fetchall()
+
+        return [(_dayFromNumber(day), min_price, avg_price, count) for day, min_price, avg_price, count in trend]
@@ -0,0 +1,173 @@
+import cProfile
+import datetime
+import io
+import logging
+import os
+import pstats
+import threading
+import tracemalloc
+
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from tools.constants import AppConstants
+from tools.logControl import removeOldLogFiles
+
+
+_tracing_lock = threading.Lock()
+_tracing_sections = 0
+_tracing_started = False
+_profiler_active = False
+
+
+def profilingEnabled() -> bool:
+    """Проверяет, включен ли режим профилирования (переменная окружения PROFILING=1 или .env)."""
+    return os.getenv('PROFILING', '').strip().lower() in {'1', 'true', 'yes'}
+
+
+@contextmanager
+def profileSection(name: str, output_dir: str) -> Iterator[None]:
+    """Профилирует блок кода, если включен режим профилирования.
+
+    Для блока сохраняются рядом с logs.log:
+        - profile_{name}_{дата}_{поток}.prof: статистика cProfile (открывается pstats, snakeviz и др.)
+        - profile_{name}_{дата}_{поток}.txt: топ функций по суммарному времени и топ мест
+          выделения памяти (tracemalloc)
+
+    cProfile профилирует только текущий поток, поэтому блок должен выполняться
+    в том потоке, где работает профилируемый код (например, в ParseWorker.run).
+    Блоки могут выполняться одновременно в разных потоках (несколько экспортов):
+    tracemalloc общий для процесса, поэтому он запускается первым активным блоком
+    и останавливается последним (счетчик под блокировкой). Активным может быть только
+    один cProfile на процесс (с Python 3.12 второй выбрасывает ValueError), поэтому
+    вложенные и одновременные блоки профилируют только память, без .prof файла.
+
+    Args:
+        name (str): Название блока ('parse', 'export' и т.д.), входит в имя файла
+        output_dir (str): Папка для файлов профилирования (папка логов пользователя)
+    """
+    if not profilingEnabled():
+        yield
+        return
+
+    _startTracing()
+    profiler = _startProfiler()
+
+    try:
+        yield
+    finally:
+        _stopProfiler(profiler)
+        snapshot = _stopTracing()
+
+        try:
+            _saveProfile(name, output_dir, profiler, snapshot)
+        except Exception as ex:
+            logging.exception(f'Не удалось сохранить результаты профилирования {name}: {ex}')
+
+
+def _startTracing() -> None:
+    """Учитывает активный блок, первый блок запускает tracemalloc (если он еще не запущен)."""
+    global _tracing_sections, _tracing_started
+
+    with _tracing_lock:
+        if _tracing_sections == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(AppConstants.PROFILE_TRACEMALLOC_FRAMES)
+            _tracing_started = True
+
+        _tracing_sections += 1
+
+
+def _startProfiler() -> Optional[cProfile.Profile]:
+    """Запускает cProfile, если в процессе нет другого активного профилировщика.
+
+    Returns:
+        Optional[cProfile.Profile]: Запущенный профилировщик или None (активен другой блок
+            или другой инструмент профилирования)
+    """
+    global _profiler_active
+
+    with _tracing_lock:
+        if _profiler_active:
+            return None
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as ex:
+            logging.warning(f'cProfile не запущен: {ex}')
+            return None
+
+        _profiler_active = True
+
+    return profiler
+
+
+def _stopProfiler(profiler: Optional[cProfile.Profile]) -> None:
+    global _profiler_active
+
+    if profiler is None:
+        return
+
+    with _tracing_lock:
+        profiler.disable()
+        _profiler_active = False
+
+
+def _stopTracing() -> Optional[tracemalloc.Snapshot]:
+    """Снимает снимок памяти и завершает блок, последний блок останавливает tracemalloc.
+
+    Returns:
+        Optional[tracemalloc.Snapshot]: Снимок или None, если tracemalloc остановлен извне
+    """
+    global _tracing_sections, _tracing_started
+
+    with _tracing_lock:
+        snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        _tracing_sections -= 1
+
+        if _tracing_sections == 0 and _tracing_started:
+            tracemalloc.stop()
+            _tracing_started = False
+
+    return snapshot
+
+
+def _saveProfile(name: str, output_dir: str, profiler: Optional[cProfile.Profile],
+                 snapshot: Optional[tracemalloc.Snapshot]) -> None:
+    os.makedirs(output_dir, exist_ok=True)
+
+    base_path = os.path.join(
+        output_dir, f'profile_{name}_{datetime.datetime.now():%Y%m%d_%H%M%S}_{threading.get_ident()}'
+    )
+
+    stats_text = io.StringIO()
+    if profiler is not None:
+        profiler.dump_stats(f'{base_path}.prof')
+        pstats.Stats(profiler, stream=stats_text).sort_stats('cumulative').print_stats(AppConstants.PROFILE_TOP_COUNT)
+    else:
+        stats_text.write('cProfile не запускался: в процессе уже профилируется другой блок\n')
+
+    memory_lines = ['Снимок памяти недоступен: tracemalloc остановлен']
+    if snapshot is not None:
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>')
+        ])
+        memory_lines = [
+            f'{index}. {stat.size / 1024:.1f} КБ, блоков: {stat.count}\n    ' + '\n    '.join(stat.traceback.format())
+            for index, stat in enumerate(snapshot.statistics('lineno')[:AppConstants.PROFILE_TOP_COUNT], start=1)
+        ]
+
+    with open(f'{base_path}.txt', 'w', encoding='utf-8') as f:
+        f.write(f'Профиль {name}: топ {AppConstants.PROFILE_TOP_COUNT} функций по суммарному времени\n')
+        f.write(stats_text.getvalue())
+        f.write(f'\nТоп {AppConstants.PROFILE_TOP_COUNT} мест выделения памяти (tracemalloc)\n')
+        f.write('\n'.join(memory_lines))
+        f.write('\n')
+
+    removeOldLogFiles(output_dir, f'profile_{name}_*.prof', AppConstants.PROFILE_FILES_COUNT)
+    removeOldLogFiles(output_dir, f'profile_{name}_*.txt', AppConstants.PROFILE_FILES_COUNT)
+
+    saved_files = f'{base_path}.prof, {base_path}.txt' if profiler is not None else f'{base_path}.txt'
+    logging.info(f'Результаты профилирования {name} сохранены: {saved_files}')
+
@@ -0,0 +1,45 @@
+import datetime
+import json
+import os
+
+from typing import Any
+
+from tools.constants import AppConstants
+from tools.logControl import removeOldLogFiles
+
+
+class RequestMetricsLog:
+    """Структурированный журнал замеров запросов к API (JSONL, одна запись на запрос).
+
+    Для каждого запуска парсинга создается отдельный файл
+    {directory}/requests_ГГГГММДД_ЧЧММСС.jsonl, хранятся последние
+    AppConstants.METRICS_FILES_COUNT файлов. Запись буферизуется и выполняется
+    только из потока парсинга, поэтому стоимость одной записи - сериализация
+    небольшого словаря.
+
+    Поля записи:
+        - ts: Время окончания обработки артикула (unix time)
+        - article, brand: Артикул и бренд запроса
+        - key_index: Номер API-ключа в списке ключей
+        - status, error, bytes, ttfb_ms, latency_ms, parse_ms: см. safeAPIRequest
+        - filter_ms, assemble_ms: Время фильтрации предложений и сборки строки результата
+        - offers_before, offers_after: Количество предложений до и после фильтрации
+
+    Args:
+        directory (str): Папка для файлов замеров (папка логов пользователя)
+    """
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+
+        self.path = os.path.join(directory, f'requests_{datetime.datetime.now():%Y%m%d_%H%M%S}.jsonl')
+        self._file = open(self.path, 'w', encoding='utf-8', buffering=1 << 16)
+
+        removeOldLogFiles(directory, 'requests_*.jsonl', AppConstants.METRICS_FILES_COUNT)
+
+    def write(self, record: dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False))
+        self._file.write('\n')
+
+    def close(self) -> None:
+        self._file.close()
@@ -1,8 +1,7 @@
-from typing import Any
-
 from PyQt6 import QtWidgets
 
 from tools.constants import AppConstants
+from tools.offerRecord import OfferRecord
 
 
 def generateColumns(amount: int) -> list[str]:
@@ -51,7 +50,7 @@ def generateColumns(amount: int) -> list[str]:
     if amount < 1:
         raise ValueError(f'Количество магазинов должно быть >= 1, получено {amount}')
 
-    columns = AppConstants.COLUMNS['RESULT']
+    columns = list(AppConstants.COLUMNS['RESULT'])
 
     for i in range(1, amount + 1):
         columns.extend([
@@ -67,22 +66,30 @@ def generateColumns(amount: int) -> list[str]:
     return columns
 
 
-def validateResult(window: QtWidgets, response_data_table: list[dict]) -> list[dict]:
+def validateResult(
+        window: QtWidgets,
+        response_data_table: list[OfferRecord],
+        black_list: set[tuple[str, str]],
+        white_list: set[tuple[str, str]]
+) -> list[OfferRecord]:
     """
     Фильтрует результаты парсинга согласно заданным в конфигурации правилам.
 
     Args:
         window (QtWidgets.QWidget): Родительское окно для диалоговых сообщений.
             Должно быть виджетом из QtWidgets для корректного отображения QMessageBox.
-        response_data_table (list[dict]): Список словарей с данными для фильтрации, где каждый словарь содержит:
+        response_data_table (list[OfferRecord]): Предложения из ответа API (см. projectOffers), используются поля:
             - delivery_days: int - срок доставки
-            - instock: int - наличие товара (1 - в наличии)
+            - in_stock: bool - наличие товара
+            - qty_description: str - описание количества (проверка гарантии)
             - rating: float - рейтинг магазина
-            - class_man: str - идентификатор производителя
-            - class_user: str - идентификатор пользователя
+            - brand: str - производитель (class_man)
+            - store: str - магазин (class_user)
+        black_list (set[tuple[str, str]]): Пары (class_man, class_user) черного списка
+        white_list (set[tuple[str, str]]): Пары (class_man, class_user) белого списка
 
     Returns:
-        list[dict]: Отфильтрованный список словарей, соответствующий всем условиям фильтрации
+        list[OfferRecord]: Отфильтрованный список предложений, соответствующий всем условиям фильтрации
 
     Note:
         Применяются следующие фильтры (если включены в конфигурации):
@@ -91,41 +98,46 @@ def validateResult(window: QtWidgets, response_data_table: list[dict]) -> list[d
         3. Ограничение по рейтингу магазина
         4. Черный список производителей/пользователей
         5. Белый список производителей/пользователей
+
+        Принадлежность пары черному/белому списку проверяется за O(1)
+        по множеству пар (см. parserListPairs). Пустой список не применяется.
+        Настройки фильтров читаются один раз на вызов, а не для каждого предложения.
     """
     results = []
     config = window.parser_config
 
-    for item in response_data_table:
-        if config.get('isDeliveryDateLimit') == 'True':
-            if item['delivery_days'] > config['deliveryDateLimit']:
-                continue
+    delivery_limit = config['deliveryDateLimit'] if config.get('isDeliveryDateLimit') == 'True' else None
+    only_in_stock = config.get('onlyInStock') == 'True'
+    only_with_guarantee = config.get('onlyWithGuarantee') == 'True'
+    rating_limit = config['storeRatingLimit'] if config.get('isStoreRatingLimit') == 'True' else None
+    use_black_list = config.get('useBlackList') == 'True' and len(black_list) > 0
+    use_white_list = config.get('useWhiteList') == 'True' and len(white_list) > 0
+
+    for offer in response_data_table:
+        if delivery_limit is not None and offer.delivery_days > delivery_limit:
+            continue
 
-        if config.get('onlyInStock') == 'True' and item['instock'] != 1:
+        if only_in_stock and not offer.in_stock:
             continue
 
-        if config.get('onlyWithGuarantee') == 'True' and item['descr_qtyV2'].lower().find('гарантия') == -1:
+        if only_with_guarantee and offer.qty_description.lower().find('гарантия') == -1:
             continue
 
-        if config.get('isStoreRatingLimit') == 'True':
-            if item['rating'] < config['storeRatingLimit']:
-                continue
+        if rating_limit is not None and offer.rating < rating_limit:
+            continue
 
-        if config.get('useBlackList') == 'True' and config['blackList']:
-            item_pair = [item['class_man'], item['class_user']]
-            if item_pair in config['blackList']:
-                continue
+        if use_black_list and (offer.brand, offer.store) in black_list:
+            continue
 
-        if config.get('useWhiteList') == 'True' and config['whiteList']:
-            item_pair = [item['class_man'], item['class_user']]
-            if item_pair not in config['whiteList']:
-                continue
+        if use_white_list and (offer.brand, offer.store) not in white_list:
+            continue
 
-        results.append(item)
+        results.append(offer)
 
     return results
 
 
-def createResultsRow(result_data_row: list[str], table: list[dict[str, Any]]) -> list[str]:
+def createResultsRow(result_data_row: list[str], table: list[OfferRecord]) -> list[str]:
     """Формирует строку данных для DataFrame на основе результатов парсинга.
 
     Расширяет базовую строку результата (result_data_row) данными о товарах из таблицы,
@@ -137,38 +149,34 @@ def createResultsRow(result_data_row: list[str], table: list[dict[str, Any]]) ->
             - Артикул
             - Мин/Сред/Макс наличие
             - Мин/Сред/Макс под заказ
-        table (list[dict[str, Any]]): Список словарей с данными о товарах, где каждый словарь
-            должен содержать следующие ключи:
-            - priceV2: Цена товара
-            - qty: Количество товара
-            - descr_qtyV2: Описание количества
-            - class_cat: Категория товара
-            - class_user: Название магазина
-            - descr_price: Условия оплаты
-            - delivery_days: Сроки доставки
+        table (list[OfferRecord]): Предложения (см. projectOffers). Формат и типы полей
+            проверены при разборе ответа, поэтому здесь не проверяются
 
     Returns:
         list[str]: Результирующая строка, содержащая:
             - Исходные данные из result_data_row
-            - Добавленные данные из table (по 7 полей на каждый элемент)
+            - Добавленные данные из table (по 7 полей на каждый элемент): цена, количество,
+              описание количества, название детали, магазин, условия оплаты, срок доставки
 
     Raises:
-        KeyError: Если в словаре table отсутствуют обязательные ключи
         TypeError: Если входные параметры не соответствуют ожидаемым типам
 
     Examples:
         >>> base_row = ["Brand", "Art123", "10", "15", "20", "5", "8", "12"]
-        >>> table_data = [
+        >>> table_data = projectOffers([
         ...     {
-        ...         'priceV2': '100',
-        ...         'qty': '5',
+        ...         'priceV2': 100.5,
+        ...         'qtyV2': 5,
         ...         'descr_qtyV2': 'В наличии',
         ...         'class_cat': 'Категория',
+        ...         'class_man': 'Brand',
         ...         'class_user': 'Магазин1',
         ...         'descr_price': 'Оплата картой',
-        ...         'delivery_days': '2'
+        ...         'delivery_days': 2,
+        ...         'instock': 1,
+        ...         'rating': 5
         ...     }
-        ... ]
+        ... ])
         >>> createResultsRow(base_row, table_data)
         [
             'Brand', 'Art123', '10', '15', '20', '5', '8', '12',
@@ -180,27 +188,15 @@ def createResultsRow(result_data_row: list[str], table: list[dict[str, Any]]) ->
     if not isinstance(table, list):
         raise TypeError(f'table должен быть list, получен {type(table).__name__}')
 
-    required_keys = {
-        'priceV2', 'qtyV2', 'descr_qtyV2',
-        'class_cat', 'class_user',
-        'descr_price', 'delivery_days'
-    }
-
-    for i, row in enumerate(table, 1):
-        if not isinstance(row, dict):
-            raise TypeError(f'Элемент {i} в table должен быть dict, получен {type(row).__name__}')
-        missing_keys = required_keys - row.keys()
-        if missing_keys:
-            raise KeyError(f'Отсутствуют обязательные ключи в записи {i}: {missing_keys}')
-
-        result_data_row.extend([
-            str(int(row['priceV2'])),
-            str(row['qtyV2'] if row['qtyV2'] >= 0 else 0),
-            str(row['descr_qtyV2']),
-            str(row['class_cat']),
-            str(row['class_user']),
-            str(row['descr_price']),
-            str(row['delivery_days'])
-        ])
+    for offer in table:
+        result_data_row.extend((
+            str(offer.price),
+            str(offer.qty),
+            offer.qty_description,
+            offer.part_name,
+            str(offer.store),
+            offer.payment_terms,
+            str(offer.delivery_days)
+        ))
 
     return result_data_row
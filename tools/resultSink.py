@@ -0,0 +1,301 @@
+import abc
+import csv
+import io
+import json
+import logging
+import time
+
+from typing import Any, Optional, TYPE_CHECKING
+
+from tools.constants import AppConstants
+from tools.exportControl import (
+    RESULT_COLORED_COLUMNS, RESULT_SHEET_NAME, FormatRegistry, addResultConditionalFormats,
+    resultStyles, writeRunReportSheet, writeRunReportSidecar, writeTableHeader, writeTableRow
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class ResultSink(abc.ABC):
+    """Потоковая запись строк результата в файл во время парсинга.
+
+    Строки копятся в буфере и записываются в файл каждые AppConstants.STREAM_FLUSH_ROWS строк
+    или AppConstants.STREAM_FLUSH_INTERVAL секунд, поэтому при аварийном завершении
+    в файле остаются все строки до последнего сброса. Если запись не удалась, строки
+    остаются в буфере (см. pendingRows).
+
+    Attributes:
+        path (str): Путь к файлу
+        columns (list[str]): Колонки результата
+        rows_written (int): Строк записано в файл (без буфера)
+        reloadable (bool): Результат можно загрузить из файла (метод load есть только у таких
+            файлов, см. _TextResultSink), поэтому потоку парсинга не нужно хранить строки в памяти
+
+    Args:
+        file_path (str): Путь к файлу
+        columns (list[str]): Колонки результата (см. generateColumns)
+    """
+    reloadable = False
+
+    def __init__(self, file_path: str, columns: list[str]):
+        self.path = file_path
+        self.columns = columns
+        self.rows_written = 0
+        self._pending: list[list[Any]] = []
+        self._flushed_at = time.monotonic()
+
+    def write(self, row: list[Any]) -> None:
+        """Добавляет строку результата, при заполнении буфера сбрасывает его в файл.
+
+        Raises:
+            OSError: Если не удалось записать файл (строки остаются в буфере)
+        """
+        self._pending.append(row)
+
+        if (len(self._pending) >= AppConstants.STREAM_FLUSH_ROWS
+                or time.monotonic() - self._flushed_at >= AppConstants.STREAM_FLUSH_INTERVAL):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self._writeRows(self._pending)
+            self.rows_written += len(self._pending)
+            self._pending = []
+
+        self._flushed_at = time.monotonic()
+
+    def pendingRows(self) -> list[list[Any]]:
+        """Возвращает строки, не записанные в файл (после ошибки записи)."""
+        return self._pending
+
+    @abc.abstractmethod
+    def close(self, run_report: Optional[dict[str, Any]] = None) -> None:
+        """Записывает оставшиеся строки и закрывает файл.
+
+        Args:
+            run_report (Optional[dict[str, Any]]): Отчет о запуске (лист Excel или файл
+                '{имя}.report.json' рядом с CSV/JSONL, см. writeRunReportSidecar)
+        """
+
+    @abc.abstractmethod
+    def abort(self) -> None:
+        """Закрывает файл без записи буфера (после ошибки записи), ошибки закрытия не выбрасываются."""
+
+    @abc.abstractmethod
+    def _writeRows(self, rows: list[list[Any]]) -> None:
+        """Записывает строки буфера в файл."""
+
+
+class _TextResultSink(ResultSink):
+    """Текстовый файл: одна строка результата - одна строка файла.
+
+    Буфер форматируется и записывается одним вызовом write с последующим flush,
+    поэтому файл всегда заканчивается целой строкой (кроме сбоя самой записи).
+    """
+    reloadable = True
+    encoding = 'utf-8'
+
+    def __init__(self, file_path: str, columns: list[str]):
+        super().__init__(file_path, columns)
+
+        self._file = open(file_path, 'w', encoding=self.encoding, newline='')
+        header = self._formatHeader()
+        if header:
+            self._file.write(header)
+            self._file.flush()
+
+    def close(self, run_report: Optional[dict[str, Any]] = None) -> None:
+        try:
+            self.flush()
+        finally:
+            self._file.close()
+
+        if run_report is not None:
+            writeRunReportSidecar(self.path, run_report)
+
+    def abort(self) -> None:
+        try:
+            self._file.close()
+        except OSError as ex:
+            logging.warning(f'Не удалось закрыть файл результатов {self.path}: {ex}')
+
+    def _writeRows(self, rows: list[list[Any]]) -> None:
+        self._file.write(self._formatRows(rows))
+        self._file.flush()
+
+    @abc.abstractmethod
+    def load(self) -> 'pd.DataFrame':
+        """Загружает записанные в файл строки (без буфера)."""
+
+    def _formatHeader(self) -> str:
+        return ''
+
+    @abc.abstractmethod
+    def _formatRows(self, rows: list[list[Any]]) -> str:
+        """Форматирует строки буфера в текст файла."""
+
+
+def _parseNumber(text: str) -> Any:
+    """Возвращает число, если строка CSV содержит число, иначе исходную строку."""
+    for number_type in (int, float):
+        try:
+            return number_type(text)
+        except ValueError:
+            pass
+
+    return text
+
+
+class CSVResultSink(_TextResultSink):
+    """CSV в формате writeResultCSV: UTF-8 с BOM, разделитель AppConstants.CSV_SEPARATOR."""
+    encoding = 'utf-8-sig'
+
+    def _formatHeader(self) -> str:
+        return self._formatRows([self.columns])
+
+    def _formatRows(self, rows: list[list[Any]]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer, delimiter=AppConstants.CSV_SEPARATOR, lineterminator='\n').writerows(rows)
+
+        return buffer.getvalue()
+
+    def load(self) -> 'pd.DataFrame':
+        """Загружает записанные строки. Цены сводки (Мин/Сред/Макс) приводятся к числам,
+        остальные колонки остаются строками, как при сборке результата."""
+        import pandas as pd
+
+        numeric_columns = [column for column in self.columns if column in RESULT_COLORED_COLUMNS]
+
+        return pd.read_csv(
+            self.path,
+            sep=AppConstants.CSV_SEPARATOR,
+            encoding=self.encoding,
+            nrows=self.rows_written,
+            dtype={column: str for column in self.columns if column not in numeric_columns},
+            converters={column: _parseNumber for column in numeric_columns},
+            keep_default_na=False
+        )
+
+
+class JSONLResultSink(_TextResultSink):
+    """JSON Lines в формате writeResultJSONL: одна строка результата - один JSON-объект."""
+
+    def _formatRows(self, rows: list[list[Any]]) -> str:
+        columns = self.columns
+
+        return ''.join(json.dumps(dict(zip(columns, row)), ensure_ascii=False) + '\n' for row in rows)
+
+    def load(self) -> 'pd.DataFrame':
+        import pandas as pd
+
+        if self.rows_written == 0:
+            return pd.DataFrame(columns=self.columns)
+
+        data = pd.read_json(self.path, lines=True, nrows=self.rows_written, dtype=False, convert_dates=False)
+
+        return data.reindex(columns=self.columns)
+
+
+class XLSXResultSink(ResultSink):
+    """Excel с оформлением writeResultWorkbook в режиме constant_memory.
+
+    Строки сразу уходят во временный файл xlsxwriter, но сам .xlsx собирается только
+    при закрытии: после аварийного завершения файла нет, поэтому потоку парсинга
+    по-прежнему нужно хранить строки (reloadable = False). Ширина колонок задается
+    по заголовкам - данные заранее неизвестны. Когда лист заполняется (бюджет ячеек
+    AppConstants.EXPORT_SHEET_CELLS, см. planResultPartitions), строки продолжаются
+    на следующем листе 'Проценка товаров (2)' и т.д.
+    """
+
+    def __init__(self, file_path: str, columns: list[str]):
+        super().__init__(file_path, columns)
+
+        import xlsxwriter
+
+        self._workbook = xlsxwriter.Workbook(file_path, {'constant_memory': True})
+        self._formats = FormatRegistry(self._workbook)
+
+        header_styles, data_styles = resultStyles(columns)
+        self._header_formats = [self._formats[style] for style in header_styles]
+        self._column_formats = [self._formats[style] for style in data_styles]
+        self._sheet_budget = max(
+            1, min(AppConstants.EXCEL_MAX_ROWS - 1, AppConstants.EXPORT_SHEET_CELLS // max(1, len(columns)))
+        )
+        self._sheets = 0
+        self._addSheet()
+
+    def _addSheet(self) -> None:
+        self._sheets += 1
+        self._sheet_rows = 0
+        self._worksheet = self._workbook.add_worksheet(
+            RESULT_SHEET_NAME if self._sheets == 1 else f'{RESULT_SHEET_NAME} ({self._sheets})'
+        )
+
+        writeTableHeader(
+            self._worksheet,
+            self.columns,
+            self._header_formats,
+            [min(50, (max(len(column), 10) + 2) * 1.1) for column in self.columns]
+        )
+
+    def _finishSheet(self) -> None:
+        addResultConditionalFormats(self._worksheet, self._sheet_rows, len(self.columns), self._formats)
+
+    def _writeRows(self, rows: list[list[Any]]) -> None:
+        for values in rows:
+            if self._sheet_rows >= self._sheet_budget:
+                self._finishSheet()
+                self._addSheet()
+
+            self._sheet_rows += 1
+            writeTableRow(self._worksheet, self._sheet_rows, values, self._column_formats)
+
+    def close(self, run_report: Optional[dict[str, Any]] = None) -> None:
+        try:
+            self.flush()
+            self._finishSheet()
+
+            if run_report is not None:
+                writeRunReportSheet(self._workbook, run_report, self._formats)
+        finally:
+            self._workbook.close()
+
+    def abort(self) -> None:
+        try:
+            self._workbook.close()
+        except Exception as ex:
+            logging.warning(f'Не удалось закрыть файл результатов {self.path}: {ex}')
+
+
+RESULT_SINKS = {
+    'csv': CSVResultSink,
+    'jsonl': JSONLResultSink,
+    'xlsx': XLSXResultSink
+}
+
+
+def openResultSink(export_format: str, file_path: str, columns: list[str]) -> Optional[ResultSink]:
+    """Открывает потоковую запись результатов в файл.
+
+    Args:
+        export_format (str): Формат файла (ключ AppConstants.EXPORT_FORMATS)
+        file_path (str): Путь к файлу
+        columns (list[str]): Колонки результата
+
+    Returns:
+        Optional[ResultSink]: Открытый файл или None, если формат не поддерживает потоковую
+            запись (Parquet) - тогда результаты экспортируются после парсинга
+
+    Note:
+        Только CSV и JSON Lines перечитываются из файла (reloadable = True), и поток парсинга
+        не хранит их строки. У XLSX reloadable = False: поток парсинга хранит все строки
+        до конца запуска, поэтому при потоковой записи в Excel память растет с количеством
+        артикулов так же, как без потоковой записи.
+
+    Raises:
+        OSError: Если файл не удалось создать
+    """
+    sink_type = RESULT_SINKS.get(export_format)
+
+    return sink_type(file_path, columns) if sink_type is not None else None
@@ -0,0 +1,278 @@
+import re
+
+from bisect import bisect_left
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from tools.constants import AppConstants
+
+
+_SEARCH_KEY_SEPARATORS = r'[\s\-./#]'
+
+
+def _normalizeSearchKey(value: Any) -> str:
+    """Приводит артикул или бренд к виду для поиска: нижний регистр, без пробелов и разделителей.
+
+    Examples:
+        >>> _normalizeSearchKey(' OC-90 ')
+        'oc90'
+    """
+    return re.sub(_SEARCH_KEY_SEPARATORS, '', str(value)).lower()
+
+
+def _normalizeSearchKeys(values: pd.Series) -> pd.Series:
+    """Векторизованный вариант _normalizeSearchKey для колонки DataFrame."""
+    return values.astype(str).str.replace(_SEARCH_KEY_SEPARATORS, '', regex=True).str.lower()
+
+
+def _columnsByPattern(data: pd.DataFrame, pattern: str) -> list[str]:
+    """Возвращает колонки магазинов по шаблону названия ('Цена магазина', 'Название магазина' и т.д.)."""
+    return [column for column in data.columns if column.startswith(pattern)]
+
+
+class ResultsIndex:
+    """Предварительно построенный индекс по результатам парсинга.
+
+    Строится один раз при выводе результатов и позволяет отбирать строки за миллисекунды
+    без обхода ячеек таблицы:
+        - поиск по префиксу артикула или бренда (отсортированный список ключей + bisect)
+        - фильтр по бренду и по магазину (словарь значение -> номера строк)
+        - фильтр по диапазону цены и сроку доставки (отсортированные массивы + searchsorted)
+
+    Цена и срок доставки строки - минимальные значения среди всех магазинов строки.
+
+    Args:
+        data (pd.DataFrame): Результаты парсинга в формате generateColumns()
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self.row_count = len(data)
+
+        brand_column, article_column = AppConstants.COLUMNS['RESULT'][:2]
+        rows = np.arange(self.row_count)
+
+        keys = pd.concat([
+            _normalizeSearchKeys(data[article_column]),
+            _normalizeSearchKeys(data[brand_column])
+        ], ignore_index=True)
+        key_rows = np.concatenate([rows, rows])
+        key_groups = keys.groupby(keys.to_numpy()).indices
+
+        self._search_keys = sorted(key_groups)
+        self._search_rows = [key_rows[key_groups[key]] for key in self._search_keys]
+
+        brands = data[brand_column].astype(str)
+        self.brand_rows = brands.groupby(brands.to_numpy()).indices
+
+        store_columns = _columnsByPattern(data, 'Название магазина')
+        stores = pd.Series(data[store_columns].to_numpy(dtype=object).ravel())
+        store_rows = np.repeat(rows, len(store_columns))
+        filled = stores.notna().to_numpy() & (stores.astype(str).str.strip() != '').to_numpy()
+        stores = stores[filled].astype(str)
+        store_rows = store_rows[filled]
+
+        self.store_rows = {
+            store: store_rows[positions]
+            for store, positions in stores.groupby(stores.to_numpy()).indices.items()
+        }
+
+        self._price_order, self._price_sorted = self._buildRangeIndex(data, 'Цена магазина')
+        self._days_order, self._days_sorted = self._buildRangeIndex(data, 'Кол-во дней доставки магазина')
+
+    @staticmethod
+    def _buildRangeIndex(data: pd.DataFrame, pattern: str) -> tuple[np.ndarray, np.ndarray]:
+        """Строит отсортированный индекс по минимальному числовому значению колонок магазинов.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Номера строк в порядке возрастания значения
+                и сами отсортированные значения (строки без данных - в конце, NaN)
+        """
+        columns = _columnsByPattern(data, pattern)
+
+        if not columns:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        values = pd.to_numeric(pd.Series(data[columns].to_numpy(dtype=object).ravel()), errors='coerce')
+        values = np.fmin.reduce(values.to_numpy(dtype=float).reshape(len(data), len(columns)), axis=1)
+        order = np.argsort(values, kind='stable')
+
+        return order, values[order]
+
+    @staticmethod
+    def _rangeRows(order: np.ndarray, sorted_values: np.ndarray,
+                   low: Optional[float], high: Optional[float]) -> np.ndarray:
+        """Возвращает номера строк, значение которых попадает в диапазон [low, high]."""
+        start = 0 if low is None else np.searchsorted(sorted_values, low, side='left')
+        end = np.searchsorted(sorted_values, np.inf, side='right') if high is None else \
+            np.searchsorted(sorted_values, high, side='right')
+
+        return order[start:end]
+
+    def searchRows(self, text: str) -> np.ndarray:
+        """Возвращает строки, у которых артикул или бренд начинается с text (без учета регистра и разделителей)."""
+        prefix = _normalizeSearchKey(text)
+        position = bisect_left(self._search_keys, prefix)
+        found = []
+
+        while position < len(self._search_keys) and self._search_keys[position].startswith(prefix):
+            found.append(self._search_rows[position])
+            position += 1
+
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+    def query(
+            self,
+            text: str = '',
+            brand: str = '',
+            store: str = '',
+            price_from: Optional[float] = None,
+            price_to: Optional[float] = None,
+            max_delivery_days: Optional[int] = None
+    ) -> np.ndarray:
+        """Отбирает строки по всем заданным условиям (условия объединяются через И).
+
+        Args:
+            text (str): Префикс артикула или бренда. Пустая строка - без условия
+            brand (str): Точное название бренда. Пустая строка - без условия
+            store (str): Точное название магазина. Пустая строка - без условия
+            price_from (Optional[float]): Нижняя граница минимальной цены строки
+            price_to (Optional[float]): Верхняя граница минимальной цены строки
+            max_delivery_days (Optional[int]): Максимальный минимальный срок доставки строки
+
+        Returns:
+            np.ndarray: Булева маска длиной row_count, True - строка подходит
+        """
+        mask = np.ones(self.row_count, dtype=bool)
+
+        candidates = []
+        if text.strip():
+            candidates.append(self.searchRows(text))
+        if brand:
+            candidates.append(self.brand_rows.get(brand, np.empty(0, dtype=np.int64)))
+        if store:
+            candidates.append(self.store_rows.get(store, np.empty(0, dtype=np.int64)))
+        if price_from is not None or price_to is not None:
+            candidates.append(self._rangeRows(self._price_order, self._price_sorted, price_from, price_to))
+        if max_delivery_days is not None:
+            candidates.append(self._rangeRows(self._days_order, self._days_sorted, None, max_delivery_days))
+
+        for rows in candidates:
+            condition = np.zeros(self.row_count, dtype=bool)
+            condition[rows] = True
+            mask &= condition
+
+        return mask
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """Модель таблицы результатов парсинга поверх DataFrame для QTableView.
+
+    Ячейки один раз приводятся к строкам, представление показывает подмножество строк
+    (после фильтрации) в нужном порядке сортировки. Порядок сортировки по каждой колонке
+    вычисляется один раз и кешируется, поэтому фильтрация и сортировка не создают
+    элементов таблицы и не обходят ячейки.
+
+    Args:
+        data (pd.DataFrame): Результаты парсинга
+    """
+
+    def __init__(self, data: pd.DataFrame, parent=None):
+        super().__init__(parent)
+
+        self.data_frame = data
+        self.search_index = ResultsIndex(data)
+
+        self._headers = [str(column) for column in data.columns]
+        self._cells = data.fillna('').astype(str).to_numpy()
+        self._mask = np.ones(len(data), dtype=bool)
+        self._sort_orders = {}
+        self._sort_column = -1
+        self._sort_descending = False
+        self._rows = np.arange(len(data))
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        return self._cells[self._rows[index.row()], index.column()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+
+        return str(section + 1)
+
+    def _sortOrder(self, column: int) -> tuple[np.ndarray, int]:
+        """Возвращает (и кеширует) порядок всех строк по возрастанию значения колонки.
+
+        Числовые колонки сортируются как числа, строковые - как строки. Отметки
+        AppConstants.MISSING_DATA_MARKERS ('Данные отсутствуют' в колонках цен магазинов)
+        считаются пустыми значениями: они не делают числовую колонку строковой
+        и при сортировке остаются в конце вместе с пустыми ячейками.
+
+        Returns:
+            tuple[np.ndarray, int]: Номера строк (сначала заполненные по возрастанию, затем пустые)
+                и количество заполненных строк
+        """
+        if column not in self._sort_orders:
+            series = self.data_frame.iloc[:, column]
+            cells = self._cells[:, column]
+            numeric = pd.to_numeric(series, errors='coerce').to_numpy(dtype=float)
+            filled = (cells != '') & ~np.isin(cells, AppConstants.MISSING_DATA_MARKERS)
+
+            if np.count_nonzero(~np.isnan(numeric)) >= np.count_nonzero(filled):
+                filled = ~np.isnan(numeric)
+                values = numeric
+            else:
+                values = cells
+
+            filled_rows = np.flatnonzero(filled)
+            order = filled_rows[np.argsort(values[filled_rows], kind='stable')]
+
+            self._sort_orders[column] = (np.concatenate([order, np.flatnonzero(~filled)]), len(order))
+
+        return self._sort_orders[column]
+
+    def _updateRows(self) -> None:
+        """Пересчитывает видимые строки по текущей маске фильтра и сортировке.
+
+        Пустые значения при любом направлении сортировки остаются в конце.
+        """
+        self.beginResetModel()
+
+        if self._sort_column < 0:
+            self._rows = np.flatnonzero(self._mask)
+        else:
+            order, filled_count = self._sortOrder(self._sort_column)
+            if self._sort_descending:
+                order = np.concatenate([order[:filled_count][::-1], order[filled_count:]])
+            self._rows = order[self._mask[order]]
+
+        self.endResetModel()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        self._sort_column = column
+        self._sort_descending = order == Qt.SortOrder.DescendingOrder
+        self._updateRows()
+
+    def applyFilter(self, mask: np.ndarray) -> None:
+        """Показывает только строки, отмеченные в булевой маске (см. ResultsIndex.query)."""
+        self._mask = mask
+        self._updateRows()
+
+    def visibleRowCount(self) -> int:
+        return len(self._rows)
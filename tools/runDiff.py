@@ -0,0 +1,321 @@
+from typing import TYPE_CHECKING
+
+from tools.constants import AppConstants
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+DIFF_COLUMNS = [
+    'Бренд', 'Артикул', 'Изменения',
+    'Мин НАЛИЧИЕ было', 'Мин НАЛИЧИЕ стало', 'Мин НАЛИЧИЕ, %',
+    'Мин ПОД ЗАКАЗ было', 'Мин ПОД ЗАКАЗ стало', 'Мин ПОД ЗАКАЗ, %',
+    'Наличие', 'Новые магазины', 'Ушедшие магазины', 'Цены магазинов'
+]
+DIFF_PRICE_COLUMNS = ('Мин НАЛИЧИЕ', 'Мин ПОД ЗАКАЗ')
+DIFF_CHANGES = {
+    'added': 'новый артикул',
+    'lost': 'нет в новом запуске',
+    'price': 'цена',
+    'availability': 'наличие',
+    'stores': 'магазины',
+    'store_price': 'цены магазинов'
+}
+DIFF_SUMMARY_NAMES = {
+    'matched': 'Артикулов в обоих запусках',
+    'added': 'Новых артикулов',
+    'lost': 'Артикулов нет в новом запуске',
+    'price': 'Изменилась минимальная цена',
+    'availability': 'Изменилось наличие',
+    'stores': 'Изменился состав магазинов',
+    'store_price': 'Изменились цены магазинов',
+    'changed': 'Всего строк в выгрузке изменений'
+}
+STORE_NAME_COLUMN = 'Название магазина'
+STORE_PRICE_COLUMN = 'Цена магазина'
+
+
+def _resultKeys(data: 'pd.DataFrame') -> 'pd.Index':
+    """Ключ соединения запусков: строка 'бренд\\x1fартикул' для каждой строки результата."""
+    import pandas as pd
+
+    brand_column, article_column = AppConstants.COLUMNS['RESULT'][:2]
+
+    return pd.Index(data[brand_column].astype(str).str.cat(data[article_column].astype(str), sep='\x1f'))
+
+
+def _numeric(data: 'pd.DataFrame', column: str) -> 'np.ndarray':
+    """Колонка как массив float ('' и текстовые отметки - NaN)."""
+    import numpy as np
+    import pandas as pd
+
+    if column not in data.columns:
+        return np.full(len(data), np.nan)
+
+    return pd.to_numeric(data[column], errors='coerce').to_numpy(dtype=float)
+
+
+def _storeColumns(data: 'pd.DataFrame') -> list[tuple[str, str]]:
+    """Пары колонок (название магазина N, цена магазина N), присутствующие в результате."""
+    pairs = []
+    number = 1
+
+    while f'{STORE_NAME_COLUMN} {number}' in data.columns:
+        pairs.append((f'{STORE_NAME_COLUMN} {number}', f'{STORE_PRICE_COLUMN} {number}'))
+        number += 1
+
+    return pairs
+
+
+def _values(data: 'pd.DataFrame', column: str) -> 'np.ndarray':
+    """Колонка как массив object без копирования (пустые значения - NaN)."""
+    import numpy as np
+
+    return np.asarray(data[column].array, dtype=object)
+
+
+def _storeOffers(data: 'pd.DataFrame', rows: 'np.ndarray') -> tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+    """Магазины строк rows в длинном формате.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Номер строки (позиция в rows), название
+            магазина и цена каждого предложения (как в результате, без приведения к числу)
+    """
+    import numpy as np
+    import pandas as pd
+
+    row_parts, name_parts, price_parts = [], [], []
+
+    for name_column, price_column in _storeColumns(data):
+        names = _values(data, name_column)[rows]
+        valid = pd.notna(names) & (names != '')
+
+        row_parts.append(np.flatnonzero(valid))
+        name_parts.append(names[valid])
+        price_parts.append(_values(data, price_column)[rows][valid] if price_column in data.columns
+                           else np.full(valid.sum(), np.nan, dtype=object))
+
+    if not row_parts:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=object), np.empty(0, dtype=object)
+
+    return np.concatenate(row_parts), np.concatenate(name_parts), np.concatenate(price_parts)
+
+
+def _minPerKey(keys: 'np.ndarray', prices: 'np.ndarray') -> tuple['np.ndarray', 'np.ndarray']:
+    """Оставляет по одному предложению на ключ (строка, магазин) - с минимальной ценой.
+
+    Цены приводятся к числу только у повторяющихся ключей (магазин несколько раз в строке),
+    остальные предложения остаются как есть.
+    """
+    import numpy as np
+    import pandas as pd
+
+    repeated = pd.Index(keys).duplicated(keep=False)
+    if not repeated.any():
+        return keys, prices
+
+    candidates = np.flatnonzero(repeated)
+    numeric = pd.to_numeric(prices[candidates], errors='coerce')
+    order = candidates[np.lexsort((numeric, keys[candidates]))]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = keys[order][1:] != keys[order][:-1]
+
+    keep = ~repeated
+    keep[order[first]] = True
+
+    return keys[keep], prices[keep]
+
+
+def _joinByRow(rows: 'np.ndarray', texts: 'np.ndarray', size: int) -> 'np.ndarray':
+    """Склеивает тексты по номеру строки через ', ' (строки без текстов - '')."""
+    import numpy as np
+
+    result = np.full(size, '', dtype=object)
+    order = np.argsort(rows, kind='stable')
+    rows, texts = rows[order], texts[order]
+    bounds = np.flatnonzero(np.diff(rows)) + 1
+
+    for row, group in zip(rows[np.r_[0, bounds]] if len(rows) else [], np.split(texts, bounds)):
+        result[row] = ', '.join(group)
+
+    return result
+
+
+def _formatPrice(values: 'np.ndarray') -> 'np.ndarray':
+    """Цены для текста изменений: целые без дробной части."""
+    import numpy as np
+
+    return np.array([f'{value:.0f}' if float(value).is_integer() else f'{value:.2f}' for value in values], dtype=object)
+
+
+def compareRuns(old: 'pd.DataFrame', new: 'pd.DataFrame',
+                price_threshold: float = AppConstants.DIFF_PRICE_THRESHOLD) -> tuple['pd.DataFrame', dict[str, int]]:
+    """Сравнивает результаты двух запусков и возвращает только изменившиеся артикулы.
+
+    Запуски соединяются хеш-соединением по ключу (бренд, артикул): по ключам старого
+    запуска строится хеш-индекс (pd.Index), ключи нового запуска ищутся в нем одним вызовом
+    get_indexer. Магазины сравниваются так же: предложения обоих запусков переводятся
+    в длинный формат с целым ключом (строка, код магазина) и соединяются по этому ключу;
+    к числу приводятся только цены, текст которых различается. Все сравнения векторные,
+    без цикла по артикулам, поэтому запуски по 100 тыс. артикулов сравниваются
+    примерно за 1-1.5 секунды.
+
+    Изменения:
+        - новый артикул / нет в новом запуске - артикул есть только в одном из запусков
+        - цена - минимальная цена в наличии или под заказ изменилась не меньше чем на порог
+        - наличие - товар появился в наличии или пропал из наличия (Мин НАЛИЧИЕ > 0)
+        - магазины - в топе появились новые магазины или ушли прежние
+        - цены магазинов - цена магазина, который есть в обоих запусках, изменилась не меньше
+          чем на порог
+
+    Args:
+        old (pd.DataFrame): Результаты прошлого запуска
+        new (pd.DataFrame): Результаты нового запуска
+        price_threshold (float): Порог изменения цены в процентах (0 - любое изменение)
+
+    Returns:
+        tuple[pd.DataFrame, dict[str, int]]: Изменения (колонки DIFF_COLUMNS) и сводка
+            (количество по ключам DIFF_SUMMARY_NAMES)
+
+    Note:
+        Если артикул повторяется в запуске, сравнивается его последняя строка.
+    """
+    import numpy as np
+    import pandas as pd
+
+    old_keys = _resultKeys(old)
+    new_keys = _resultKeys(new)
+
+    old_last = ~old_keys.duplicated(keep='last')
+    new_last = ~new_keys.duplicated(keep='last')
+    old_rows_all = np.flatnonzero(old_last)
+    new_rows_all = np.flatnonzero(new_last)
+
+    positions = old_keys[old_last].get_indexer(new_keys[new_last])
+    matched = positions >= 0
+
+    new_rows = new_rows_all[matched]
+    old_rows = old_rows_all[positions[matched]]
+    added_rows = new_rows_all[~matched]
+    lost_mask = np.ones(len(old_rows_all), dtype=bool)
+    lost_mask[positions[matched]] = False
+    lost_rows = old_rows_all[lost_mask]
+
+    count = len(new_rows)
+    threshold = max(0.0, float(price_threshold))
+    changes = np.full(count, '', dtype=object)
+    columns = {}
+    summary = {'matched': count, 'added': len(added_rows), 'lost': len(lost_rows)}
+
+    def addChange(kind: str, mask: 'np.ndarray') -> None:
+        changes[mask] = changes[mask] + np.where(changes[mask] == '', '', '; ') + DIFF_CHANGES[kind]
+        summary[kind] = int(mask.sum())
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        price_changed = np.zeros(count, dtype=bool)
+
+        for column in DIFF_PRICE_COLUMNS:
+            before = _numeric(old, column)[old_rows]
+            after = _numeric(new, column)[new_rows]
+            percent = np.where(before > 0, (after - before) / before * 100, np.nan)
+
+            columns[f'{column} было'] = before
+            columns[f'{column} стало'] = after
+            columns[f'{column}, %'] = np.round(percent, 1)
+            price_changed |= (before > 0) & (after > 0) & (np.abs(percent) >= threshold) & (after != before)
+
+        addChange('price', price_changed)
+
+        in_stock_before = columns['Мин НАЛИЧИЕ было'] > 0
+        in_stock_after = columns['Мин НАЛИЧИЕ стало'] > 0
+        availability_changed = in_stock_before != in_stock_after
+        columns['Наличие'] = np.where(
+            availability_changed,
+            np.where(in_stock_after, 'появился в наличии', 'пропал из наличия'),
+            ''
+        ).astype(object)
+        addChange('availability', availability_changed)
+
+        old_store_rows, old_names, old_prices = _storeOffers(old, old_rows)
+        new_store_rows, new_names, new_prices = _storeOffers(new, new_rows)
+
+        store_codes, store_names = pd.factorize(np.concatenate([old_names, new_names]))
+        store_count = max(1, len(store_names))
+        old_keys_stores, old_prices = _minPerKey(
+            old_store_rows * store_count + store_codes[:len(old_names)], old_prices
+        )
+        new_keys_stores, new_prices = _minPerKey(
+            new_store_rows * store_count + store_codes[len(old_names):], new_prices
+        )
+
+        store_positions = pd.Index(old_keys_stores).get_indexer(new_keys_stores)
+        in_old = store_positions >= 0
+        kept = np.zeros(len(old_keys_stores), dtype=bool)
+        kept[store_positions[in_old]] = True
+
+        store_names = np.asarray(store_names, dtype=object)
+        for column, keys_stores in (('Новые магазины', new_keys_stores[~in_old]),
+                                    ('Ушедшие магазины', old_keys_stores[~kept])):
+            columns[column] = _joinByRow(keys_stores // store_count, store_names[keys_stores % store_count], count)
+        addChange('stores', (columns['Новые магазины'] != '') | (columns['Ушедшие магазины'] != ''))
+
+        common_keys = new_keys_stores[in_old]
+        before, after = old_prices[store_positions[in_old]], new_prices[in_old]
+        differs = np.flatnonzero(before != after)
+        common_keys = common_keys[differs]
+        before = np.asarray(pd.to_numeric(before[differs], errors='coerce'), dtype=float)
+        after = np.asarray(pd.to_numeric(after[differs], errors='coerce'), dtype=float)
+        store_changed = (before > 0) & (after != before) & (np.abs((after - before) / before * 100) >= threshold)
+        common_keys, before, after = common_keys[store_changed], before[store_changed], after[store_changed]
+        texts = store_names[common_keys % store_count] + ': ' + _formatPrice(before) + ' → ' + _formatPrice(after)
+        columns['Цены магазинов'] = _joinByRow(common_keys // store_count, texts, count)
+        addChange('store_price', columns['Цены магазинов'] != '')
+
+    brand_column, article_column = AppConstants.COLUMNS['RESULT'][:2]
+    changed = changes != ''
+
+    delta = pd.DataFrame({
+        'Бренд': _values(new, brand_column)[new_rows][changed],
+        'Артикул': _values(new, article_column)[new_rows][changed],
+        'Изменения': changes[changed],
+        **{name: values[changed] for name, values in columns.items()}
+    })
+
+    only_one = [
+        pd.DataFrame({
+            'Бренд': _values(data, brand_column)[rows],
+            'Артикул': _values(data, article_column)[rows],
+            'Изменения': DIFF_CHANGES[kind],
+            'Мин НАЛИЧИЕ было' if kind == 'lost' else 'Мин НАЛИЧИЕ стало': _numeric(data, 'Мин НАЛИЧИЕ')[rows],
+            'Мин ПОД ЗАКАЗ было' if kind == 'lost' else 'Мин ПОД ЗАКАЗ стало': _numeric(data, 'Мин ПОД ЗАКАЗ')[rows]
+        })
+        for kind, data, rows in (('added', new, added_rows), ('lost', old, lost_rows)) if len(rows)
+    ]
+    if only_one:
+        delta = pd.concat([delta, *only_one], ignore_index=True)
+
+    delta = delta.reindex(columns=DIFF_COLUMNS)
+    for column in ('Наличие', 'Новые магазины', 'Ушедшие магазины', 'Цены магазинов'):
+        delta[column] = delta[column].fillna('')
+
+    summary['changed'] = len(delta)
+
+    return delta, summary
+
+
+def runDiffRows(summary: dict[str, int], price_threshold: float) -> list[list[str]]:
+    """Представляет сводку сравнения в виде строк [Показатель, Значение] (для листа Excel)."""
+    rows = [['Порог изменения цены', f'{price_threshold:g}%']]
+    rows += [[name, str(summary.get(key, 0))] for key, name in DIFF_SUMMARY_NAMES.items()]
+
+    return rows
+
+
+def formatRunDiffSummary(summary: dict[str, int]) -> str:
+    """Краткая сводка сравнения для строки статуса."""
+    return (
+        f'Сравнение: изменилось {summary["changed"]} арт. (цена {summary.get("price", 0)}, '
+        f'наличие {summary.get("availability", 0)}, магазины {summary.get("stores", 0)}, '
+        f'новых {summary["added"]}, пропало {summary["lost"]})'
+    )
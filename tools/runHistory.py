@@ -0,0 +1,350 @@
+import datetime
+import glob
+import hashlib
+import json
+import logging
+import os
+import zipfile
+
+from typing import Any, Iterable, Optional, TYPE_CHECKING
+
+from tools.constants import AppConstants
+from tools.exportWorker import ProgressCallback
+from tools.logControl import removeOldLogFiles
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+RUN_FILE_PATTERN = 'run_*.npz'
+RUN_TABLES = ('results', 'errors')
+NPY_MAGIC = b'\x93NUMPY'
+
+
+def inputHash(search_data: Iterable[Iterable[Any]]) -> str:
+    """Возвращает SHA-256 входного списка пар [бренд, артикул] (порядок учитывается).
+
+    По хешу видно, что два запуска выполнены по одному и тому же файлу артикулов.
+    """
+    digest = hashlib.sha256()
+
+    for brand, article, *_ in search_data:
+        digest.update(f'{brand}\x1f{article}\x1e'.encode('utf-8'))
+
+    return digest.hexdigest()
+
+
+def _pairsHash(pairs: Iterable[Any]) -> str:
+    """Хеш набора записей списка без учета порядка (для снимка настроек)."""
+    return hashlib.sha256('\x1e'.join(sorted(map(str, pairs))).encode('utf-8')).hexdigest()
+
+
+def configSnapshot(parser_config: dict[str, Any], app_config: dict[str, Any],
+                   black_list: set[tuple[str, str]], white_list: set[tuple[str, str]]) -> dict[str, Any]:
+    """Снимок настроек, влияющих на результат запуска.
+
+    Скалярные настройки парсера сохраняются как есть, списки (замены брендов, черный
+    и белый списки) - количеством записей и хешем, чтобы метаданные запуска оставались
+    небольшими при больших списках.
+
+    Args:
+        parser_config (dict[str, Any]): Конфиг парсера
+        app_config (dict[str, Any]): Конфиг приложения (сохраняется задержка между запросами)
+        black_list (set[tuple[str, str]]): Черный список, используемый запуском
+        white_list (set[tuple[str, str]]): Белый список, используемый запуском
+
+    Returns:
+        dict[str, Any]: {'parser': {...}, 'timeDelay': ..., 'lists': {раздел: {'count', 'hash'}}}
+    """
+    brands = parser_config.get('brandsList') or {}
+
+    return {
+        'parser': {key: value for key, value in parser_config.items()
+                   if key not in AppConstants.PARSER_LIST_SECTIONS},
+        'timeDelay': app_config.get('timeDelay'),
+        'lists': {
+            'brandsList': {'count': len(brands), 'hash': _pairsHash(brands.items())},
+            'blackList': {'count': len(black_list), 'hash': _pairsHash(black_list)},
+            'whiteList': {'count': len(white_list), 'hash': _pairsHash(white_list)}
+        }
+    }
+
+
+def jsonDefault(value: Any) -> Any:
+    """Приводит значения numpy (np.int64 и т.п.) к типам Python для json.dumps."""
+    if hasattr(value, 'item'):
+        return value.item()
+
+    return str(value)
+
+
+def _dumpJSON(value: Any) -> 'np.ndarray':
+    import numpy as np
+
+    return np.frombuffer(json.dumps(value, ensure_ascii=False, default=jsonDefault).encode('utf-8'), dtype=np.uint8)
+
+
+def _codesDtype(size: int) -> str:
+    """Наименьший целый тип для кодов словаря из size значений (код -1 - пустое значение)."""
+    for dtype, limit in (('int8', 1 << 7), ('int16', 1 << 15)):
+        if size < limit:
+            return dtype
+
+    return 'int32'
+
+
+def encodeColumns(table: str, data: 'pd.DataFrame') -> tuple[dict[str, 'np.ndarray'], dict[str, Any]]:
+    """Кодирует DataFrame по колонкам для файла запуска.
+
+    Числовые и логические колонки сохраняются массивами numpy как есть. Колонки object
+    (в результате - вперемешку числа, строки и пустые ячейки) кодируются словарем:
+    массив кодов наименьшего целого типа и список различных значений (JSON сохраняет
+    их типы). Значений в колонке мало по сравнению со строками (магазины, цены, '' в хвосте
+    строк), поэтому коды хорошо сжимаются, а загрузка колонки - одна выборка по массиву.
+
+    Args:
+        table (str): Имя таблицы в файле (RUN_TABLES)
+        data (pd.DataFrame): Данные
+
+    Returns:
+        tuple[dict[str, np.ndarray], dict[str, Any]]: Массивы для записи в файл
+            и описание таблицы (колонки, способ кодирования, словари значений)
+    """
+    import pandas as pd
+
+    arrays = {}
+    columns = []
+
+    for i, name in enumerate(data.columns):
+        values = data.iloc[:, i]
+        key = f'{table}_{i}'
+
+        if values.dtype.kind in 'biuf':
+            arrays[key] = values.to_numpy()
+            columns.append({'name': name, 'encoding': 'raw'})
+            continue
+
+        codes, uniques = pd.factorize(values.to_numpy(dtype=object), use_na_sentinel=True)
+        arrays[key] = codes.astype(_codesDtype(len(uniques)))
+        columns.append({'name': name, 'encoding': 'dict', 'values': uniques.tolist()})
+
+    return arrays, {'rows': len(data), 'columns': columns}
+
+
+def decodeColumns(table: str, description: dict[str, Any], archive: Any) -> 'pd.DataFrame':
+    """Восстанавливает DataFrame, записанный encodeColumns.
+
+    Args:
+        table (str): Имя таблицы в файле
+        description (dict[str, Any]): Описание таблицы из encodeColumns
+        archive (np.lib.npyio.NpzFile): Открытый файл запуска
+    """
+    import numpy as np
+    import pandas as pd
+
+    data = {}
+
+    for i, column in enumerate(description['columns']):
+        array = archive[f'{table}_{i}']
+
+        if column['encoding'] == 'dict':
+            values = np.empty(len(column['values']) + 1, dtype=object)
+            values[:-1] = column['values']
+            values[-1] = np.nan
+            array = values[array]
+
+        data[i] = array
+
+    frame = pd.DataFrame(data, copy=False)
+    frame.columns = [column['name'] for column in description['columns']]
+
+    return frame
+
+
+def saveRun(file_path: str, results: 'pd.DataFrame', errors: 'pd.DataFrame', meta: dict[str, Any],
+            progress: Optional[ProgressCallback] = None) -> None:
+    """Записывает запуск в файл (выполняется в потоке экспорта, см. ExportJob).
+
+    Файл - архив numpy (.npz, быстрое сжатие zip, читается np.load) с колонками результатов и ошибочных артикулов
+    (см. encodeColumns) и двумя JSON-записями: meta (метаданные и отчет о запуске - читается
+    отдельно для списка истории) и tables (описание колонок и словари значений).
+
+    Args:
+        file_path (str): Путь к файлу запуска (RunHistory.newRunPath)
+        results (pd.DataFrame): Результаты парсинга
+        errors (pd.DataFrame): Ошибочные артикулы
+        meta (dict[str, Any]): Метаданные запуска (см. runMeta)
+        progress (Optional[ProgressCallback]): Обратный вызов прогресса (по таблицам)
+    """
+    import numpy as np
+
+    arrays = {}
+    tables = {}
+
+    for done, (table, data) in enumerate(zip(RUN_TABLES, (results, errors)), 1):
+        table_arrays, tables[table] = encodeColumns(table, data)
+        arrays.update(table_arrays)
+
+        if progress is not None:
+            progress(done, len(RUN_TABLES) + 1)
+
+    arrays.update(meta=_dumpJSON(dict(meta, results=len(results), errors=len(errors))), tables=_dumpJSON(tables))
+
+    with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+        for key, array in arrays.items():
+            with archive.open(f'{key}.npy', 'w', force_zip64=True) as f:
+                np.lib.format.write_array(f, np.ascontiguousarray(array), allow_pickle=False)
+
+    if progress is not None:
+        progress(1, 1)
+
+
+def _loadJSON(archive: Any, key: str) -> Any:
+    return json.loads(archive[key].tobytes().decode('utf-8'))
+
+
+def _readBytesArray(archive: zipfile.ZipFile, key: str) -> bytes:
+    """Читает массив байтов (uint8, см. _dumpJSON) из записи .npy архива без numpy.
+
+    Формат .npy: сигнатура, версия, длина заголовка (2 байта в версии 1, 4 - в версиях 2 и 3),
+    заголовок с описанием массива и сами данные.
+    """
+    with archive.open(f'{key}.npy') as f:
+        prefix = f.read(8)
+        if len(prefix) < 8 or prefix[:6] != NPY_MAGIC:
+            raise ValueError(f'Запись {key} не является массивом numpy')
+
+        header_size = int.from_bytes(f.read(2 if prefix[6] == 1 else 4), 'little')
+        header = f.read(header_size).decode('latin1')
+        if "'|u1'" not in header:
+            raise ValueError(f'Запись {key} не является массивом байтов')
+
+        return f.read()
+
+
+def loadRunMeta(file_path: str) -> dict[str, Any]:
+    """Читает только метаданные запуска (без колонок данных).
+
+    Запись meta читается модулем zipfile без numpy, поэтому список истории заполняется
+    без импорта numpy и без чтения колонок.
+
+    Raises:
+        OSError, ValueError, KeyError: Если файл поврежден или не является файлом запуска
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        return json.loads(_readBytesArray(archive, 'meta').decode('utf-8'))
+
+
+def loadRun(file_path: str) -> tuple['pd.DataFrame', 'pd.DataFrame', dict[str, Any]]:
+    """Загружает сохраненный запуск.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame, dict[str, Any]]: Результаты, ошибочные артикулы
+            и метаданные (отчет о запуске - meta['report'])
+
+    Raises:
+        OSError, ValueError, KeyError: Если файл поврежден или не является файлом запуска
+    """
+    import numpy as np
+
+    with np.load(file_path) as archive:
+        meta = _loadJSON(archive, 'meta')
+        tables = _loadJSON(archive, 'tables')
+
+        results, errors = (decodeColumns(table, tables[table], archive) for table in RUN_TABLES)
+
+    return results, errors, meta
+
+
+def runMeta(report: dict[str, Any]) -> dict[str, Any]:
+    """Метаданные запуска для файла истории: время, хеш входных данных, снимок настроек и отчет.
+
+    Args:
+        report (dict[str, Any]): Отчет о запуске (см. ParseWorker - started_at, input_hash, config)
+    """
+    return {
+        'started_at': report.get('started_at'),
+        'saved_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'input_hash': report.get('input_hash'),
+        'config': report.get('config'),
+        'retry': bool(report.get('retry')),
+        'report': {key: value for key, value in report.items() if key not in ('config', 'input_hash')}
+    }
+
+
+class RunHistory:
+    """История запусков парсинга: по файлу на запуск в runs/{username}/.
+
+    Хранятся последние AppConstants.RUN_HISTORY_COUNT запусков (имя файла содержит дату,
+    старые удаляются после записи нового). Список истории читает только метаданные файлов
+    и запоминает их, поэтому при обновлении списка читаются только новые файлы.
+
+    Args:
+        username (str): Имя пользователя (папка истории)
+    """
+
+    def __init__(self, username: str):
+        self.directory = f'runs/{username}'
+        self._meta: dict[str, dict[str, Any]] = {}
+        os.makedirs(self.directory, exist_ok=True)
+
+    def newRunPath(self) -> str:
+        """Возвращает путь для нового файла запуска (run_ГГГГММДД_ЧЧММСС[_N].npz)."""
+        stem = os.path.join(self.directory, f'run_{datetime.datetime.now():%Y%m%d_%H%M%S}')
+        file_path = f'{stem}.npz'
+        number = 1
+
+        while os.path.exists(file_path):
+            number += 1
+            file_path = f'{stem}_{number}.npz'
+
+        return file_path
+
+    def prune(self) -> None:
+        removeOldLogFiles(self.directory, RUN_FILE_PATTERN, AppConstants.RUN_HISTORY_COUNT)
+
+    def runs(self) -> list[tuple[str, dict[str, Any]]]:
+        """Возвращает сохраненные запуски от новых к старым.
+
+        Returns:
+            list[tuple[str, dict[str, Any]]]: Пары (путь к файлу, метаданные).
+                Поврежденные файлы пропускаются с записью в лог
+        """
+        runs = []
+
+        for file_path in sorted(glob.glob(os.path.join(self.directory, RUN_FILE_PATTERN)), reverse=True):
+            meta = self._meta.get(file_path)
+
+            if meta is None:
+                try:
+                    meta = loadRunMeta(file_path)
+                except (OSError, ValueError, KeyError, zipfile.BadZipFile) as ex:
+                    logging.warning(f'Не удалось прочитать файл запуска {file_path}: {ex}')
+                    continue
+
+            runs.append((file_path, meta))
+
+        self._meta = dict(runs)
+
+        return runs
+
+
+def runReportFromMeta(meta: dict[str, Any]) -> dict[str, Any]:
+    """Восстанавливает отчет о запуске (формат RunStats.report) из метаданных файла запуска."""
+    return dict(meta['report'], input_hash=meta.get('input_hash'), config=meta.get('config'))
+
+
+def runTitle(meta: dict[str, Any]) -> str:
+    """Подпись запуска в списке истории: 'ДД.ММ.ГГГГ ЧЧ:ММ - N арт., ошибок M'."""
+    started_at = meta.get('started_at') or meta.get('saved_at') or ''
+
+    try:
+        started_at = datetime.datetime.fromisoformat(started_at).strftime('%d.%m.%Y %H:%M')
+    except ValueError:
+        pass
+
+    articles = (meta.get('report') or {}).get('articles', meta.get('results', 0))
+    title = f'{started_at} - {articles} арт., ошибок {meta.get("errors", 0)}'
+
+    return f'{title} (повтор)' if meta.get('retry') else title
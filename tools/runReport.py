@@ -0,0 +1,184 @@
+import math
+
+from collections import Counter
+from typing import Any, Optional
+
+
+ERROR_NAMES = {
+    'timeout': 'Таймаут',
+    'http': 'Ошибка HTTP',
+    'connection': 'Нет соединения',
+    'empty': 'Пустой ответ',
+    'parse': 'Ошибка разбора ответа',
+    'request': 'Ошибка запроса',
+    'processing': 'Ошибка обработки'
+}
+
+def errorReason(code: str, status: Optional[int] = None) -> str:
+    """Возвращает описание причины ошибки запроса для выгрузки ошибочных артикулов.
+
+    Args:
+        code (str): Код ошибки (ключ ERROR_NAMES, см. safeAPIRequest)
+        status (Optional[int]): HTTP-статус ответа (указывается для ошибок HTTP)
+
+    Examples:
+        >>> errorReason('http', 500)
+        'Ошибка HTTP 500'
+    """
+    name = ERROR_NAMES.get(code, code)
+
+    return f'{name} {status}' if code == 'http' and status else name
+
+
+TIME_SPLIT_NAMES = {
+    'fetch': 'Запросы к API',
+    'parse': 'Разбор XML/JSON',
+    'filter': 'Фильтрация',
+    'assemble': 'Сборка результатов',
+    'delay': 'Задержка между запросами',
+    'history': 'Запись истории цен',
+    'export': 'Экспорт'
+}
+
+
+def _percentile(sorted_values: list[float], percent: float) -> Optional[float]:
+    """Возвращает перцентиль отсортированного списка (метод ближайшего ранга)."""
+    if not sorted_values:
+        return None
+
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+
+    return sorted_values[rank - 1]
+
+
+class RunStats:
+    """Накапливает замеры запросов за запуск парсинга и формирует итоговый отчет.
+
+    Записи передаются в том же формате, что и в RequestMetricsLog, поэтому хранится
+    только то, что нужно для отчета: времена ответов (для перцентилей) и суммы по этапам.
+
+    Args:
+        key_count (int): Количество API-ключей
+    """
+
+    def __init__(self, key_count: int):
+        self.latencies: list[float] = []
+        self.errors = Counter()
+        self.time_split = dict.fromkeys(TIME_SPLIT_NAMES, 0.0)
+        self.keys = [{'requests': 0, 'errors': 0, 'latency_ms': 0.0} for _ in range(key_count)]
+        self.articles = 0
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Учитывает запись замеров одного запроса."""
+        self.articles += 1
+
+        latency = record.get('latency_ms')
+        key = self.keys[record['key_index']]
+        key['requests'] += 1
+
+        if latency is not None:
+            self.latencies.append(latency)
+            key['latency_ms'] += latency
+            self.time_split['fetch'] += latency - (record.get('parse_ms') or 0.0)
+
+        if record.get('error'):
+            self.errors[record['error']] += 1
+            key['errors'] += 1
+
+        self.time_split['parse'] += record.get('parse_ms') or 0.0
+        self.time_split['filter'] += record.get('filter_ms') or 0.0
+        self.time_split['assemble'] += record.get('assemble_ms') or 0.0
+
+    def addTime(self, stage: str, milliseconds: float) -> None:
+        """Добавляет время к этапу отчета ('delay', 'assemble', 'export' и т.д.)."""
+        self.time_split[stage] += milliseconds
+
+    def report(self, wall_seconds: float) -> dict[str, Any]:
+        """Формирует отчет о запуске.
+
+        Args:
+            wall_seconds (float): Полное время запуска в секундах
+
+        Returns:
+            dict[str, Any]: Отчет: articles, wall_s, articles_per_s, latency_ms (p50/p95/p99),
+                errors (код -> количество), keys (по каждому ключу), cache_hit_rate
+                (None - кеш запросов не используется), time_split_ms (по этапам)
+        """
+        latencies = sorted(self.latencies)
+
+        return {
+            'articles': self.articles,
+            'wall_s': wall_seconds,
+            'articles_per_s': self.articles / wall_seconds if wall_seconds > 0 else 0.0,
+            'latency_ms': {f'p{p}': _percentile(latencies, p) for p in (50, 95, 99)},
+            'errors': dict(self.errors.most_common()),
+            'keys': [
+                {
+                    'key_index': index,
+                    'requests': key['requests'],
+                    'errors': key['errors'],
+                    'avg_latency_ms': key['latency_ms'] / key['requests'] if key['requests'] else None,
+                    'requests_per_s': key['requests'] / wall_seconds if wall_seconds > 0 else 0.0
+                }
+                for index, key in enumerate(self.keys)
+            ],
+            'cache_hit_rate': None,
+            'time_split_ms': dict(self.time_split)
+        }
+
+
+def _formatMs(value: Optional[float]) -> str:
+    return 'н/д' if value is None else f'{value:.0f} мс'
+
+
+def formatRunSummary(report: dict[str, Any]) -> str:
+    """Возвращает краткую сводку отчета (2 строки) для страницы результатов."""
+    error_count = sum(report['errors'].values())
+    latency = report['latency_ms']
+
+    return (
+        f'Артикулов: {report["articles"]} за {report["wall_s"]:.1f} с '
+        f'({report["articles_per_s"]:.2f} арт/с), ошибок: {error_count}\n'
+        f'Ответ API: p50 {_formatMs(latency["p50"])}, p95 {_formatMs(latency["p95"])}, '
+        f'p99 {_formatMs(latency["p99"])}'
+    )
+
+
+def runReportRows(report: dict[str, Any]) -> list[list[str]]:
+    """Представляет отчет в виде строк [Показатель, Значение] (для листа Excel и подсказки)."""
+    latency = report['latency_ms']
+    rows = [
+        ['Артикулов обработано', str(report['articles'])],
+        ['Начало запуска', (report.get('started_at') or 'н/д').replace('T', ' ')],
+        ['Время запуска', f'{report["wall_s"]:.1f} с'],
+        ['Скорость', f'{report["articles_per_s"]:.2f} арт/с'],
+        ['Время ответа API p50', _formatMs(latency['p50'])],
+        ['Время ответа API p95', _formatMs(latency['p95'])],
+        ['Время ответа API p99', _formatMs(latency['p99'])],
+        ['Попадания в кеш', 'н/д (кеш запросов не используется)']
+    ]
+
+    if report['errors']:
+        rows += [[f'Ошибки: {ERROR_NAMES.get(code, code)}', str(count)] for code, count in report['errors'].items()]
+    else:
+        rows.append(['Ошибки', '0'])
+
+    rows += [
+        [f'Ключ {key["key_index"] + 1}',
+         f'{key["requests"]} запросов, {key["errors"]} ошибок, '
+         f'{key["requests_per_s"]:.2f} запр/с, среднее {_formatMs(key["avg_latency_ms"])}']
+        for key in report['keys']
+    ]
+
+    total_ms = report['wall_s'] * 1000
+    for stage, milliseconds in report['time_split_ms'].items():
+        share = f' ({milliseconds / total_ms * 100:.1f}%)' if total_ms > 0 and stage != 'export' else ''
+        rows.append([f'Время: {TIME_SPLIT_NAMES[stage]}', f'{milliseconds / 1000:.2f} с{share}'])
+
+    if report.get('retry'):
+        rows.append(['Повторный запуск', 'только ошибочные артикулы, результаты объединены с предыдущими'])
+
+    if report.get('result_file'):
+        rows.append(['Файл результатов (потоковая запись)', report['result_file']])
+
+    return rows
@@ -0,0 +1,125 @@
+import time
+
+from typing import Optional, TYPE_CHECKING
+
+from PyQt6 import QtWidgets
+
+if TYPE_CHECKING:
+    from tools.resultsModel import ResultsTableModel
+
+
+ALL_BRANDS = 'Все бренды'
+ALL_STORES = 'Все магазины'
+
+_FILTER_WIDGETS = (
+    'resultsSearchInput', 'brandFilterComboBox', 'storeFilterComboBox',
+    'priceFromSpinBox', 'priceToSpinBox', 'deliveryDaysFilterSpinBox'
+)
+
+
+def _resultsModel(window: QtWidgets) -> Optional['ResultsTableModel']:
+    """Возвращает модель результатов resultsTable или None, если результаты еще не выводились.
+
+    Модуль модели (numpy, pandas) импортируется при первом обращении, а не при запуске.
+    """
+    from tools.resultsModel import ResultsTableModel
+
+    model = window.resultsTable.model()
+
+    return model if isinstance(model, ResultsTableModel) else None
+
+
+def updateResultsFilters(window: QtWidgets) -> None:
+    """Заполняет выпадающие списки фильтров значениями из индекса текущих результатов.
+
+    Вызывается после вывода новых результатов в resultsTable. Сбрасывает ранее заданные
+    условия поиска и фильтрации.
+
+    Args:
+        window (QtWidgets.QWidget): Главное окно приложения с виджетами страницы результатов.
+    """
+    model = _resultsModel(window)
+
+    if model is None:
+        return
+
+    for name in _FILTER_WIDGETS:
+        getattr(window, name).blockSignals(True)
+
+    window.brandFilterComboBox.clear()
+    window.brandFilterComboBox.addItem(ALL_BRANDS)
+    window.brandFilterComboBox.addItems(sorted(model.search_index.brand_rows))
+
+    window.storeFilterComboBox.clear()
+    window.storeFilterComboBox.addItem(ALL_STORES)
+    window.storeFilterComboBox.addItems(sorted(model.search_index.store_rows))
+
+    window.resultsSearchInput.clear()
+    window.priceFromSpinBox.setValue(0)
+    window.priceToSpinBox.setValue(0)
+    window.deliveryDaysFilterSpinBox.setValue(0)
+
+    for name in _FILTER_WIDGETS:
+        getattr(window, name).blockSignals(False)
+
+
+def applyResultsFilter(window: QtWidgets) -> None:
+    """Применяет поиск и фильтры страницы результатов к модели resultsTable.
+
+    Условия собираются из виджетов страницы результатов. Нулевое значение спинбокса
+    означает отсутствие ограничения. Отбор выполняется по предварительно построенному
+    индексу (ResultsIndex), без обхода ячеек таблицы.
+
+    Args:
+        window (QtWidgets.QWidget): Главное окно приложения с виджетами страницы результатов.
+
+    Side effects:
+        - Изменяет видимые строки resultsTable
+        - Выводит количество найденных строк и время поиска в statusLabel
+    """
+    model = _resultsModel(window)
+
+    if model is None:
+        return
+
+    started_at = time.perf_counter()
+
+    brand = window.brandFilterComboBox.currentText()
+    store = window.storeFilterComboBox.currentText()
+
+    mask = model.search_index.query(
+        text=window.resultsSearchInput.text(),
+        brand='' if brand == ALL_BRANDS else brand,
+        store='' if store == ALL_STORES else store,
+        price_from=window.priceFromSpinBox.value() or None,
+        price_to=window.priceToSpinBox.value() or None,
+        max_delivery_days=window.deliveryDaysFilterSpinBox.value() or None
+    )
+    model.applyFilter(mask)
+
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+    window.statusLabel.setText(
+        f'Найдено {model.visibleRowCount()} из {model.search_index.row_count} строк ({elapsed_ms:.0f} мс)'
+    )
+
+
+def resetResultsFilter(window: QtWidgets) -> None:
+    """Сбрасывает поиск и все фильтры страницы результатов и показывает все строки.
+
+    Args:
+        window (QtWidgets.QWidget): Главное окно приложения с виджетами страницы результатов.
+    """
+    for name in _FILTER_WIDGETS:
+        getattr(window, name).blockSignals(True)
+
+    window.resultsSearchInput.clear()
+    window.brandFilterComboBox.setCurrentIndex(0)
+    window.storeFilterComboBox.setCurrentIndex(0)
+    window.priceFromSpinBox.setValue(0)
+    window.priceToSpinBox.setValue(0)
+    window.deliveryDaysFilterSpinBox.setValue(0)
+
+    for name in _FILTER_WIDGETS:
+        getattr(window, name).blockSignals(False)
+
+    applyResultsFilter(window)
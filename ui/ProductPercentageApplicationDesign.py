@@ -88,7 +88,7 @@ class Ui_MainWindow(object):
 "    color: #000;\n"
 "}\n"
 "\n"
-"QTableWidget {\n"
+"QTableView {\n"
 "    font-size: 14px;\n"
 "}\n"
 "\n"
@@ -100,7 +100,7 @@ class Ui_MainWindow(object):
 "    padding: 6px;\n"
 "}\n"
 "\n"
-"QTableWidget::item {\n"
+"QTableView::item {\n"
 "    padding-left: 6px;\n"
 "    border: 1px solid #607ebc;\n"
 "}\n"
@@ -354,8 +354,14 @@ class Ui_MainWindow(object):
         self.stackedWidget.addWidget(self.brandsPage)
         self.blackListPage = QtWidgets.QWidget()
         self.blackListPage.setObjectName("blackListPage")
-        self.blackListTable = QtWidgets.QTableWidget(parent=self.blackListPage)
-        self.blackListTable.setGeometry(QtCore.QRect(0, 100, 550, 330))
+        self.blackListSearchInput = QtWidgets.QLineEdit(parent=self.blackListPage)
+        self.blackListSearchInput.setGeometry(QtCore.QRect(0, 80, 550, 36))
+        font = QtGui.QFont()
+        font.setPointSize(-1)
+        self.blackListSearchInput.setFont(font)
+        self.blackListSearchInput.setObjectName("blackListSearchInput")
+        self.blackListTable = QtWidgets.QTableView(parent=self.blackListPage)
+        self.blackListTable.setGeometry(QtCore.QRect(0, 125, 550, 305))
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.MinimumExpanding, QtWidgets.QSizePolicy.Policy.MinimumExpanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -365,13 +371,8 @@ class Ui_MainWindow(object):
         font.setPointSize(-1)
         self.blackListTable.setFont(font)
         self.blackListTable.setGridStyle(QtCore.Qt.PenStyle.SolidLine)
+        self.blackListTable.setSortingEnabled(False)
         self.blackListTable.setObjectName("blackListTable")
-        self.blackListTable.setColumnCount(2)
-        self.blackListTable.setRowCount(0)
-        item = QtWidgets.QTableWidgetItem()
-        self.blackListTable.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.blackListTable.setHorizontalHeaderItem(1, item)
         self.blackListTable.horizontalHeader().setDefaultSectionSize(250)
         self.blackListTable.horizontalHeader().setSortIndicatorShown(False)
         self.blackListTable.verticalHeader().setVisible(False)
@@ -448,8 +449,14 @@ class Ui_MainWindow(object):
         self.deleteWhiteListTableRowButton.setFont(font)
         self.deleteWhiteListTableRowButton.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
         self.deleteWhiteListTableRowButton.setObjectName("deleteWhiteListTableRowButton")
-        self.whiteListTable = QtWidgets.QTableWidget(parent=self.whiteListPage)
-        self.whiteListTable.setGeometry(QtCore.QRect(0, 100, 550, 330))
+        self.whiteListSearchInput = QtWidgets.QLineEdit(parent=self.whiteListPage)
+        self.whiteListSearchInput.setGeometry(QtCore.QRect(0, 80, 550, 36))
+        font = QtGui.QFont()
+        font.setPointSize(-1)
+        self.whiteListSearchInput.setFont(font)
+        self.whiteListSearchInput.setObjectName("whiteListSearchInput")
+        self.whiteListTable = QtWidgets.QTableView(parent=self.whiteListPage)
+        self.whiteListTable.setGeometry(QtCore.QRect(0, 125, 550, 305))
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.MinimumExpanding, QtWidgets.QSizePolicy.Policy.MinimumExpanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -459,13 +466,8 @@ class Ui_MainWindow(object):
         font.setPointSize(-1)
         self.whiteListTable.setFont(font)
         self.whiteListTable.setGridStyle(QtCore.Qt.PenStyle.SolidLine)
+        self.whiteListTable.setSortingEnabled(False)
         self.whiteListTable.setObjectName("whiteListTable")
-        self.whiteListTable.setColumnCount(2)
-        self.whiteListTable.setRowCount(0)
-        item = QtWidgets.QTableWidgetItem()
-        self.whiteListTable.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.whiteListTable.setHorizontalHeaderItem(1, item)
         self.whiteListTable.horizontalHeader().setDefaultSectionSize(250)
         self.whiteListTable.horizontalHeader().setSortIndicatorShown(False)
         self.whiteListTable.verticalHeader().setVisible(False)
@@ -589,6 +591,103 @@ class Ui_MainWindow(object):
         font.setWeight(75)
         self.timeDelayLabel.setFont(font)
         self.timeDelayLabel.setObjectName("timeDelayLabel")
+        self.logLevelLabel = QtWidgets.QLabel(parent=self.settingsPage)
+        self.logLevelLabel.setGeometry(QtCore.QRect(0, 280, 260, 20))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.logLevelLabel.setFont(font)
+        self.logLevelLabel.setObjectName("logLevelLabel")
+        self.logLevelComboBox = QtWidgets.QComboBox(parent=self.settingsPage)
+        self.logLevelComboBox.setGeometry(QtCore.QRect(280, 278, 120, 24))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.logLevelComboBox.setFont(font)
+        self.logLevelComboBox.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.logLevelComboBox.addItem("")
+        self.logLevelComboBox.addItem("")
+        self.logLevelComboBox.addItem("")
+        self.logLevelComboBox.addItem("")
+        self.logLevelComboBox.setObjectName("logLevelComboBox")
+        self.exportFormatLabel = QtWidgets.QLabel(parent=self.settingsPage)
+        self.exportFormatLabel.setGeometry(QtCore.QRect(0, 330, 260, 20))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.exportFormatLabel.setFont(font)
+        self.exportFormatLabel.setObjectName("exportFormatLabel")
+        self.exportFormatComboBox = QtWidgets.QComboBox(parent=self.settingsPage)
+        self.exportFormatComboBox.setGeometry(QtCore.QRect(280, 328, 200, 24))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.exportFormatComboBox.setFont(font)
+        self.exportFormatComboBox.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.exportFormatComboBox.addItem("")
+        self.exportFormatComboBox.addItem("")
+        self.exportFormatComboBox.addItem("")
+        self.exportFormatComboBox.addItem("")
+        self.exportFormatComboBox.setObjectName("exportFormatComboBox")
+        self.streamExportCheckBox = QtWidgets.QCheckBox(parent=self.settingsPage)
+        self.streamExportCheckBox.setGeometry(QtCore.QRect(0, 375, 550, 20))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.streamExportCheckBox.setFont(font)
+        self.streamExportCheckBox.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.streamExportCheckBox.setObjectName("streamExportCheckBox")
+        self.exportSplitLabel = QtWidgets.QLabel(parent=self.settingsPage)
+        self.exportSplitLabel.setGeometry(QtCore.QRect(0, 420, 260, 20))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.exportSplitLabel.setFont(font)
+        self.exportSplitLabel.setObjectName("exportSplitLabel")
+        self.exportSplitComboBox = QtWidgets.QComboBox(parent=self.settingsPage)
+        self.exportSplitComboBox.setGeometry(QtCore.QRect(280, 418, 200, 24))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.exportSplitComboBox.setFont(font)
+        self.exportSplitComboBox.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.exportSplitComboBox.addItem("")
+        self.exportSplitComboBox.addItem("")
+        self.exportSplitComboBox.setObjectName("exportSplitComboBox")
+        self.diffThresholdLabel = QtWidgets.QLabel(parent=self.settingsPage)
+        self.diffThresholdLabel.setGeometry(QtCore.QRect(0, 465, 260, 20))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.diffThresholdLabel.setFont(font)
+        self.diffThresholdLabel.setObjectName("diffThresholdLabel")
+        self.diffThresholdSpinBox = QtWidgets.QSpinBox(parent=self.settingsPage)
+        self.diffThresholdSpinBox.setGeometry(QtCore.QRect(280, 463, 70, 22))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.diffThresholdSpinBox.setFont(font)
+        self.diffThresholdSpinBox.setMinimum(0)
+        self.diffThresholdSpinBox.setMaximum(100)
+        self.diffThresholdSpinBox.setObjectName("diffThresholdSpinBox")
         self.clearStandardSavePathButton = QtWidgets.QPushButton(parent=self.settingsPage)
         self.clearStandardSavePathButton.setGeometry(QtCore.QRect(451, 120, 110, 50))
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.MinimumExpanding, QtWidgets.QSizePolicy.Policy.Maximum)
@@ -608,7 +707,7 @@ class Ui_MainWindow(object):
         self.resultPage = QtWidgets.QWidget()
         self.resultPage.setObjectName("resultPage")
         self.headingLabel_6 = QtWidgets.QLabel(parent=self.resultPage)
-        self.headingLabel_6.setGeometry(QtCore.QRect(0, 30, 550, 40))
+        self.headingLabel_6.setGeometry(QtCore.QRect(0, 30, 420, 40))
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -621,8 +720,104 @@ class Ui_MainWindow(object):
         font.setWeight(75)
         self.headingLabel_6.setFont(font)
         self.headingLabel_6.setObjectName("headingLabel_6")
-        self.resultsTable = QtWidgets.QTableWidget(parent=self.resultPage)
-        self.resultsTable.setGeometry(QtCore.QRect(0, 100, 550, 380))
+        self.compareRunsButton = QtWidgets.QPushButton(parent=self.resultPage)
+        self.compareRunsButton.setGeometry(QtCore.QRect(430, 34, 120, 32))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.compareRunsButton.setFont(font)
+        self.compareRunsButton.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.compareRunsButton.setObjectName("compareRunsButton")
+        self.resultsSearchInput = QtWidgets.QLineEdit(parent=self.resultPage)
+        self.resultsSearchInput.setGeometry(QtCore.QRect(0, 80, 250, 36))
+        font = QtGui.QFont()
+        font.setPointSize(-1)
+        self.resultsSearchInput.setFont(font)
+        self.resultsSearchInput.setObjectName("resultsSearchInput")
+        self.brandFilterComboBox = QtWidgets.QComboBox(parent=self.resultPage)
+        self.brandFilterComboBox.setGeometry(QtCore.QRect(260, 80, 140, 36))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.brandFilterComboBox.setFont(font)
+        self.brandFilterComboBox.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.brandFilterComboBox.setObjectName("brandFilterComboBox")
+        self.storeFilterComboBox = QtWidgets.QComboBox(parent=self.resultPage)
+        self.storeFilterComboBox.setGeometry(QtCore.QRect(410, 80, 140, 36))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.storeFilterComboBox.setFont(font)
+        self.storeFilterComboBox.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.storeFilterComboBox.setObjectName("storeFilterComboBox")
+        self.priceFilterLabel = QtWidgets.QLabel(parent=self.resultPage)
+        self.priceFilterLabel.setGeometry(QtCore.QRect(0, 128, 45, 22))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.priceFilterLabel.setFont(font)
+        self.priceFilterLabel.setObjectName("priceFilterLabel")
+        self.priceFromSpinBox = QtWidgets.QSpinBox(parent=self.resultPage)
+        self.priceFromSpinBox.setGeometry(QtCore.QRect(45, 128, 90, 22))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.priceFromSpinBox.setFont(font)
+        self.priceFromSpinBox.setMaximum(99999999)
+        self.priceFromSpinBox.setSingleStep(100)
+        self.priceFromSpinBox.setObjectName("priceFromSpinBox")
+        self.priceToSpinBox = QtWidgets.QSpinBox(parent=self.resultPage)
+        self.priceToSpinBox.setGeometry(QtCore.QRect(145, 128, 90, 22))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.priceToSpinBox.setFont(font)
+        self.priceToSpinBox.setMaximum(99999999)
+        self.priceToSpinBox.setSingleStep(100)
+        self.priceToSpinBox.setObjectName("priceToSpinBox")
+        self.deliveryDaysFilterLabel = QtWidgets.QLabel(parent=self.resultPage)
+        self.deliveryDaysFilterLabel.setGeometry(QtCore.QRect(250, 128, 90, 22))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.deliveryDaysFilterLabel.setFont(font)
+        self.deliveryDaysFilterLabel.setObjectName("deliveryDaysFilterLabel")
+        self.deliveryDaysFilterSpinBox = QtWidgets.QSpinBox(parent=self.resultPage)
+        self.deliveryDaysFilterSpinBox.setGeometry(QtCore.QRect(340, 128, 70, 22))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.deliveryDaysFilterSpinBox.setFont(font)
+        self.deliveryDaysFilterSpinBox.setMaximum(365)
+        self.deliveryDaysFilterSpinBox.setObjectName("deliveryDaysFilterSpinBox")
+        self.resetResultsFilterButton = QtWidgets.QPushButton(parent=self.resultPage)
+        self.resetResultsFilterButton.setGeometry(QtCore.QRect(430, 122, 120, 36))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.resetResultsFilterButton.setFont(font)
+        self.resetResultsFilterButton.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.resetResultsFilterButton.setObjectName("resetResultsFilterButton")
+        self.resultsTable = QtWidgets.QTableView(parent=self.resultPage)
+        self.resultsTable.setGeometry(QtCore.QRect(0, 170, 550, 225))
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.MinimumExpanding, QtWidgets.QSizePolicy.Policy.MinimumExpanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -632,13 +827,66 @@ class Ui_MainWindow(object):
         font.setPointSize(-1)
         self.resultsTable.setFont(font)
         self.resultsTable.setGridStyle(QtCore.Qt.PenStyle.SolidLine)
+        self.resultsTable.setSortingEnabled(True)
         self.resultsTable.setObjectName("resultsTable")
-        self.resultsTable.setColumnCount(0)
-        self.resultsTable.setRowCount(0)
         self.resultsTable.horizontalHeader().setDefaultSectionSize(250)
-        self.resultsTable.horizontalHeader().setSortIndicatorShown(False)
+        self.resultsTable.horizontalHeader().setSortIndicatorShown(True)
         self.resultsTable.verticalHeader().setVisible(False)
         self.resultsTable.verticalHeader().setDefaultSectionSize(40)
+        self.exportErrorsButton = QtWidgets.QPushButton(parent=self.resultPage)
+        self.exportErrorsButton.setEnabled(False)
+        self.exportErrorsButton.setGeometry(QtCore.QRect(0, 400, 150, 34))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.exportErrorsButton.setFont(font)
+        self.exportErrorsButton.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.exportErrorsButton.setObjectName("exportErrorsButton")
+        self.retryErrorsButton = QtWidgets.QPushButton(parent=self.resultPage)
+        self.retryErrorsButton.setEnabled(False)
+        self.retryErrorsButton.setGeometry(QtCore.QRect(160, 400, 210, 34))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.retryErrorsButton.setFont(font)
+        self.retryErrorsButton.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.retryErrorsButton.setObjectName("retryErrorsButton")
+        self.runHistoryComboBox = QtWidgets.QComboBox(parent=self.resultPage)
+        self.runHistoryComboBox.setGeometry(QtCore.QRect(380, 400, 170, 34))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.runHistoryComboBox.setFont(font)
+        self.runHistoryComboBox.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.runHistoryComboBox.setObjectName("runHistoryComboBox")
+        self.runSummaryLabel = QtWidgets.QLabel(parent=self.resultPage)
+        self.runSummaryLabel.setGeometry(QtCore.QRect(0, 440, 550, 34))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.runSummaryLabel.setFont(font)
+        self.runSummaryLabel.setWordWrap(True)
+        self.runSummaryLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading | QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop)
+        self.runSummaryLabel.setObjectName("runSummaryLabel")
+        self.exportProgressBar = QtWidgets.QProgressBar(parent=self.resultPage)
+        self.exportProgressBar.setGeometry(QtCore.QRect(0, 476, 550, 18))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(8)
+        font.setBold(True)
+        font.setWeight(75)
+        self.exportProgressBar.setFont(font)
+        self.exportProgressBar.setProperty("value", 0)
+        self.exportProgressBar.setTextVisible(True)
+        self.exportProgressBar.setObjectName("exportProgressBar")
         self.exportResultsButton = QtWidgets.QPushButton(parent=self.resultPage)
         self.exportResultsButton.setEnabled(True)
         self.exportResultsButton.setGeometry(QtCore.QRect(0, 500, 200, 40))
@@ -661,6 +909,16 @@ class Ui_MainWindow(object):
         self.exportResultsAsButton.setFont(font)
         self.exportResultsAsButton.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
         self.exportResultsAsButton.setObjectName("exportResultsAsButton")
+        self.cancelExportButton = QtWidgets.QPushButton(parent=self.resultPage)
+        self.cancelExportButton.setGeometry(QtCore.QRect(430, 500, 120, 40))
+        font = QtGui.QFont()
+        font.setFamily("assets/fonts/Montserrat-Bold.ttf")
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.cancelExportButton.setFont(font)
+        self.cancelExportButton.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.cancelExportButton.setObjectName("cancelExportButton")
         self.stackedWidget.addWidget(self.resultPage)
         self.rightSideContainer = QtWidgets.QWidget(parent=self.centralwidget)
         self.rightSideContainer.setGeometry(QtCore.QRect(600, 10, 180, 540))
@@ -824,22 +1082,14 @@ class Ui_MainWindow(object):
         item.setText(_translate("MainWindow", "Бренд на сайте"))
         self.addTableRowButton.setText(_translate("MainWindow", "Добавить запись"))
         self.deleteTableRowButton.setText(_translate("MainWindow", "Удалить запись"))
-        self.blackListTable.setSortingEnabled(False)
-        item = self.blackListTable.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "Бренд"))
-        item = self.blackListTable.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Магазин"))
+        self.blackListSearchInput.setPlaceholderText(_translate("MainWindow", "Поиск по бренду или магазину"))
         self.addBlackListTableRowButton.setText(_translate("MainWindow", "Добавить запись"))
         self.headingLabel_3.setText(_translate("MainWindow", "Черный список поставщиков"))
         self.deleteBlackListTableRowButton.setText(_translate("MainWindow", "Удалить запись"))
         self.importBlackListButton.setText(_translate("MainWindow", "Импортировать список"))
         self.exportBlackListButton.setText(_translate("MainWindow", "Экспортировать список"))
         self.deleteWhiteListTableRowButton.setText(_translate("MainWindow", "Удалить запись"))
-        self.whiteListTable.setSortingEnabled(False)
-        item = self.whiteListTable.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "Бренд"))
-        item = self.whiteListTable.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Магазин"))
+        self.whiteListSearchInput.setPlaceholderText(_translate("MainWindow", "Поиск по бренду или магазину"))
         self.importWhiteListButton.setText(_translate("MainWindow", "Импортировать список"))
         self.headingLabel_4.setText(_translate("MainWindow", "Белый список поставщиков"))
         self.exportWhiteListButton.setText(_translate("MainWindow", "Экспортировать список"))
@@ -849,11 +1099,44 @@ class Ui_MainWindow(object):
         self.chooseStandartSavePathLabel.setText(_translate("MainWindow", "Задать путь сохранения результатов по умолчанию:"))
         self.unitTimeLabel.setText(_translate("MainWindow", "секунд (-ы)"))
         self.timeDelayLabel.setText(_translate("MainWindow", "Время задержки между запросами"))
+        self.logLevelLabel.setText(_translate("MainWindow", "Уровень логирования"))
+        self.logLevelComboBox.setItemText(0, _translate("MainWindow", "DEBUG"))
+        self.logLevelComboBox.setItemText(1, _translate("MainWindow", "INFO"))
+        self.logLevelComboBox.setItemText(2, _translate("MainWindow", "WARNING"))
+        self.logLevelComboBox.setItemText(3, _translate("MainWindow", "ERROR"))
+        self.exportFormatLabel.setText(_translate("MainWindow", "Формат файла результатов"))
+        self.exportFormatComboBox.setItemText(0, _translate("MainWindow", "Excel (*.xlsx)"))
+        self.exportFormatComboBox.setItemText(1, _translate("MainWindow", "CSV (*.csv)"))
+        self.exportFormatComboBox.setItemText(2, _translate("MainWindow", "Parquet (*.parquet)"))
+        self.exportFormatComboBox.setItemText(3, _translate("MainWindow", "JSON Lines (*.jsonl)"))
+        self.streamExportCheckBox.setToolTip(_translate("MainWindow", "Строки сразу дописываются в файл быстрого экспорта (CSV, JSONL или Excel).\nПри сбое в CSV/JSONL остаются все обработанные артикулы"))
+        self.streamExportCheckBox.setText(_translate("MainWindow", "Записывать результаты в файл во время парсинга"))
+        self.exportSplitLabel.setToolTip(_translate("MainWindow", "Большой результат разбивается на листы и файлы с листом «Содержание».\nПо брендам - отдельный лист для каждого бренда"))
+        self.exportSplitLabel.setText(_translate("MainWindow", "Разбиение Excel на листы"))
+        self.exportSplitComboBox.setItemText(0, _translate("MainWindow", "По размеру"))
+        self.exportSplitComboBox.setItemText(1, _translate("MainWindow", "По брендам"))
+        self.diffThresholdLabel.setToolTip(_translate("MainWindow", "Сравнение запусков: изменение цены меньше порога не попадает в выгрузку изменений.\n0 - учитывать любое изменение"))
+        self.diffThresholdLabel.setText(_translate("MainWindow", "Порог изменения цены, %"))
         self.clearStandardSavePathButton.setText(_translate("MainWindow", "Сбросить"))
         self.headingLabel_6.setText(_translate("MainWindow", "Результаты парсинга"))
-        self.resultsTable.setSortingEnabled(False)
+        self.compareRunsButton.setToolTip(_translate("MainWindow", "Сравнить текущие результаты с одним из прошлых запусков"))
+        self.compareRunsButton.setText(_translate("MainWindow", "Сравнить"))
+        self.resultsSearchInput.setPlaceholderText(_translate("MainWindow", "Поиск по артикулу или бренду"))
+        self.priceFilterLabel.setText(_translate("MainWindow", "Цена"))
+        self.priceFromSpinBox.setSpecialValueText(_translate("MainWindow", "от"))
+        self.priceToSpinBox.setSpecialValueText(_translate("MainWindow", "до"))
+        self.deliveryDaysFilterLabel.setText(_translate("MainWindow", "Доставка до"))
+        self.deliveryDaysFilterSpinBox.setSpecialValueText(_translate("MainWindow", "—"))
+        self.resetResultsFilterButton.setText(_translate("MainWindow", "Сбросить"))
+        self.exportErrorsButton.setToolTip(_translate("MainWindow", "Сохранить ошибочные артикулы с причиной ошибки и количеством попыток"))
+        self.exportErrorsButton.setText(_translate("MainWindow", "Экспорт ошибок"))
+        self.retryErrorsButton.setToolTip(_translate("MainWindow", "Повторить парсинг только ошибочных артикулов и добавить их к результатам"))
+        self.retryErrorsButton.setText(_translate("MainWindow", "Повторить ошибочные"))
+        self.runHistoryComboBox.setToolTip(_translate("MainWindow", "Открыть результаты одного из прошлых запусков"))
         self.exportResultsButton.setText(_translate("MainWindow", "Экспортировать"))
         self.exportResultsAsButton.setText(_translate("MainWindow", "Экспортировать как..."))
+        self.cancelExportButton.setToolTip(_translate("MainWindow", "Отменить экспорт"))
+        self.cancelExportButton.setText(_translate("MainWindow", "Отменить"))
         self.parserPageButton.setText(_translate("MainWindow", "Парсинг"))
         self.brandsPageButton.setText(_translate("MainWindow", "Замена брендов"))
         self.blackListPageButton.setText(_translate("MainWindow", "Черный список"))